@@ -117,7 +117,7 @@ class MarkdownGenerator(BaseGenerator):
         Returns:
             ValidationResult indicating whether the file is valid markdown
         """
-        from ...validators.text_validator import MarkdownValidator
+        from ...validators.text.markdown_validator import MarkdownValidator
 
         return MarkdownValidator.validate(file_path)
 
@@ -108,7 +108,7 @@ class ShGenerator(BaseGenerator):
         Returns:
             ValidationResult indicating whether the file is valid
         """
-        from ...validators.text_validator import ShellScriptValidator
+        from ...validators.text.shell_validator import ShellScriptValidator
 
         return ShellScriptValidator.validate(file_path)
 
@@ -1,54 +1,40 @@
 """Utility functions for file operations."""
 
+import codecs
+import fnmatch
+import functools
 import hashlib
 import mimetypes
+import mmap
 import os
 import re
 import shutil
 import tempfile
+import threading
 import unicodedata
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+# Files larger than this are hashed from a memory mapping instead of chunked reads
+_MMAP_HASH_THRESHOLD = 1 << 20
 
-def get_file_extension(filename: str) -> str:
-    """Get the lowercase file extension without the dot.
-
-    Args:
-        filename: The filename or path
-
-    Returns:
-        The file extension in lowercase, or an empty string if no extension
-    """
-    return Path(filename).suffix.lstrip(".").lower()
+# Units used by _format_size, one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
+# Characters kept as-is by sanitize_filename, and the whitespace runs it collapses
+_FILENAME_CHAR_RE = re.compile(r"[\w\s-]")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
 
-def get_mime_type(file_path: Union[str, Path]) -> Tuple[Optional[str], Optional[str]]:
-    """Get the MIME type of a file.
+# Wildcard characters that make a glob pattern more than a literal string
+_GLOB_MAGIC_RE = re.compile(r"[*?\[]")
 
-    Args:
-        file_path: Path to the file
+# Per-thread scratch buffer reused by is_binary_file for its content probe
+_BIN_PROBE_BUF = threading.local()
 
-    Returns:
-        A tuple of (mime_type, encoding)
-    """
-    return mimetypes.guess_type(str(file_path))
-
-
-def is_binary_file(file_path: Union[str, Path], chunk_size: int = 1024) -> bool:
-    """Check if a file is binary.
-
-    Args:
-        file_path: Path to the file
-        chunk_size: Number of bytes to read for checking
-
-    Returns:
-        True if the file appears to be binary, False otherwise
-    """
-    file_path = Path(file_path)
-
-    # Common binary file extensions (faster than reading content)
-    binary_extensions = {
+# Common binary file extensions (faster than reading content)
+_BINARY_EXTENSIONS = frozenset(
+    {
         # Images
         *"jpg jpeg png gif bmp tiff webp ico psd svg".split(),
         # Archives
@@ -94,27 +80,87 @@ def is_binary_file(file_path: Union[str, Path], chunk_size: int = 1024) -> bool:
         "msm",
         "msp",
     }
+)
+
+
+def get_file_extension(filename: Union[str, Path]) -> str:
+    """Get the lowercase file extension without the dot.
+
+    Args:
+        filename: The filename or path
+
+    Returns:
+        The file extension in lowercase, or an empty string if no extension
+    """
+    return os.path.splitext(os.fspath(filename))[1][1:].lower()
+
+
+def get_mime_type(file_path: Union[str, Path]) -> Tuple[Optional[str], Optional[str]]:
+    """Get the MIME type of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        A tuple of (mime_type, encoding)
+    """
+    # Only the last two suffixes (type plus optional encoding) affect the
+    # guess, so key the cache on those to share hits across file names
+    root, ext = os.path.splitext(os.path.basename(os.fspath(file_path)))
+    return _guess_type_cached(os.path.splitext(root)[1] + ext)
+
+
+@functools.lru_cache(maxsize=2048)
+def _guess_type_cached(suffixes: str) -> Tuple[Optional[str], Optional[str]]:
+    """Memoized mimetypes.guess_type lookup for a suffix string like '.tar.gz'.
+
+    Types registered with mimetypes.add_type() after a suffix has been looked
+    up are not seen until _guess_type_cached.cache_clear() is called.
+    """
+    return mimetypes.guess_type("file" + suffixes)
+
+
+def is_binary_file(file_path: Union[str, Path], chunk_size: int = 1024) -> bool:
+    """Check if a file is binary.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Number of bytes to read for checking
+
+    Returns:
+        True if the file appears to be binary, False otherwise
+    """
+    file_path = Path(file_path)
 
     ext = get_file_extension(file_path)
-    if ext in binary_extensions:
+    if ext in _BINARY_EXTENSIONS:
         return True
 
+    # Reuse this thread's probe buffer instead of allocating a chunk per call
+    buf = getattr(_BIN_PROBE_BUF, "buf", None)
+    if buf is None or len(buf) < chunk_size:
+        buf = _BIN_PROBE_BUF.buf = bytearray(max(chunk_size, 4096))
+
     # For files without extensions or with unknown extensions, check the content
     try:
-        with open(file_path, "rb") as f:
-            chunk = f.read(chunk_size)
-            # Check for null bytes which typically indicate a binary file
-            if b"\x00" in chunk:
-                return True
+        with open(file_path, "rb", buffering=0) as f:
+            with memoryview(buf)[:chunk_size] as target:
+                n = f.readinto(target)
+    except (IOError, OSError):
+        return False
 
-            # Try to decode as text
-            try:
-                chunk.decode("utf-8")
-            except UnicodeDecodeError:
-                return True
+    # Check for null bytes which typically indicate a binary file. find() is a
+    # memchr over the buffer, so this stays cheap even for large probe windows
+    if buf.find(b"\x00", 0, n) != -1:
+        return True
 
-    except (IOError, OSError):
-        pass
+    # Try to decode as text. When the window was filled, a multi-byte character
+    # may be cut at its end, so only a truncated sequence at EOF counts as binary
+    with memoryview(buf)[:n] as chunk:
+        try:
+            codecs.utf_8_decode(chunk, "strict", n < chunk_size)
+        except UnicodeDecodeError:
+            return True
 
     return False
 
@@ -138,6 +184,18 @@ def get_file_hash(
     hasher = hashlib.new(algorithm)
 
     with open(file_path, "rb") as f:
+        # Hash large files straight from the page cache in a single update call
+        if os.name == "posix" and os.fstat(f.fileno()).st_size > _MMAP_HASH_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+            except (OSError, ValueError, OverflowError):
+                mm = None  # Cannot be mapped, fall back to chunked reads
+
+            if mm is not None:
+                with mm:
+                    hasher.update(mm)
+                return hasher.hexdigest()
+
         for chunk in iter(lambda: f.read(chunk_size), b""):
             hasher.update(chunk)
 
@@ -193,12 +251,22 @@ def safe_remove(path: Union[str, Path]) -> bool:
     Returns:
         True if the file/directory was removed, False otherwise
     """
+    # Try the common case first and let the error tell us what the path is,
+    # rather than stat-ing it up front
+    try:
+        os.unlink(path)
+        return True
+    except IsADirectoryError:
+        pass
+    except PermissionError:
+        # Some platforms report EPERM instead of EISDIR for directories
+        if not os.path.isdir(path):
+            return False
+    except OSError:
+        return False
+
     try:
-        path = Path(path)
-        if path.is_file() or path.is_symlink():
-            os.unlink(path)
-        elif path.is_dir():
-            shutil.rmtree(path)
+        shutil.rmtree(path)
         return True
     except (OSError, shutil.Error):
         return False
@@ -223,6 +291,7 @@ def copy_file(
     src: Union[str, Path],
     dst: Union[str, Path],
     overwrite: bool = False,
+    preserve_metadata: bool = True,
 ) -> bool:
     """Copy a file from src to dst.
 
@@ -230,6 +299,10 @@ def copy_file(
         src: Source file path
         dst: Destination file path
         overwrite: Whether to overwrite an existing file
+        preserve_metadata: Whether to copy timestamps and permission bits too.
+            When False only the contents are copied, which skips the extra
+            copystat syscalls (the data copy itself stays in the kernel via
+            sendfile on Linux either way)
 
     Returns:
         True if the file was copied successfully, False otherwise
@@ -244,30 +317,41 @@ def copy_file(
         return False
 
     try:
-        shutil.copy2(src, dst)
+        if preserve_metadata:
+            shutil.copy2(src, dst)
+        else:
+            # Mirror copy2, which copies into dst when it is a directory
+            shutil.copyfile(src, dst / src.name if dst.is_dir() else dst)
         return True
     except (IOError, OSError, shutil.Error):
         return False
 
 
-def get_file_info(file_path: Union[str, Path]) -> Dict[str, Any]:
+def get_file_info(
+    file_path: Union[str, Path], check_binary: bool = True
+) -> Dict[str, Any]:
     """Get detailed information about a file.
 
     Args:
         file_path: Path to the file
+        check_binary: Whether to read the start of the file to fill in
+            ``is_binary``. Pass False to skip that read; the key is then left
+            out of the result
 
     Returns:
         Dictionary containing file information
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    try:
+        stat = os.stat(file_path)
+    except (OSError, ValueError):
         return {"exists": False, "path": str(file_path)}
 
-    stat = file_path.stat()
     mime_type, encoding = get_mime_type(file_path)
+    is_file = S_ISREG(stat.st_mode)
 
-    return {
+    info = {
         "exists": True,
         "path": str(file_path.absolute()),
         "name": file_path.name,
@@ -275,9 +359,9 @@ def get_file_info(file_path: Union[str, Path]) -> Dict[str, Any]:
         "suffix": file_path.suffix,
         "suffixes": file_path.suffixes,
         "parent": str(file_path.parent),
-        "is_file": file_path.is_file(),
-        "is_dir": file_path.is_dir(),
-        "is_symlink": file_path.is_symlink(),
+        "is_file": is_file,
+        "is_dir": S_ISDIR(stat.st_mode),
+        "is_symlink": os.path.islink(file_path),
         "size": stat.st_size,
         "size_human": _format_size(stat.st_size),
         "created": stat.st_ctime,
@@ -286,8 +370,10 @@ def get_file_info(file_path: Union[str, Path]) -> Dict[str, Any]:
         "mode": oct(stat.st_mode)[-3:],
         "mime_type": mime_type,
         "encoding": encoding,
-        "is_binary": is_binary_file(file_path) if file_path.is_file() else None,
     }
+    if check_binary:
+        info["is_binary"] = is_binary_file(file_path) if is_file else None
+    return info
 
 
 def _format_size(size: int, decimals: int = 2) -> str:
@@ -300,12 +386,9 @@ def _format_size(size: int, decimals: int = 2) -> str:
     Returns:
         Formatted size string with unit
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024.0:
-            break
-        if unit != "TB":  # Don't divide beyond TB
-            size /= 1024.0
-    return f"{size:.{decimals}f} {unit}"
+    # Each unit is a power of 1024, i.e. ten more bits of magnitude
+    idx = 0 if size < 1024 else min((int(size).bit_length() - 1) // 10, 5)
+    return f"{size / (1 << (idx * 10)):.{decimals}f} {_SIZE_UNITS[idx]}"
 
 
 def find_files(
@@ -336,24 +419,38 @@ def find_files(
         return list(directory.glob(pattern))
     else:
         # Case-insensitive search
-        pattern = pattern.lower()
         matches = []
+        suffix = pattern[1:].lower()
 
-        def _match(p: Path) -> bool:
-            return p.name.lower().endswith(pattern.lstrip("*"))
+        if pattern.startswith("*") and not _GLOB_MAGIC_RE.search(suffix):
+            # Plain "*.ext" style pattern, a suffix comparison is enough
+            def _match(p: Path) -> bool:
+                return p.name.lower().endswith(suffix)
+
+        else:
+            regex = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+            def _match(p: Path) -> bool:
+                return regex.match(p.name) is not None
 
         if recursive:
             for p in directory.rglob("*"):
-                if p.is_file() and _match(p):
+                if _match(p) and p.is_file():
                     matches.append(p)
         else:
             for p in directory.glob("*"):
-                if p.is_file() and _match(p):
+                if _match(p) and p.is_file():
                     matches.append(p)
 
         return matches
 
 
+@functools.lru_cache(maxsize=32)
+def _sanitize_table(replace_with: str) -> Dict[int, str]:
+    """Build the translation table mapping invalid ASCII characters to replace_with."""
+    return {c: replace_with for c in range(128) if not _FILENAME_CHAR_RE.match(chr(c))}
+
+
 def sanitize_filename(filename: str, replace_with: str = "_") -> str:
     """Sanitize a string to be used as a filename.
 
@@ -370,8 +467,8 @@ def sanitize_filename(filename: str, replace_with: str = "_") -> str:
     ascii_str = normalized.encode("ascii", "ignore").decode("ascii")
 
     # Replace invalid characters and whitespace
-    no_special = re.sub(r"[^\w\s-]", replace_with, ascii_str)
-    no_whitespace = re.sub(r"[\s]+", replace_with, no_special)
+    no_special = ascii_str.translate(_sanitize_table(replace_with))
+    no_whitespace = _WHITESPACE_RUN_RE.sub(replace_with, no_special)
     stripped = no_whitespace.strip(replace_with)
 
     # Handle empty result
@@ -1,14 +1,97 @@
 """Utility functions for image operations."""
 
 import base64
+import functools
 import io
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Iterator, Optional, Tuple, Union
 
 from PIL import Image, ImageColor, ImageDraw, ImageFilter, ImageFont
 
 from .file_utils import ensure_directory
 
+# NumPy is optional; it speeds up pixel-wise filters such as sepia
+HAS_NUMPY = False
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    pass
+
+# Sepia tone coefficients, one row per output channel (R, G, B)
+_SEPIA_ROWS = (
+    (0.393, 0.769, 0.189),
+    (0.349, 0.686, 0.168),
+    (0.272, 0.534, 0.131),
+)
+
+# Pixels per block when applying sepia with NumPy; bounds the float32 scratch
+# buffer (12 bytes per pixel) so each block stays cache-resident
+_SEPIA_BLOCK_PIXELS = 1 << 16
+
+
+@functools.lru_cache(maxsize=4096)
+def _line_bbox(
+    font: ImageFont.FreeTypeFont, text: str
+) -> Tuple[float, float, float, float]:
+    """Return font.getbbox(text), memoized per font and line of text."""
+    return font.getbbox(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_length(font: ImageFont.FreeTypeFont, word: str) -> float:
+    """Return font.getlength(word), memoized per font and word."""
+    return font.getlength(word)
+
+
+def _wrap_lines(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    max_width: Optional[int] = None,
+) -> Iterator[str]:
+    """Split text into lines, word-wrapping each one to max_width if given.
+
+    Args:
+        text: Text to split (can contain newlines)
+        font: PIL ImageFont object used to measure words
+        max_width: Maximum line width in pixels, or None to only split on newlines
+
+    Yields:
+        The resulting lines, with blank input lines as empty strings
+    """
+    space_width = _word_length(font, " ") if max_width else 0.0
+
+    for line in text.split("\n"):
+        # Blank lines (checked without building a stripped copy)
+        if not line or line.isspace():
+            yield ""
+            continue
+
+        if not max_width:
+            yield line
+            continue
+
+        # Measure every word once up front, then only add floats while wrapping
+        words = line.split(" ")
+        widths = [_word_length(font, word) for word in words]
+
+        # Simple word wrapping: words[start:i] is the line being built
+        start = 0
+        line_width = widths[0]
+        for i in range(1, len(words)):
+            # Test if adding this word would exceed the max width
+            test_width = line_width + space_width + widths[i]
+            if test_width <= max_width:
+                line_width = test_width
+            else:
+                yield " ".join(words[start:i])
+                start = i
+                line_width = widths[i]
+
+        # Add the last line
+        yield " ".join(words[start:])
+
 
 def create_blank_image(
     width: int = 800, height: int = 600, color: str = "#FFFFFF", mode: str = "RGB"
@@ -25,24 +108,31 @@ def create_blank_image(
         A new PIL Image object
     """
     try:
-        # Try to parse the color
-        bg_color = ImageColor.getrgb(color)
-        # If the mode is RGBA, ensure we have 4 components
-        if mode == "RGBA":
-            if len(bg_color) == 3:  # RGB
-                bg_color = bg_color + (255,)  # Add full opacity
+        # Parse the color into the value Image.new expects for this mode
+        # (adds full opacity for RGBA, luminance for L)
+        bg_color = ImageColor.getcolor(color, mode)
     except (ValueError, AttributeError):
         # Default to white if color parsing fails
-        bg_color = (255, 255, 255) if mode == "RGB" else (255, 255, 255, 255)
+        bg_color = ImageColor.getcolor("white", mode)
 
     return Image.new(mode, (width, height), color=bg_color)
 
 
+@functools.lru_cache(maxsize=1)
+def _default_font() -> ImageFont.ImageFont:
+    """Load PIL's built-in default font once."""
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=64)
 def load_font(
     font_path: Optional[str] = None, font_size: int = 12
 ) -> ImageFont.FreeTypeFont:
     """Load a font with fallback to default system font.
 
+    Fonts are cached by (font_path, font_size), so repeated calls return the
+    same object; callers must not mutate it (e.g. with set_variation_by_name).
+
     Args:
         font_path: Path to a .ttf or .otf font file
         font_size: Font size in points
@@ -64,10 +154,10 @@ def load_font(
                 return ImageFont.truetype("DejaVuSans.ttf", font_size)
             except IOError:
                 # Fall back to default font
-                return ImageFont.load_default()
+                return _default_font()
     except Exception:
         # Last resort
-        return ImageFont.load_default()
+        return _default_font()
 
 
 def get_text_size(
@@ -95,7 +185,7 @@ def get_text_size(
         return get_multiline_text_size(text, font, spacing, max_width)
 
     # Single line of text
-    left, top, right, bottom = font.getbbox(text)
+    left, top, right, bottom = _line_bbox(font, text)
     return (right - left, bottom - top)
 
 
@@ -119,36 +209,8 @@ def get_multiline_text_size(
     if not text:
         return (0, 0)
 
-    # Split text into lines
-    lines = text.split("\n")
-
-    # Process each line, handling word wrapping if max_width is specified
-    processed_lines = []
-    for line in lines:
-        if not line.strip():
-            processed_lines.append("")
-            continue
-
-        if max_width:
-            # Simple word wrapping
-            words = line.split(" ")
-            current_line = []
-
-            for word in words:
-                # Test if adding this word would exceed the max width
-                test_line = " ".join(current_line + [word])
-                if font.getlength(test_line) <= max_width:
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        processed_lines.append(" ".join(current_line))
-                    current_line = [word]
-
-            # Add the last line
-            if current_line:
-                processed_lines.append(" ".join(current_line))
-        else:
-            processed_lines.append(line)
+    # Split text into lines, handling word wrapping if max_width is specified
+    processed_lines = list(_wrap_lines(text, font, max_width))
 
     # Calculate total height and max width
     total_height = 0
@@ -156,7 +218,7 @@ def get_multiline_text_size(
     line_heights = []
 
     for i, line in enumerate(processed_lines):
-        left, top, right, bottom = font.getbbox(line)
+        left, top, right, bottom = _line_bbox(font, line)
         line_width = right - left
         line_height = bottom - top + (spacing if i < len(processed_lines) - 1 else 0)
 
@@ -230,46 +292,20 @@ def draw_text_on_image(
     lines = []
     if "\n" in text or (max_width and font.getlength(text) > max_width):
         # Split text into lines and handle word wrapping
-        lines = []
-        for line in text.split("\n"):
-            if not line.strip():
-                lines.append("")
-                continue
-
-            if max_width:
-                # Simple word wrapping
-                words = line.split(" ")
-                current_line = []
-
-                for word in words:
-                    # Test if adding this word would exceed the max width
-                    test_line = " ".join(current_line + [word])
-                    if font.getlength(test_line) <= max_width:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            lines.append(" ".join(current_line))
-                        current_line = [word]
-
-                # Add the last line
-                if current_line:
-                    lines.append(" ".join(current_line))
-            else:
-                lines.append(line)
+        lines = list(_wrap_lines(text, font, max_width))
     else:
         lines = [text]
 
     # Calculate total text size
+    line_widths = []
     line_heights = []
-    max_line_width = 0
 
     for line in lines:
-        left, top, right, bottom = font.getbbox(line)
-        line_width = right - left
-        line_height = bottom - top
+        left, top, right, bottom = _line_bbox(font, line)
+        line_widths.append(right - left)
+        line_heights.append(bottom - top)
 
-        max_line_width = max(max_line_width, line_width)
-        line_heights.append(line_height)
+    max_line_width = max(line_widths, default=0)
 
     total_height = sum(line_heights) + (len(lines) - 1) * line_spacing
 
@@ -297,31 +333,38 @@ def draw_text_on_image(
 
         # Handle horizontal alignment for each line
         if align == "center":
-            left, top, right, bottom = font.getbbox(line)
-            line_width = right - left
-            line_left = x + (max_line_width - line_width) // 2
+            line_left = x + (max_line_width - line_widths[i]) // 2
         elif align == "right":
-            left, top, right, bottom = font.getbbox(line)
-            line_width = right - left
-            line_left = x + (max_line_width - line_width)
+            line_left = x + (max_line_width - line_widths[i])
 
         # Draw shadow if enabled
         if shadow:
             shadow_pos = (line_left + shadow_offset[0], current_y + shadow_offset[1])
             draw.text(shadow_pos, line, font=font, fill=shadow_color)
 
-        # Draw border if enabled
-        if border and border_width > 0:
-            # Draw text multiple times with offset to create a border effect
-            for x_offset in [-border_width, 0, border_width]:
-                for y_offset in [-border_width, 0, border_width]:
-                    if x_offset == 0 and y_offset == 0:
-                        continue  # Skip the center position for the border
-                    pos = (line_left + x_offset, current_y + y_offset)
-                    draw.text(pos, line, font=font, fill=border_color)
+        # Draw the main text, with a stroked outline if a border is enabled.
+        # Bitmap fonts (the load_default() fallback) ignore stroke_width, so
+        # they keep the offset-draw border.
+        if border and border_width > 0 and isinstance(font, ImageFont.FreeTypeFont):
+            draw.text(
+                (line_left, current_y),
+                line,
+                font=font,
+                fill=color,
+                stroke_width=border_width,
+                stroke_fill=border_color,
+            )
+        else:
+            if border and border_width > 0:
+                # Draw text multiple times with offset to create a border effect
+                for x_offset in [-border_width, 0, border_width]:
+                    for y_offset in [-border_width, 0, border_width]:
+                        if x_offset == 0 and y_offset == 0:
+                            continue  # Skip the center position for the border
+                        pos = (line_left + x_offset, current_y + y_offset)
+                        draw.text(pos, line, font=font, fill=border_color)
 
-        # Draw the main text
-        draw.text((line_left, current_y), line, font=font, fill=color)
+            draw.text((line_left, current_y), line, font=font, fill=color)
 
         # Move to the next line
         current_y += line_height + line_spacing
@@ -446,12 +489,11 @@ def save_image(
 
         if format.upper() == "JPEG":
             if image.mode in ("RGBA", "LA"):
-                # Convert to RGB for JPEG
-                background = Image.new("RGB", image.size, (255, 255, 255))
-                background.paste(
-                    image, mask=image.split()[-1]
-                )  # Paste using alpha channel as mask
-                image = background
+                # Convert to RGB for JPEG, compositing over a white background
+                background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+                image = Image.alpha_composite(
+                    background, image.convert("RGBA")
+                ).convert("RGB")
             save_kwargs.setdefault("quality", quality)
             save_kwargs.setdefault("optimize", True)
             save_kwargs.setdefault("progressive", True)
@@ -489,7 +531,9 @@ def image_to_base64(image: Image.Image, format: str = "PNG", **kwargs) -> str:
     """
     buffered = io.BytesIO()
     image.save(buffered, format=format, **kwargs)
-    return base64.b64encode(buffered.getvalue()).decode("utf-8")
+    # Encode straight from the buffer's memory rather than a bytes copy of it
+    with buffered.getbuffer() as view:
+        return base64.b64encode(view).decode("ascii")
 
 
 def base64_to_image(data: str) -> Optional[Image.Image]:
@@ -536,25 +580,30 @@ def resize_image(
     orig_width, orig_height = image.size
     target_width, target_height = size
 
-    # Calculate new dimensions maintaining aspect ratio
-    width_ratio = target_width / orig_width
-    height_ratio = target_height / orig_height
-
-    if width_ratio < height_ratio:
+    # Calculate new dimensions maintaining aspect ratio (exact integer math)
+    if target_width * orig_height < target_height * orig_width:
         # Fit to width
         new_width = target_width
-        new_height = int(orig_height * width_ratio)
+        new_height = orig_height * target_width // orig_width
     else:
         # Fit to height
         new_height = target_height
-        new_width = int(orig_width * height_ratio)
+        new_width = orig_width * target_height // orig_height
 
     # Resize the image
     resized_image = image.resize((new_width, new_height), resample=resample)
 
     # If the aspect ratio is different, create a new image with the target size and paste
     if new_width != target_width or new_height != target_height:
-        result = create_blank_image(target_width, target_height, bg_color, "RGBA")
+        # Only pay for an alpha channel when the source or the background
+        # has transparency
+        has_alpha = (
+            "A" in image.getbands()
+            or "transparency" in image.info
+            or ImageColor.getcolor(bg_color, "RGBA")[3] < 255
+        )
+        mode = "RGBA" if has_alpha else "RGB"
+        result = create_blank_image(target_width, target_height, bg_color, mode)
         x = (target_width - new_width) // 2
         y = (target_height - new_height) // 2
         result.paste(resized_image, (x, y))
@@ -563,6 +612,43 @@ def resize_image(
     return resized_image
 
 
+# Parameterless filters supported by apply_filter, by name
+_SIMPLE_FILTERS = {
+    "sharpen": ImageFilter.SHARPEN,
+    "edge_enhance": ImageFilter.EDGE_ENHANCE,
+    "emboss": ImageFilter.EMBOSS,
+    "contour": ImageFilter.CONTOUR,
+    "detail": ImageFilter.DETAIL,
+    "smooth": ImageFilter.SMOOTH,
+}
+
+
+def _sepia_numpy(image: Image.Image) -> Image.Image:
+    """Apply the sepia matrix to an RGB image with NumPy, block by block.
+
+    Each block of rows is multiplied, rounded and clipped in one reused
+    float32 buffer, then written straight into the uint8 output, so no
+    full-size float copy of the image is ever allocated.
+    """
+    pixels = np.asarray(image, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    result = np.empty_like(pixels)
+
+    matrix = np.array(_SEPIA_ROWS, dtype=np.float32).T
+    rows = max(1, _SEPIA_BLOCK_PIXELS // max(width, 1))
+    scratch = np.empty((min(rows, height), width, 3), dtype=np.float32)
+
+    for start in range(0, height, rows):
+        block = pixels[start : start + rows]
+        out = scratch[: len(block)]
+        np.matmul(block, matrix, out=out)
+        np.rint(out, out=out)
+        np.clip(out, 0, 255, out=out)
+        result[start : start + len(block)] = out
+
+    return Image.fromarray(result, "RGB")
+
+
 def apply_filter(
     image: Image.Image, filter_name: str, **kwargs
 ) -> Optional[Image.Image]:
@@ -578,28 +664,15 @@ def apply_filter(
     """
     filter_name = filter_name.lower()
 
+    # Filters that take no parameters
+    image_filter = _SIMPLE_FILTERS.get(filter_name)
+    if image_filter is not None:
+        return image.filter(image_filter)
+
     if filter_name == "blur":
         radius = kwargs.get("radius", 2)
         return image.filter(ImageFilter.GaussianBlur(radius))
 
-    elif filter_name == "sharpen":
-        return image.filter(ImageFilter.SHARPEN)
-
-    elif filter_name == "edge_enhance":
-        return image.filter(ImageFilter.EDGE_ENHANCE)
-
-    elif filter_name == "emboss":
-        return image.filter(ImageFilter.EMBOSS)
-
-    elif filter_name == "contour":
-        return image.filter(ImageFilter.CONTOUR)
-
-    elif filter_name == "detail":
-        return image.filter(ImageFilter.DETAIL)
-
-    elif filter_name == "smooth":
-        return image.filter(ImageFilter.SMOOTH)
-
     elif filter_name == "grayscale":
         return image.convert("L")
 
@@ -608,10 +681,12 @@ def apply_filter(
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        # Sepia matrix
-        sepia_matrix = (0.393, 0.769, 0.189, 0.349, 0.686, 0.168, 0.272, 0.534, 0.131)
-        sepia_image = image.convert("RGB", sepia_matrix)
-        return sepia_image
+        if HAS_NUMPY:
+            return _sepia_numpy(image)
+
+        # PIL expects a 12-tuple affine matrix (with an offset per channel)
+        sepia_matrix = tuple(c for row in _SEPIA_ROWS for c in (*row, 0.0))
+        return image.convert("RGB", sepia_matrix)
 
     # Add more filters as needed...
 
@@ -1,10 +1,29 @@
 """Utility functions for text processing."""
 
+import functools
 import random
 import re
+import secrets
 import string
 import textwrap
-from typing import List, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# Patterns compiled once at import instead of on every call
+_RE_WS = re.compile(r"\s+")
+_RE_WORD = re.compile(r"\S+")
+_RE_SLUG_SEP = re.compile(r"[\s_]+")
+_RE_NONWORD = re.compile(r"[^\w\-]")
+_RE_NONWORD_U = re.compile(r"[^\w\-]", re.UNICODE)
+_RE_SENTENCE = re.compile(r"(?<![A-Z][a-z]\.)(?<=\S[.!?])\s+")
+_RE_PARA = re.compile(r"\n\s*\n")
+_RE_HTML = re.compile(r"<[^>]+>")
+# Simple email regex (not 100% RFC compliant but good for most cases)
+_RE_EMAIL = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# Simple URL regex
+_RE_URL = re.compile(r'https?://[^\s\n"]+')
+_RE_SLUG_SAFE = re.compile(r"[\w\-]+", re.ASCII)
+_RE_HASHTAG = re.compile(r"#(\w+)")
+_RE_MENTION = re.compile(r"@(\w+)")
 
 
 def wrap_text(text: str, width: int = 80, **kwargs) -> str:
@@ -43,18 +62,33 @@ def truncate_text(
     if not text or len(text) <= max_length:
         return text
 
+    truncated = text[:max_length]
     if words:
-        # Truncate at word boundary
-        truncated = text[:max_length]
-        if " " in truncated:
-            # Find the last space before max_length
-            last_space = truncated.rfind(" ")
-            if last_space > 0:
-                truncated = truncated[:last_space]
-    else:
-        truncated = text[:max_length]
+        # Truncate at the last space before max_length, if any
+        last_space = truncated.rfind(" ")
+        if last_space > 0:
+            truncated = truncated[:last_space]
+
+    # text is longer than max_length here, so something was always cut off
+    return truncated + ellipsis
+
+
+@functools.lru_cache(maxsize=32)
+def _slug_table(separator: str) -> Dict[int, Optional[str]]:
+    """Build the translation table slugify applies to ASCII text."""
+    table: Dict[int, Optional[str]] = {}
+    for c in range(128):
+        if _RE_SLUG_SEP.match(chr(c)):
+            table[c] = separator
+        elif _RE_NONWORD.match(chr(c)):
+            table[c] = None
+    return table
+
 
-    return truncated + ellipsis if len(truncated) < len(text) else truncated
+@functools.lru_cache(maxsize=32)
+def _slug_collapse_re(separator: str) -> Pattern[str]:
+    """Compile the pattern matching runs of separator characters."""
+    return re.compile(rf"[{re.escape(separator)}]+")
 
 
 def slugify(
@@ -76,24 +110,29 @@ def slugify(
     Returns:
         URL-friendly slug
     """
-    import unicodedata
+    if text.isascii() and _RE_SLUG_SAFE.fullmatch(separator):
+        # ASCII fast path: normalization is a no-op, so a single translate
+        # maps spaces and underscores to the separator and drops the rest
+        text = text.translate(_slug_table(separator))
+    else:
+        import unicodedata
 
-    # Convert to ASCII if requested
-    if ascii_only and not allow_unicode:
-        text = unicodedata.normalize("NFKD", text)
-        text = text.encode("ascii", "ignore").decode("ascii")
+        # Convert to ASCII if requested
+        if ascii_only and not allow_unicode:
+            text = unicodedata.normalize("NFKD", text)
+            text = text.encode("ascii", "ignore").decode("ascii")
 
-    # Replace spaces and underscores with the separator
-    text = re.sub(r"[\s_]+", separator, text)
+        # Replace spaces and underscores with the separator
+        text = _RE_SLUG_SEP.sub(separator, text)
 
-    # Remove all non-word characters (alphanumerics and underscores)
-    if allow_unicode:
-        text = re.sub(r"[^\w\-]", "", text, flags=re.UNICODE)
-    else:
-        text = re.sub(r"[^\w\-]", "", text)
+        # Remove all non-word characters (alphanumerics and underscores)
+        if allow_unicode:
+            text = _RE_NONWORD_U.sub("", text)
+        else:
+            text = _RE_NONWORD.sub("", text)
 
     # Replace multiple separators with a single one
-    text = re.sub(rf"[{re.escape(separator)}]+", separator, text)
+    text = _slug_collapse_re(separator).sub(separator, text)
 
     # Remove leading/trailing separators
     text = text.strip(separator)
@@ -106,18 +145,26 @@ def slugify(
 
 
 def generate_random_string(
-    length: int = 10, chars: str = string.ascii_letters + string.digits
+    length: int = 10,
+    chars: str = string.ascii_letters + string.digits,
+    secure: bool = False,
 ) -> str:
     """Generate a random string of specified length.
 
+    Note: Output for a given random seed differs from versions that drew
+    one character at a time with random.choice.
+
     Args:
         length: Length of the string to generate
         chars: Characters to choose from
+        secure: Use the secrets module (suitable for tokens and passwords)
 
     Returns:
         Random string
     """
-    return "".join(random.choice(chars) for _ in range(length))
+    if secure:
+        return "".join(secrets.choice(chars) for _ in range(length))
+    return "".join(random.choices(chars, k=length))
 
 
 def count_words(text: str) -> int:
@@ -129,10 +176,8 @@ def count_words(text: str) -> int:
     Returns:
         Word count
     """
-    if not text.strip():
-        return 0
-    # Split on any whitespace and filter out empty strings
-    return len([word for word in re.split(r"\s+", text) if word])
+    # Count runs of non-whitespace without building a list of words
+    return sum(1 for _ in _RE_WORD.finditer(text))
 
 
 def count_characters(text: str, include_whitespace: bool = True) -> int:
@@ -146,7 +191,7 @@ def count_characters(text: str, include_whitespace: bool = True) -> int:
         Character count
     """
     if not include_whitespace:
-        text = re.sub(r"\s+", "", text)
+        text = _RE_WS.sub("", text)
     return len(text)
 
 
@@ -162,12 +207,13 @@ def count_sentences(text: str) -> int:
     Returns:
         Sentence count
     """
-    if not text.strip():
+    text = text.strip()
+    if not text:
         return 0
 
-    # Split on sentence terminators, but exclude common abbreviations
-    sentences = re.split(r"(?<![A-Z][a-z]\.)(?<=\S[.!?])\s+", text)
-    return len([s for s in sentences if s.strip()])
+    # Count the breaks after sentence terminators (excluding common
+    # abbreviations); once the text is stripped, each one starts a sentence
+    return 1 + sum(1 for _ in _RE_SENTENCE.finditer(text))
 
 
 def count_paragraphs(text: str) -> int:
@@ -179,11 +225,12 @@ def count_paragraphs(text: str) -> int:
     Returns:
         Paragraph count
     """
-    if not text.strip():
+    text = text.strip()
+    if not text:
         return 0
-    # Split on double newlines and filter out empty paragraphs
-    paragraphs = re.split(r"\n\s*\n", text)
-    return len([p for p in paragraphs if p.strip()])
+    # Count the blank-line breaks; once the text is stripped, each one starts
+    # a non-empty paragraph
+    return 1 + sum(1 for _ in _RE_PARA.finditer(text))
 
 
 def remove_extra_whitespace(text: str) -> str:
@@ -196,7 +243,7 @@ def remove_extra_whitespace(text: str) -> str:
         Text with extra whitespace removed
     """
     # Replace any whitespace (including newlines) with a single space
-    text = re.sub(r"\s+", " ", text)
+    text = _RE_WS.sub(" ", text)
     # Remove leading/trailing whitespace
     return text.strip()
 
@@ -210,7 +257,7 @@ def remove_html_tags(text: str) -> str:
     Returns:
         Text with HTML tags removed
     """
-    return re.sub(r"<[^>]+>", "", text)
+    return _RE_HTML.sub("", text)
 
 
 def extract_emails(text: str) -> List[str]:
@@ -222,9 +269,7 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List of email addresses found
     """
-    # Simple email regex (not 100% RFC compliant but good for most cases)
-    email_regex = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    return re.findall(email_regex, text)
+    return _RE_EMAIL.findall(text)
 
 
 def extract_urls(text: str) -> List[str]:
@@ -236,9 +281,7 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List of URLs found
     """
-    # Simple URL regex
-    url_regex = r'https?://[^\s\n"]+'
-    return re.findall(url_regex, text)
+    return _RE_URL.findall(text)
 
 
 def extract_hashtags(text: str) -> List[str]:
@@ -250,7 +293,7 @@ def extract_hashtags(text: str) -> List[str]:
     Returns:
         List of hashtags (without the # symbol)
     """
-    return re.findall(r"#(\w+)", text)
+    return _RE_HASHTAG.findall(text)
 
 
 def extract_mentions(text: str) -> List[str]:
@@ -262,7 +305,7 @@ def extract_mentions(text: str) -> List[str]:
     Returns:
         List of mentions (without the @ symbol)
     """
-    return re.findall(r"@(\w+)", text)
+    return _RE_MENTION.findall(text)
 
 
 def generate_lorem_ipsum(
@@ -368,20 +411,22 @@ def generate_lorem_ipsum(
 
     # Generate remaining paragraphs
     for _ in range(paragraphs):
+        # Random number of words for each sentence, drawn in one batch
+        lengths = [
+            random.randint(*words_per_sentence) for _ in range(sentences_per_paragraph)
+        ]
+        words = random.choices(lorem_words, k=sum(lengths))
+
         paragraph = []
-        for _ in range(sentences_per_paragraph):
-            # Random number of words for this sentence
-            word_count = random.randint(*words_per_sentence)
-            # Select random words
-            sentence_words = random.sample(
-                lorem_words, min(word_count, len(lorem_words))
-            )
+        start = 0
+        for word_count in lengths:
+            end = start + word_count
             # Capitalize first word
-            if sentence_words:
-                sentence_words[0] = sentence_words[0].capitalize()
+            if word_count:
+                words[start] = words[start].capitalize()
             # Add period
-            sentence = " ".join(sentence_words) + "."
-            paragraph.append(sentence)
+            paragraph.append(" ".join(words[start:end]) + ".")
+            start = end
 
         result.append(" ".join(paragraph))
 
@@ -1,57 +1,77 @@
 """Validators for different file formats."""
 
-from .archive_validator import (
-    ArchiveValidator,
-    Bzip2Validator,
-    GzipValidator,
-    TarBz2Validator,
-    TarGzValidator,
-    TarValidator,
-    ZipValidator,
-)
+import importlib
+from typing import Any, List
+
 from .base import BaseValidator, ValidationResult, get_validator
-from .image_validator import (
-    BmpValidator,
-    GifValidator,
-    ImageValidator,
-    JpegValidator,
-    PngValidator,
-    SvgValidator,
-    WebPValidator,
-)
-from .office_validator import (
-    DocValidator,
-    DocxValidator,
-    OdpValidator,
-    OdsValidator,
-    OdtValidator,
-    OfficeValidator,
-    PptValidator,
-    PptxValidator,
-    XlsValidator,
-    XlsxValidator,
-)
-from .pdf_validator import PdfValidator
-from .text_validator import (
-    CssFileValidator,
-    CsvFileValidator,
-    HtmlFileValidator,
-    JavaScriptFileValidator,
-    JsonFileValidator,
-    PythonFileValidator,
-    ShellScriptValidator,
-    TextFileValidator,
-    XmlFileValidator,
-    YamlFileValidator,
-)
-from .video_validator import (  # Add other video validators as needed
-    AviValidator,
-    MkvValidator,
-    MovValidator,
-    Mp4Validator,
-    VideoValidator,
-    WebmValidator,
-)
+
+# Validator classes are imported from their modules on first access (PEP 562),
+# so e.g. text validation does not pay for importing PIL, OpenCV or tarfile
+_LAZY_EXPORTS = {
+    # Archives
+    "ArchiveValidator": "archive_validator",
+    "Bzip2Validator": "archive_validator",
+    "GzipValidator": "archive_validator",
+    "TarBz2Validator": "archive_validator",
+    "TarGzValidator": "archive_validator",
+    "TarValidator": "archive_validator",
+    "ZipValidator": "archive_validator",
+    # Images
+    "BmpValidator": "image_validator",
+    "GifValidator": "image_validator",
+    "ImageValidator": "image_validator",
+    "JpegValidator": "image_validator",
+    "PngValidator": "image_validator",
+    "SvgValidator": "image_validator",
+    "WebPValidator": "image_validator",
+    # Office
+    "DocValidator": "office_validator",
+    "DocxValidator": "office_validator",
+    "OdpValidator": "office_validator",
+    "OdsValidator": "office_validator",
+    "OdtValidator": "office_validator",
+    "OfficeValidator": "office_validator",
+    "PptValidator": "office_validator",
+    "PptxValidator": "office_validator",
+    "XlsValidator": "office_validator",
+    "XlsxValidator": "office_validator",
+    # PDF
+    "PdfValidator": "pdf_validator",
+    # Text
+    "CssFileValidator": "text_validator",
+    "CsvFileValidator": "text_validator",
+    "HtmlFileValidator": "text_validator",
+    "JavaScriptFileValidator": "text_validator",
+    "JsonFileValidator": "text_validator",
+    "PythonFileValidator": "text_validator",
+    "ShellScriptValidator": "text.shell_validator",
+    "TextFileValidator": "text_validator",
+    "XmlFileValidator": "text_validator",
+    "YamlFileValidator": "text_validator",
+    # Video
+    "AviValidator": "video_validator",
+    "MkvValidator": "video_validator",
+    "MovValidator": "video_validator",
+    "Mp4Validator": "video_validator",
+    "VideoValidator": "video_validator",
+    "WebmValidator": "video_validator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import validator classes lazily on first attribute access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 # Export all validators
 __all__ = [
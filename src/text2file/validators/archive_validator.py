@@ -2,13 +2,58 @@
 
 import bz2
 import gzip
+import io
+import os
+import struct
 import tarfile
 import zipfile
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_ISREG
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from .base import BaseValidator, ValidationResult
 
+# Gzip header flag bits (RFC 1952)
+_GZIP_FEXTRA = 0x04
+_GZIP_FNAME = 0x08
+
+# Read size and minimum compressed archive size for parallel ZIP CRC checks
+_ZIP_READ_CHUNK = 1 << 20
+_ZIP_PARALLEL_MIN = 4 << 20
+
+# ZIP end-of-central-directory record: signature, fixed size and the
+# largest trailing comment it may be followed by
+_ZIP_EOCD_SIGNATURE = b"PK\x05\x06"
+_ZIP_EOCD_SIZE = 22
+_ZIP_MAX_COMMENT = 0xFFFF
+
+# Flags for raw header reads (O_BINARY only exists on Windows)
+_O_RDONLY = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# Short extensions accepted in addition to the ".<format>" suffix
+_FORMAT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "tar.gz": (".tgz",),
+    "tar.bz2": (".tbz2",),
+}
+
+
+def _read_at(file_path: str, offset: int, size: int) -> bytes:
+    """Read up to size bytes at offset with a raw file descriptor."""
+    fd = os.open(file_path, _O_RDONLY)
+    try:
+        if offset:
+            os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _format_endings(format_str: str) -> Tuple[str, ...]:
+    """Return the lower-cased file name endings accepted for a format."""
+    format_str = format_str.lower()
+    return (f".{format_str}",) + _FORMAT_ALIASES.get(format_str, ())
+
 
 class ArchiveValidator(BaseValidator):
     """Base validator for archive files."""
@@ -16,38 +61,62 @@ class ArchiveValidator(BaseValidator):
     # Expected format for this validator (should be overridden by subclasses)
     FORMAT: Optional[str] = None
 
+    # File name endings for FORMAT, computed once per subclass
+    _FORMAT_ENDINGS: Tuple[str, ...] = ()
+
+    # Whether validate() checks the whole archive by default; when False only
+    # the format's header or trailer is checked, without decompressing
+    DEEP: bool = True
+
+    # (offset, magic bytes) used by the header-only check
+    _HEADER_MAGIC: Optional[Tuple[int, bytes]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.FORMAT:
+            cls._FORMAT_ENDINGS = _format_endings(cls.FORMAT)
+
     @classmethod
-    def validate(cls, file_path: str) -> ValidationResult:
+    def validate(
+        cls, file_path: str, *, deep: Optional[bool] = None
+    ) -> ValidationResult:
         """Validate an archive file.
 
         Args:
             file_path: Path to the archive file to validate
+            deep: Check the archive contents (True) or only its header
+                (False); defaults to the class's DEEP setting
 
         Returns:
             ValidationResult indicating whether the archive is valid
         """
         try:
-            # First check if the file exists and is readable
-            path = Path(file_path)
-            if not path.exists():
+            # First check if the file exists and is readable (one stat call)
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return ValidationResult(
                     is_valid=False, message=f"File not found: {file_path}"
                 )
 
-            if not path.is_file():
+            if not S_ISREG(st.st_mode):
                 return ValidationResult(
                     is_valid=False, message=f"Not a file: {file_path}"
                 )
 
             # Check file extension matches expected format
-            if cls.FORMAT and not cls._matches_format(path, cls.FORMAT):
+            if cls.FORMAT and not cls._matches_format(file_path, cls.FORMAT):
+                suffix = os.path.splitext(file_path)[1]
                 return ValidationResult(
                     is_valid=False,
-                    message=(f"Expected {cls.FORMAT.upper()} file, got {path.suffix}"),
+                    message=f"Expected {cls.FORMAT.upper()} file, got {suffix}",
                 )
 
+            if not (cls.DEEP if deep is None else deep):
+                return cls._validate_header(file_path, st=st)
+
             # Delegate to format-specific validation
-            return cls._validate_archive(file_path)
+            return cls._validate_archive(file_path, st=st)
 
         except Exception as e:
             return ValidationResult(
@@ -57,19 +126,59 @@ class ArchiveValidator(BaseValidator):
             )
 
     @classmethod
-    def _matches_format(cls, path: Path, format_str: str) -> bool:
+    def _matches_format(
+        cls, path: Union[str, "os.PathLike[str]"], format_str: str
+    ) -> bool:
         """Check if the file extension matches the expected format."""
-        if format_str == "tar.gz":
-            return path.suffixes == [".tar", ".gz"] or path.suffix == ".tgz"
-        if format_str == "tar.bz2":
-            return path.suffixes == [".tar", ".bz2"] or path.suffix == ".tbz2"
-        return path.suffix.lower() == f".{format_str}"
+        if format_str == cls.FORMAT:
+            endings = cls._FORMAT_ENDINGS
+        else:
+            endings = _format_endings(format_str)
+        return os.path.basename(os.fspath(path)).lower().endswith(endings)
 
     @classmethod
-    def _validate_archive(cls, file_path: str) -> ValidationResult:
-        """Perform format-specific archive validation."""
+    def _validate_archive(
+        cls, file_path: str, st: Optional[os.stat_result] = None
+    ) -> ValidationResult:
+        """Perform format-specific archive validation.
+
+        Args:
+            file_path: Path to the archive file
+            st: Result of os.stat(file_path), if the caller already has it
+
+        Returns:
+            ValidationResult for the archive
+        """
         raise NotImplementedError("Subclasses must implement _validate_archive()")
 
+    @classmethod
+    def _validate_header(
+        cls, file_path: str, st: Optional[os.stat_result] = None
+    ) -> ValidationResult:
+        """Check only the format's magic bytes, without reading any members.
+
+        Args:
+            file_path: Path to the archive file
+            st: Result of os.stat(file_path), if the caller already has it
+
+        Returns:
+            ValidationResult for the archive header
+        """
+        if cls._HEADER_MAGIC is None:
+            return cls._validate_archive(file_path, st=st)
+
+        offset, magic = cls._HEADER_MAGIC
+        if _read_at(file_path, offset, len(magic)) != magic:
+            return ValidationResult(
+                is_valid=False,
+                message=f"Invalid {cls.FORMAT.upper()} file: bad header",
+            )
+        return ValidationResult(
+            is_valid=True,
+            message=f"Valid {cls.FORMAT.upper()} header",
+            details={"size": (st or os.stat(file_path)).st_size},
+        )
+
     @classmethod
     def _get_archive_contents(cls, file_path: str) -> List[Dict[str, Any]]:
         """Get a list of files in the archive with their details."""
@@ -82,12 +191,14 @@ class ZipValidator(ArchiveValidator):
     FORMAT = "zip"
 
     @classmethod
-    def _validate_archive(cls, file_path: str) -> ValidationResult:
+    def _validate_archive(
+        cls, file_path: str, st: Optional[os.stat_result] = None
+    ) -> ValidationResult:
         """Validate a ZIP archive."""
         try:
             with zipfile.ZipFile(file_path, "r") as zip_ref:
                 # Test the zip file integrity
-                test_result = zip_ref.testzip()
+                test_result = cls._find_corrupt_member(zip_ref)
                 if test_result is not None:
                     return ValidationResult(
                         is_valid=False,
@@ -95,15 +206,15 @@ class ZipValidator(ArchiveValidator):
                         details={"corrupt_file": test_result},
                     )
 
-                # Get archive contents
-                contents = cls._get_archive_contents(file_path)
+                # Get archive contents from the already-open archive
+                contents = cls._contents_from_infolist(zip_ref.infolist())
 
                 return ValidationResult(
                     is_valid=True,
                     message=f"Valid ZIP archive with {len(contents)} files",
                     details={
                         "file_count": len(contents),
-                        "total_size": sum(f["size"] for f in contents),
+                        "total_size": sum(f["file_size"] for f in contents),
                         "files": contents,
                     },
                 )
@@ -115,6 +226,79 @@ class ZipValidator(ArchiveValidator):
                 details={"error": str(e)},
             )
 
+    @classmethod
+    def _validate_header(
+        cls, file_path: str, st: Optional[os.stat_result] = None
+    ) -> ValidationResult:
+        """Check for the end-of-central-directory record at the file's end."""
+        size = (st or os.stat(file_path)).st_size
+        tail_size = min(size, _ZIP_EOCD_SIZE + _ZIP_MAX_COMMENT)
+        tail = _read_at(file_path, size - tail_size, tail_size)
+
+        if tail.rfind(_ZIP_EOCD_SIGNATURE) < 0:
+            return ValidationResult(
+                is_valid=False,
+                message="Invalid ZIP file: end of central directory not found",
+            )
+        return ValidationResult(
+            is_valid=True, message="Valid ZIP header", details={"size": size}
+        )
+
+    @staticmethod
+    def _find_corrupt_member(zip_ref: zipfile.ZipFile) -> Optional[str]:
+        """Return the name of the first member whose data fails its CRC check.
+
+        Does the same job as ZipFile.testzip(), but spreads the members of
+        larger archives over a thread pool; zlib decompression and CRC32
+        release the GIL, so the checks run in parallel.
+
+        Args:
+            zip_ref: Open ZIP archive
+
+        Returns:
+            Name of the first corrupt member, or None if all members are intact
+        """
+
+        def check(info: zipfile.ZipInfo) -> Optional[str]:
+            try:
+                # ZipExtFile verifies the CRC once the member is fully read
+                with zip_ref.open(info) as member:
+                    while member.read(_ZIP_READ_CHUNK):
+                        pass
+            except (zipfile.BadZipFile, zlib.error):
+                return info.filename
+            return None
+
+        infos = [info for info in zip_ref.infolist() if not info.is_dir()]
+        if len(infos) < 2 or sum(i.compress_size for i in infos) < _ZIP_PARALLEL_MIN:
+            results = map(check, infos)
+            return next((name for name in results if name is not None), None)
+
+        workers = min(len(infos), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(check, infos)
+            return next((name for name in results if name is not None), None)
+
+    @staticmethod
+    def _contents_from_infolist(
+        infos: List[zipfile.ZipInfo],
+    ) -> List[Dict[str, Any]]:
+        """Build the contents list from a ZIP archive's member records.
+
+        "modified" is the raw ZipInfo.date_time 6-tuple; no per-entry date
+        formatting is done here, callers format it if they need text.
+        """
+        return [
+            {
+                "filename": info.filename,
+                "file_size": info.file_size,
+                "compress_size": info.compress_size,
+                "is_dir": info.is_dir(),
+                "modified": info.date_time,
+            }
+            for info in infos
+        ]
+
     @classmethod
     def _get_archive_contents(cls, file_path: str) -> List[Dict[str, Any]]:
         """Get a list of files in the ZIP archive with their details.
@@ -126,16 +310,7 @@ class ZipValidator(ArchiveValidator):
             List of dictionaries containing file information
         """
         with zipfile.ZipFile(file_path, "r") as zip_ref:
-            return [
-                {
-                    "filename": info.filename,
-                    "file_size": info.file_size,
-                    "compress_size": info.compress_size,
-                    "is_dir": info.is_dir(),
-                    "modified": info.date_time,
-                }
-                for info in zip_ref.infolist()
-            ]
+            return cls._contents_from_infolist(zip_ref.infolist())
 
 
 class TarValidator(ArchiveValidator):
@@ -143,144 +318,155 @@ class TarValidator(ArchiveValidator):
 
     FORMAT = "tar"
 
+    # tarfile stream mode; subclasses pin the expected compression
+    _STREAM_MODE = "r|*"
+
+    # POSIX ustar magic in the first header block
+    _HEADER_MAGIC = (257, b"ustar")
+
     @classmethod
-    def _validate_archive(cls, file_path: str) -> ValidationResult:
+    def _validate_archive(
+        cls, file_path: str, st: Optional[os.stat_result] = None
+    ) -> ValidationResult:
         """Validate a tar archive."""
         try:
-            with tarfile.open(file_path, "r:*") as tar_ref:
-                # This will raise an exception if the tar is corrupted
-                tar_members = tar_ref.getmembers()
+            # Read the archive as a stream: every header is parsed (which
+            # raises if the tar is corrupted) and compressed data is only
+            # decompressed once, front to back
+            with tarfile.open(file_path, cls._STREAM_MODE) as tar_ref:
+                contents = [cls._member_info(member) for member in tar_ref]
 
-                # Get archive contents
-                contents = cls._get_archive_contents(file_path)
-
-                return ValidationResult(
-                    is_valid=True,
-                    message=f"Valid TAR archive with {len(contents)} files",
-                    details={
-                        "file_count": len(contents),
-                        "total_size": sum(f["size"] for f in contents),
-                        "files": contents,
-                    },
-                )
+            return ValidationResult(
+                is_valid=True,
+                message=f"Valid TAR archive with {len(contents)} files",
+                details={
+                    "file_count": len(contents),
+                    "total_size": sum(f["size"] for f in contents),
+                    "files": contents,
+                },
+            )
 
-        except tarfile.TarError as e:
+        except (tarfile.TarError, OSError, EOFError) as e:
+            # Compression errors (bad gzip/bzip2 data) surface here as well
             return ValidationResult(
                 is_valid=False,
-                message=f"Invalid TAR file: {str(e)}",
+                message=f"Invalid {cls.FORMAT.upper()} file: {str(e)}",
                 details={"error": str(e)},
             )
 
+    @staticmethod
+    def _member_info(member: tarfile.TarInfo) -> Dict[str, Any]:
+        """Describe a single tar archive member."""
+        return {
+            "filename": member.name,
+            "size": member.size,
+            "modified": member.mtime,
+            "is_dir": member.isdir(),
+            "mode": member.mode,
+            "user": member.uname if hasattr(member, "uname") else "",
+            "group": member.gname if hasattr(member, "gname") else "",
+        }
+
     @classmethod
     def _get_archive_contents(cls, file_path: str) -> List[Dict[str, Any]]:
         """Get a list of files in the TAR archive with their details."""
-        contents = []
-        with tarfile.open(file_path, "r:*") as tar_ref:
-            for member in tar_ref.getmembers():
-                contents.append(
-                    {
-                        "filename": member.name,
-                        "size": member.size,
-                        "modified": member.mtime,
-                        "is_dir": member.isdir(),
-                        "mode": member.mode,
-                        "user": member.uname if hasattr(member, "uname") else "",
-                        "group": member.gname if hasattr(member, "gname") else "",
-                    }
-                )
-        return contents
+        with tarfile.open(file_path, cls._STREAM_MODE) as tar_ref:
+            return [cls._member_info(member) for member in tar_ref]
 
 
 class TarGzValidator(TarValidator):
     """Validator for tar.gz archives."""
 
     FORMAT = "tar.gz"
-
-    @classmethod
-    def _validate_archive(cls, file_path: str) -> ValidationResult:
-        """Validate a tar.gz archive."""
-        # First check if the file is a valid gzip file
-        try:
-            with gzip.open(file_path, "rb") as f:
-                # Try to read a small amount to test the gzip integrity
-                f.read(1)
-        except (gzip.BadGzipFile, OSError) as e:
-            return ValidationResult(
-                is_valid=False,
-                message=f"Invalid gzip file: {str(e)}",
-                details={"error": str(e)},
-            )
-
-        # Then validate as a tar file
-        return super()._validate_archive(file_path)
+    _STREAM_MODE = "r|gz"
+    _HEADER_MAGIC = (0, b"\x1f\x8b")
 
 
 class TarBz2Validator(TarValidator):
     """Validator for tar.bz2 archives."""
 
     FORMAT = "tar.bz2"
-
-    @classmethod
-    def _validate_archive(cls, file_path: str) -> ValidationResult:
-        """Validate a tar.bz2 archive."""
-        # First check if the file is a valid bzip2 file
-        try:
-            with bz2.open(file_path, "rb") as f:
-                # Try to read a small amount to test the bzip2 integrity
-                f.read(1)
-        except (OSError, EOFError) as e:
-            return ValidationResult(
-                is_valid=False,
-                message=f"Invalid bzip2 file: {str(e)}",
-                details={"error": str(e)},
-            )
-
-        # Then validate as a tar file
-        return super()._validate_archive(file_path)
+    _STREAM_MODE = "r|bz2"
+    _HEADER_MAGIC = (0, b"BZh")
 
 
 class GzipValidator(ArchiveValidator):
     """Validator for gzip files."""
 
     FORMAT = "gz"
+    _HEADER_MAGIC = (0, b"\x1f\x8b")
 
     @classmethod
-    def _validate_archive(cls, file_path: str) -> ValidationResult:
+    def _validate_archive(
+        cls, file_path: str, st: Optional[os.stat_result] = None
+    ) -> ValidationResult:
         """Validate a gzip file."""
         try:
-            with gzip.open(file_path, "rb") as f:
-                # Try to read a small amount to test the gzip integrity
-                f.read(1)
+            with open(file_path, "rb") as raw:
+                # Get original filename if available
+                original_filename = cls._read_original_filename(raw)
 
-            # Get original filename if available
-            with gzip.open(file_path, "rb") as f:
-                original_filename = f.name
+                # Try to read a small amount to test the gzip integrity
+                raw.seek(0)
+                with gzip.GzipFile(fileobj=raw, mode="rb") as f:
+                    f.read(1)
 
             return ValidationResult(
                 is_valid=True,
                 message="Valid gzip file",
                 details={
-                    "original_filename": original_filename
-                    if original_filename != file_path
-                    else None,
-                    "size": Path(file_path).stat().st_size,
+                    "original_filename": original_filename,
+                    "size": (st or os.stat(file_path)).st_size,
                 },
             )
 
-        except (gzip.BadGzipFile, OSError) as e:
+        except (gzip.BadGzipFile, OSError, EOFError) as e:
             return ValidationResult(
                 is_valid=False,
                 message=f"Invalid gzip file: {str(e)}",
                 details={"error": str(e)},
             )
 
+    @staticmethod
+    def _read_original_filename(f: BinaryIO) -> Optional[str]:
+        """Read the original file name stored in a gzip header (RFC 1952).
+
+        Args:
+            f: Binary file object positioned at the start of the gzip stream
+
+        Returns:
+            The stored file name, or None if the header has none
+        """
+        header = f.read(10)
+        if len(header) < 10 or header[:2] != b"\x1f\x8b":
+            return None
+
+        flags = header[3]
+        if flags & _GZIP_FEXTRA:
+            extra = f.read(2)
+            if len(extra) < 2:
+                return None
+            (extra_len,) = struct.unpack("<H", extra)
+            f.seek(extra_len, io.SEEK_CUR)
+        if not flags & _GZIP_FNAME:
+            return None
+
+        # Zero-terminated ISO 8859-1 string
+        name = bytearray()
+        while True:
+            byte = f.read(1)
+            if not byte or byte == b"\x00":
+                break
+            name += byte
+        return name.decode("latin-1")
+
     @classmethod
     def _get_archive_contents(cls, file_path: str) -> List[Dict[str, Any]]:
         """Get information about the gzipped file."""
         return [
             {
-                "filename": Path(file_path).name,
-                "size": Path(file_path).stat().st_size,
+                "filename": os.path.basename(file_path),
+                "size": os.stat(file_path).st_size,
                 "is_dir": False,
             }
         ]
@@ -290,9 +476,12 @@ class Bzip2Validator(ArchiveValidator):
     """Validator for bzip2 files."""
 
     FORMAT = "bz2"
+    _HEADER_MAGIC = (0, b"BZh")
 
     @classmethod
-    def _validate_archive(cls, file_path: str) -> ValidationResult:
+    def _validate_archive(
+        cls, file_path: str, st: Optional[os.stat_result] = None
+    ) -> ValidationResult:
         """Validate a bzip2 file."""
         try:
             with bz2.open(file_path, "rb") as f:
@@ -302,7 +491,7 @@ class Bzip2Validator(ArchiveValidator):
             return ValidationResult(
                 is_valid=True,
                 message="Valid bzip2 file",
-                details={"size": Path(file_path).stat().st_size},
+                details={"size": (st or os.stat(file_path)).st_size},
             )
 
         except (OSError, EOFError) as e:
@@ -317,8 +506,8 @@ class Bzip2Validator(ArchiveValidator):
         """Get information about the bzipped file."""
         return [
             {
-                "filename": Path(file_path).name,
-                "size": Path(file_path).stat().st_size,
+                "filename": os.path.basename(file_path),
+                "size": os.stat(file_path).st_size,
                 "is_dir": False,
             }
         ]
@@ -1,16 +1,41 @@
 """Base validator class for file validation."""
 
+import functools
+import os
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
 
 T = TypeVar("T", bound="ValidationResult")
 
+# Number of (validator, file state) results kept by validate_cached()
+_VALIDATION_CACHE_SIZE = 1024
 
-@dataclass
+# Worker threads for validators whose work is almost all file I/O: reads
+# release the GIL, so more threads than cores keep the disk queue full
+IO_BOUND_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Validators added at runtime with BaseValidator.register_validator(s), by
+# extension; built-in validators all live in _validator_table(), and these
+# take precedence over it in get_validator()
+_registered_validators: Dict[str, Type["BaseValidator"]] = {}
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
-    """Result of a file validation operation."""
+    """Result of a file validation operation.
+
+    Validators create one of these per call, so instances use __slots__
+    where supported and leave details as None unless there is something
+    to report.
+    """
 
     is_valid: bool
     message: str
@@ -23,6 +48,9 @@ class ValidationResult:
 class BaseValidator(ABC):
     """Abstract base class for all file validators."""
 
+    # Default thread count for validate_many() (None: the executor's default)
+    MAX_WORKERS: Optional[int] = None
+
     @classmethod
     @abstractmethod
     def validate(cls, file_path: str) -> ValidationResult:
@@ -48,17 +76,103 @@ class BaseValidator(ABC):
         """
         return bool(cls.validate(file_path))
 
+    @staticmethod
+    def register_validator(extension: str, validator: Type["BaseValidator"]) -> None:
+        """Register a validator for a file extension.
 
-def get_validator(file_path: str) -> Type[BaseValidator]:
-    """Get the appropriate validator for the given file based on its extension.
+        Args:
+            extension: File extension, with or without the leading dot
+            validator: Validator class to use for files with that extension
+        """
+        BaseValidator.register_validators((extension,), validator)
 
-    Args:
-        file_path: Path to the file to validate
+    @staticmethod
+    def register_validators(
+        extensions: Iterable[str], validator: Type["BaseValidator"]
+    ) -> None:
+        """Register one validator for several file extensions at once.
 
-    Returns:
-        A validator class that can validate the file
-    """
-    from ..generators import get_generator
+        Args:
+            extensions: File extensions, with or without the leading dot
+            validator: Validator class to use for files with those extensions
+        """
+        _registered_validators.update(
+            (ext.lower().lstrip("."), validator) for ext in extensions
+        )
+
+    @classmethod
+    def validate_cached(cls, file_path: str) -> ValidationResult:
+        """Validate a file, reusing the result while the file is unchanged.
+
+        Results are keyed by the validator class and the file's device,
+        inode, modification time and size, so rewriting the file invalidates
+        its entry. The cached ValidationResult is shared between calls and
+        should not be modified.
+
+        Args:
+            file_path: Path to the file to validate
+
+        Returns:
+            ValidationResult indicating whether the file is valid and any details
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return cls.validate(file_path)
+        return _validate_by_key(
+            cls, os.fspath(file_path), st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+        )
+
+    @classmethod
+    def validate_many(
+        cls, file_paths: Iterable[str], max_workers: Optional[int] = None
+    ) -> List[ValidationResult]:
+        """Validate many files concurrently.
+
+        Validation is dominated by file I/O and decompression, which release
+        the GIL, so a thread pool overlaps the work across files. Called on
+        BaseValidator itself, each file is dispatched to the validator
+        returned by get_validator().
+
+        Args:
+            file_paths: Paths of the files to validate
+            max_workers: Maximum number of worker threads (default: the
+                class's MAX_WORKERS)
+
+        Returns:
+            One ValidationResult per path, in the same order as file_paths
+        """
+
+        def validate_one(file_path: str) -> ValidationResult:
+            validator = get_validator(file_path) if cls is BaseValidator else cls
+            if validator is BaseValidator:
+                return ValidationResult(
+                    is_valid=False, message=f"No validator for file: {file_path}"
+                )
+            return validator.validate(file_path)
+
+        if max_workers is None:
+            max_workers = cls.MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(validate_one, file_paths))
+
+
+@functools.lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_by_key(
+    validator: Type[BaseValidator],
+    file_path: str,
+    dev: int,
+    ino: int,
+    mtime_ns: int,
+    size: int,
+) -> ValidationResult:
+    """Run a validation; the file state arguments only form the cache key."""
+    return validator.validate(file_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _validator_table() -> Dict[str, Type[BaseValidator]]:
+    """Build the extension -> validator class table (once, on first use)."""
     from . import (  # Import validators here to avoid circular imports
         archive_validator,
         image_validator,
@@ -67,12 +181,12 @@ def get_validator(file_path: str) -> Type[BaseValidator]:
         text_validator,
         video_validator,
     )
+    from .text import markdown_validator, shell_validator
 
     # Map file extensions to their validators
-    validators = {
+    return {
         # Text files
         "txt": text_validator.TextFileValidator,
-        "md": text_validator.TextFileValidator,
         "html": text_validator.HtmlFileValidator,
         "css": text_validator.CssFileValidator,
         "js": text_validator.JavaScriptFileValidator,
@@ -82,6 +196,16 @@ def get_validator(file_path: str) -> Type[BaseValidator]:
         "xml": text_validator.XmlFileValidator,
         "yaml": text_validator.YamlFileValidator,
         "yml": text_validator.YamlFileValidator,
+        # Markdown
+        **dict.fromkeys(
+            markdown_validator.MarkdownValidator.MARKDOWN_EXTENSIONS,
+            markdown_validator.MarkdownValidator,
+        ),
+        # Shell scripts
+        **dict.fromkeys(
+            shell_validator.ShellScriptValidator.SHELL_EXTENSIONS,
+            shell_validator.ShellScriptValidator,
+        ),
         # Images
         "jpg": image_validator.JpegValidator,
         "jpeg": image_validator.JpegValidator,
@@ -97,6 +221,8 @@ def get_validator(file_path: str) -> Type[BaseValidator]:
         "tgz": archive_validator.TarGzValidator,
         "tar.bz2": archive_validator.TarBz2Validator,
         "tbz2": archive_validator.TarBz2Validator,
+        "gz": archive_validator.GzipValidator,
+        "bz2": archive_validator.Bzip2Validator,
         # Office
         "pdf": pdf_validator.PdfValidator,
         "docx": office_validator.DocxValidator,
@@ -113,12 +239,31 @@ def get_validator(file_path: str) -> Type[BaseValidator]:
         "webm": video_validator.WebmValidator,
     }
 
-    # Get the file extension
-    ext = Path(file_path).suffix.lstrip(".").lower()
+
+def get_validator(file_path: str) -> Type[BaseValidator]:
+    """Get the appropriate validator for the given file based on its extension.
+
+    Args:
+        file_path: Path to the file to validate
+
+    Returns:
+        A validator class that can validate the file
+    """
+    validators = _validator_table()
+    registered = _registered_validators
+
+    # Get up to two extensions from the file name (leading dots don't count)
+    parts = os.path.basename(file_path).lower().lstrip(".").rsplit(".", 2)
+    if len(parts) < 2:
+        return BaseValidator
+    ext = parts[-1]
 
     # Handle double extensions like .tar.gz
-    if ext in ["gz", "bz2"] and len(parts := Path(file_path).suffixes) > 1:
-        ext = f"{parts[-2].lstrip('.')}{parts[-1]}"
+    if ext in ("gz", "bz2") and len(parts) == 3:
+        double_ext = f"{parts[-2]}.{ext}"
+        validator = registered.get(double_ext) or validators.get(double_ext)
+        if validator is not None:
+            return validator
 
     # Return the appropriate validator or the base validator if not found
-    return validators.get(ext, BaseValidator)
+    return registered.get(ext) or validators.get(ext, BaseValidator)
@@ -1,13 +1,83 @@
 """Validators for image file formats."""
 
-import imghdr
-from pathlib import Path
-from typing import Optional
+import os
+import re
+from stat import S_ISREG
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from PIL import Image, UnidentifiedImageError
 
 from .base import BaseValidator, ValidationResult
 
+# Flags for raw header reads (O_BINARY only exists on Windows)
+_O_RDONLY = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# Every magic number checked below lies within the first few bytes
+_HEADER_SIZE = 64
+
+# Leading magic bytes -> image format, most common formats first (a RIFF
+# container is only WebP if bytes 8-12 say so)
+_MAGIC_PREFIXES = (
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"RIFF", "webp"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"BM", "bmp"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+)
+
+# First byte -> candidate (magic, format) pairs, so detection is one dict
+# lookup plus at most two startswith() calls
+def _index_by_first_byte(
+    prefixes: Tuple[Tuple[bytes, str], ...]
+) -> Dict[bytes, Tuple[Tuple[bytes, str], ...]]:
+    """Group (magic, format) pairs by their first byte, keeping their order."""
+    index: Dict[bytes, List[Tuple[bytes, str]]] = {}
+    for magic, image_format in prefixes:
+        index.setdefault(magic[:1], []).append((magic, image_format))
+    return {first: tuple(pairs) for first, pairs in index.items()}
+
+
+_MAGIC_BY_FIRST_BYTE = _index_by_first_byte(_MAGIC_PREFIXES)
+
+
+# Extensions accepted in addition to ".<format>"
+_EXTENSION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "jpeg": (".jpg", ".jpe"),
+    "tiff": (".tif",),
+}
+
+# SVG root element or doctype, matched case-insensitively on raw bytes
+_SVG_RE = re.compile(rb"<svg\b|<!doctype\s+svg", re.IGNORECASE)
+
+
+def _sniff(file_path: str, size: int = _HEADER_SIZE) -> bytes:
+    """Read the first bytes of a file with a raw file descriptor."""
+    fd = os.open(file_path, _O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _detect_image_format(header: bytes) -> Optional[str]:
+    """Detect an image format from the file's leading bytes.
+
+    Args:
+        header: The first bytes of the file (at least 12 for WebP)
+
+    Returns:
+        Lower-case format name, or None if the format is not recognized
+    """
+    for magic, image_format in _MAGIC_BY_FIRST_BYTE.get(header[:1], ()):
+        if header.startswith(magic):
+            if image_format == "webp" and header[8:12] != b"WEBP":
+                return None
+            return image_format
+    return None
+
 
 class ImageValidator(BaseValidator):
     """Base validator for image files."""
@@ -15,6 +85,22 @@ class ImageValidator(BaseValidator):
     # Expected format for this validator (should be overridden by subclasses)
     FORMAT: Optional[str] = None
 
+    # Also check the full image data with PIL's verify(), not just the header
+    DEEP_VERIFY: bool = False
+
+    # Lower-cased FORMAT and its accepted extensions, computed once per subclass
+    _FORMAT_LOWER: Optional[str] = None
+    _EXTENSIONS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.FORMAT:
+            format_lower = cls.FORMAT.lower()
+            cls._FORMAT_LOWER = format_lower
+            cls._EXTENSIONS = (f".{format_lower}",) + _EXTENSION_ALIASES.get(
+                format_lower, ()
+            )
+
     @classmethod
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate an image file.
@@ -26,72 +112,92 @@ class ImageValidator(BaseValidator):
             ValidationResult indicating whether the image is valid
         """
         try:
-            # First check if the file exists and is readable
-            path = Path(file_path)
-            if not path.exists():
+            # First check if the file exists and is readable (one stat call)
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return ValidationResult(
                     is_valid=False, message=f"File not found: {file_path}"
                 )
 
-            if not path.is_file():
+            if not S_ISREG(st.st_mode):
                 return ValidationResult(
                     is_valid=False, message=f"Not a file: {file_path}"
                 )
 
             # Check file extension matches expected format
-            if cls.FORMAT and path.suffix.lower()[1:] != cls.FORMAT.lower():
+            suffix = os.path.splitext(file_path)[1]
+            if cls._EXTENSIONS and suffix.lower() not in cls._EXTENSIONS:
                 return ValidationResult(
                     is_valid=False,
-                    message=(f"Expected {cls.FORMAT.upper()} file, got {path.suffix}"),
+                    message=f"Expected {cls.FORMAT.upper()} file, got {suffix}",
                 )
 
-            # Check file magic number to verify the actual format
-            detected_format = imghdr.what(file_path)
-            if detected_format is None:
-                return ValidationResult(
-                    is_valid=False, message="File is not a recognized image format"
-                )
+            with open(file_path, "rb") as f:
+                # Check file magic number to verify the actual format
+                detected_format = _detect_image_format(f.read(_HEADER_SIZE))
+                if detected_format is None:
+                    return ValidationResult(
+                        is_valid=False,
+                        message="File is not a recognized image format",
+                    )
 
-            if cls.FORMAT and detected_format.lower() != cls.FORMAT.lower():
-                return ValidationResult(
-                    is_valid=False,
-                    message=(
-                        f"File is not a {cls.FORMAT.upper()} image "
-                        f"(detected as {detected_format.upper()})"
-                    ),
-                )
+                if cls._FORMAT_LOWER and detected_format != cls._FORMAT_LOWER:
+                    return ValidationResult(
+                        is_valid=False,
+                        message=(
+                            f"File is not a {cls.FORMAT.upper()} image "
+                            f"(detected as {detected_format.upper()})"
+                        ),
+                    )
 
-            # Try to open the image with PIL to validate its contents
-            try:
-                with Image.open(file_path) as img:
-                    # Verify image can be loaded and has valid dimensions
-                    img.verify()
-                    width, height = img.size
+                # Let PIL parse the already-open file
+                f.seek(0)
+                return cls._validate_image(f)
+
+        except Exception as e:
+            return ValidationResult(
+                is_valid=False,
+                message=f"Error processing image file: {str(e)}",
+                details={"error": str(e)},
+            )
 
-                    if width == 0 or height == 0:
-                        return ValidationResult(
-                            is_valid=False,
-                            message=f"Invalid image dimensions: {width}x{height}",
-                            details={"width": width, "height": height},
-                        )
+    @classmethod
+    def _validate_image(cls, fp: BinaryIO) -> ValidationResult:
+        """Validate image contents with PIL.
 
-                    return ValidationResult(is_valid=True, message="Valid image file")
-            except UnidentifiedImageError as e:
-                return ValidationResult(
-                    is_valid=False,
-                    message=f"Invalid or corrupted image: {str(e)}",
-                )
-            except Exception as e:
-                return ValidationResult(
-                    is_valid=False,
-                    message=f"Error validating image: {str(e)}",
-                    details={"error": str(e)},
-                )
+        Args:
+            fp: Binary file object positioned at the start of the image
+
+        Returns:
+            ValidationResult for the decoded image
+        """
+        # Try to open the image with PIL to validate its contents
+        try:
+            with Image.open(fp) as img:
+                # Opening parses the header only, which yields the dimensions;
+                # walking the full image stream is opt-in via DEEP_VERIFY
+                width, height = img.size
+                if cls.DEEP_VERIFY:
+                    img.verify()
 
+                if width == 0 or height == 0:
+                    return ValidationResult(
+                        is_valid=False,
+                        message=f"Invalid image dimensions: {width}x{height}",
+                        details={"width": width, "height": height},
+                    )
+
+                return ValidationResult(is_valid=True, message="Valid image file")
+        except UnidentifiedImageError as e:
+            return ValidationResult(
+                is_valid=False,
+                message=f"Invalid or corrupted image: {str(e)}",
+            )
         except Exception as e:
             return ValidationResult(
                 is_valid=False,
-                message=f"Error processing image file: {str(e)}",
+                message=f"Error validating image: {str(e)}",
                 details={"error": str(e)},
             )
 
@@ -177,34 +283,33 @@ class SvgValidator(ImageValidator):
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate an SVG file."""
         # First check if the file exists and is readable
-        path = Path(file_path)
-        if not path.exists():
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return ValidationResult(
                 is_valid=False, message=f"File not found: {file_path}"
             )
 
         # Check file extension
-        if path.suffix.lower() != ".svg":
+        if os.path.splitext(file_path)[1].lower() not in cls._EXTENSIONS:
             return ValidationResult(
                 is_valid=False, message=f"Not an SVG file: {file_path}"
             )
 
         # Basic SVG validation - check for SVG root element
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read(1024).lower()
-                if "<!doctype svg" not in content and "<svg" not in content:
-                    return ValidationResult(
-                        is_valid=False,
-                        message="File does not appear to be a valid SVG (missing SVG root element)",
-                    )
-
+            if not _SVG_RE.search(_sniff(file_path, 1024)):
                 return ValidationResult(
-                    is_valid=True,
-                    message="File appears to be a valid SVG",
-                    details={"size": path.stat().st_size},
+                    is_valid=False,
+                    message="File does not appear to be a valid SVG (missing SVG root element)",
                 )
 
+            return ValidationResult(
+                is_valid=True,
+                message="File appears to be a valid SVG",
+                details={"size": st.st_size},
+            )
+
         except Exception as e:
             return ValidationResult(
                 is_valid=False,
@@ -1,12 +1,185 @@
 """Validators for office document formats."""
 
+import os
+import struct
 import zipfile
 from pathlib import Path
-from typing import Dict, List, TypeVar, Union
-
-from .base import BaseValidator, ValidationResult
-
-T = TypeVar("T", bound="OfficeValidator")
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .base import (
+    IO_BOUND_WORKERS,
+    BaseValidator,
+    ValidationResult,
+)
+
+# Leading bytes of a ZIP local file header (OOXML and ODF containers)
+_PKZIP_MAGIC = b"PK\x03\x04"
+
+# OLE Compound File signature (legacy .doc/.xls/.ppt)
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Longest signature above; one read of this many bytes covers them all
+_SIGNATURE_SIZE = len(_OLE_MAGIC)
+
+# Flags for raw signature reads (O_BINARY only exists on Windows)
+_O_RDONLY = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# Verdicts for a legacy-extension file by leading bytes: (signature,
+# is_valid, message); {path} in the message is filled in on a match
+_LEGACY_SIGNATURES = (
+    (_OLE_MAGIC, True, "Valid legacy office document"),
+    (
+        _PKZIP_MAGIC,
+        False,
+        "File appears to be an OOXML/ODF file with wrong extension: {path}",
+    ),
+)
+
+# MIME type of each supported office format, by extension; OfficeValidator's
+# EXTENSIONS and every validator's MIME_TYPES are derived from this one table
+_OFFICE_FORMATS: Mapping[str, str] = MappingProxyType(
+    {
+        # Office Open XML formats
+        ".docx": "application/vnd.openxmlformats-officedocument"
+        ".wordprocessingml.document",
+        ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        ".pptx": "application/vnd.openxmlformats-officedocument"
+        ".presentationml.presentation",
+        # OpenDocument formats
+        ".odt": "application/vnd.oasis.opendocument.text",
+        ".ods": "application/vnd.oasis.opendocument.spreadsheet",
+        ".odp": "application/vnd.oasis.opendocument.presentation",
+        # Legacy MS Office formats
+        ".doc": "application/msword",
+        ".xls": "application/vnd.ms-excel",
+        ".ppt": "application/vnd.ms-powerpoint",
+    }
+)
+
+# Parts each OOXML/ODF container must hold, by extension (read-only)
+_REQUIRED_FILES: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        ".docx": ("[Content_Types].xml", "word/document.xml"),
+        ".xlsx": ("[Content_Types].xml", "xl/workbook.xml"),
+        ".pptx": ("[Content_Types].xml", "ppt/presentation.xml"),
+        ".odt": ("mimetype", "content.xml"),
+        ".ods": ("mimetype", "content.xml"),
+        ".odp": ("mimetype", "content.xml"),
+    }
+)
+
+# ZIP end-of-central-directory record and the largest comment that may follow
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD = struct.Struct("<4s4H2LH")
+_ZIP_MAX_COMMENT = 0xFFFF
+
+# Central directory file header: fixed part, then flags and the name, extra
+# field and comment lengths (which sit 8 and 28 bytes into the header)
+_CD_SIGNATURE = b"PK\x01\x02"
+_CD_HEADER_SIZE = 46
+_CD_FIELDS = struct.Struct("<H18x3H")
+_ZIP_UTF8_FLAG = 0x800
+
+
+def _find_eocd(tail: bytes) -> int:
+    """Find the end-of-central-directory record in the last bytes of a ZIP.
+
+    Signature bytes inside an archive comment are skipped by preferring the
+    record whose comment length reaches the end of the data exactly; if none
+    does (trailing junk), the last signature found is used.
+
+    Args:
+        tail: The last bytes of the file, up to the record plus a full comment
+
+    Returns:
+        Offset of the record in tail, or -1 if there is none
+    """
+    found = -1
+    # Most archives have no comment, so the first probe ends at the record
+    end = len(tail) - _EOCD.size + len(_EOCD_SIGNATURE)
+    while end > 0:
+        pos = tail.rfind(_EOCD_SIGNATURE, 0, end)
+        if pos < 0:
+            break
+        if pos + _EOCD.size + _EOCD.unpack_from(tail, pos)[-1] == len(tail):
+            return pos
+        if found < 0:
+            found = pos
+        end = pos + len(_EOCD_SIGNATURE) - 1
+    return found
+
+
+def _read_central_directory(file_path: Path) -> Optional[bytes]:
+    """Read the raw central directory of a ZIP file, located from its tail.
+
+    Args:
+        file_path: Path to the ZIP file
+
+    Returns:
+        The central directory bytes, or None for ZIP64 archives (which are
+        left to zipfile)
+
+    Raises:
+        zipfile.BadZipFile: If the end-of-central-directory record is
+            missing or the central directory is truncated
+    """
+    with open(file_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        tail_size = min(size, _EOCD.size + _ZIP_MAX_COMMENT)
+        f.seek(size - tail_size)
+        tail = f.read(tail_size)
+
+        pos = _find_eocd(tail)
+        if pos < 0:
+            raise zipfile.BadZipFile("End of central directory not found")
+
+        _, _, _, _, entries, cd_size, cd_offset, _ = _EOCD.unpack_from(tail, pos)
+        if entries == 0xFFFF or 0xFFFFFFFF in (cd_size, cd_offset):
+            return None
+
+        # Locate the directory relative to the record, not by cd_offset, so
+        # data prepended to the archive does not matter
+        cd_start = size - tail_size + pos - cd_size
+        if cd_start < 0:
+            raise zipfile.BadZipFile("Truncated central directory")
+        f.seek(cd_start)
+        central_directory = f.read(cd_size)
+
+    if len(central_directory) != cd_size:
+        raise zipfile.BadZipFile("Truncated central directory")
+    return central_directory
+
+
+def _iter_central_directory_names(central_directory: bytes) -> Iterator[str]:
+    """Yield member names from raw central directory bytes, in order.
+
+    Only each header's name is decoded; no ZipInfo objects are built.
+    """
+    offset = 0
+    end = len(central_directory)
+    while offset + _CD_HEADER_SIZE <= end:
+        if central_directory[offset : offset + 4] != _CD_SIGNATURE:
+            raise zipfile.BadZipFile("Bad central directory file header")
+        flags, name_len, extra_len, comment_len = _CD_FIELDS.unpack_from(
+            central_directory, offset + 8
+        )
+        start = offset + _CD_HEADER_SIZE
+        name = central_directory[start : start + name_len]
+        yield name.decode("utf-8" if flags & _ZIP_UTF8_FLAG else "cp437")
+        offset = start + name_len + extra_len + comment_len
 
 
 class OfficeValidator(BaseValidator):
@@ -14,38 +187,36 @@ class OfficeValidator(BaseValidator):
 
     # Common office document MIME types
     MIME_TYPES: Dict[str, List[str]] = {
-        "application/vnd.openxmlformats-officedocument"
-        ".wordprocessingml.document": [".docx"],
-        "application/vnd.openxmlformats-officedocument"
-        ".spreadsheetml.sheet": [".xlsx"],
-        "application/vnd.openxmlformats-officedocument"
-        ".presentationml.presentation": [".pptx"],
-        "application/vnd.oasis.opendocument.text": [".odt"],
-        "application/vnd.oasis.opendocument.spreadsheet": [".ods"],
-        "application/vnd.oasis.opendocument.presentation": [".odp"],
-        "application/msword": [".doc"],
-        "application/vnd.ms-excel": [".xls"],
-        "application/vnd.ms-powerpoint": [".ppt"],
+        mime: [ext] for ext, mime in _OFFICE_FORMATS.items()
     }
 
+    # Validation is mostly file reads, so batches use more threads than cores
+    MAX_WORKERS = IO_BOUND_WORKERS
+
     # File extensions this validator can handle
-    EXTENSIONS: List[str] = [
-        ".docx",
-        ".xlsx",
-        ".pptx",  # Office Open XML formats
-        ".odt",
-        ".ods",
-        ".odp",  # OpenDocument formats
-        ".doc",
-        ".xls",
-        ".ppt",  # Legacy MS Office formats
-    ]
-
-    def __init__(self) -> None:
-        """Initialize the office document validator."""
-        super().__init__(self.MIME_TYPES, self.EXTENSIONS)
-
-    def validate(self, file_path: Union[str, Path]) -> ValidationResult:
+    EXTENSIONS: List[str] = list(_OFFICE_FORMATS)
+
+    # Extension -> (kind, required parts), where kind is "zip" for the
+    # OOXML and ODF containers and "ole" for legacy formats. Subclasses get
+    # the entries for their own EXTENSIONS, so validate() needs one lookup
+    _EXT_TABLE: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+        **{ext: ("zip", parts) for ext, parts in _REQUIRED_FILES.items()},
+        ".doc": ("ole", ()),
+        ".xls": ("ole", ()),
+        ".ppt": ("ole", ()),
+    }
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # MIME_TYPES and the extension table follow the subclass's EXTENSIONS
+        table = OfficeValidator._EXT_TABLE
+        cls.MIME_TYPES = {
+            _OFFICE_FORMATS[ext]: [ext] for ext in cls.EXTENSIONS if ext in table
+        }
+        cls._EXT_TABLE = {ext: table[ext] for ext in cls.EXTENSIONS if ext in table}
+
+    @classmethod
+    def validate(cls, file_path: Union[str, Path]) -> ValidationResult:
         """
         Validate an office document file.
 
@@ -55,107 +226,144 @@ class OfficeValidator(BaseValidator):
         Returns:
             ValidationResult indicating whether the file is valid
         """
-        file_path = Path(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
 
-        # First, check if the file exists and is readable
-        if not file_path.exists() or not file_path.is_file():
+        # First, check if the file exists and is readable (one stat call)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        if st is None or not S_ISREG(st.st_mode):
             return ValidationResult(
-                valid=False,
-                messages=[f"File does not exist or is not a file: {file_path}"],
+                is_valid=False,
+                message=f"File does not exist or is not a file: {file_path}",
             )
 
         # Check file extension
         ext = file_path.suffix.lower()
-        if ext not in self.EXTENSIONS:
+        entry = cls._EXT_TABLE.get(ext)
+        if entry is None:
             return ValidationResult(
-                valid=False, messages=[f"Unsupported office document extension: {ext}"]
+                is_valid=False,
+                message=f"Unsupported office document extension: {ext}",
             )
 
         # For Office Open XML formats (docx, xlsx, pptx) and ODF formats
         # (odt, ods, odp), we can validate by checking if it's a valid ZIP
         # archive with the expected structure
-        if ext in (".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp"):
-            return self._validate_office_open_xml(file_path)
+        kind, required = entry
+        if kind == "zip":
+            return cls._validate_office_open_xml(file_path, required, ext)
 
         # For legacy formats, we can only do basic validation
-        return self._validate_legacy_office(file_path)
+        return cls._validate_legacy_office(file_path, st.st_size)
+
+    @staticmethod
+    def _read_signature(file_path: Path) -> bytes:
+        """Read the first 8 bytes of a file, enough for every signature here.
 
-    def _validate_office_open_xml(self, file_path: Path) -> ValidationResult:
+        A raw descriptor is used, since a buffered file object is wasted on
+        a single tiny read.
+        """
+        fd = os.open(file_path, _O_RDONLY)
+        try:
+            return os.read(fd, _SIGNATURE_SIZE)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _is_pkzip_header(header: bytes) -> bool:
+        """Check for a ZIP local file header at the start of the file."""
+        return header.startswith(_PKZIP_MAGIC)
+
+    @classmethod
+    def _validate_office_open_xml(
+        cls,
+        file_path: Path,
+        required: Optional[Sequence[str]] = None,
+        ext: Optional[str] = None,
+    ) -> ValidationResult:
         """
         Validate Office Open XML (OOXML) or OpenDocument Format (ODF) files.
 
         Args:
             file_path: Path to the file to validate
+            required: Parts the container must hold; looked up by the file's
+                extension when not given
+            ext: The file's lower-cased extension, if the caller has it
 
         Returns:
             ValidationResult indicating whether the file is valid
         """
         try:
-            # Check if the file is a valid ZIP archive
-            if not zipfile.is_zipfile(file_path):
+            # OOXML/ODF files start with a ZIP local file header; checking
+            # it is one small read, unlike is_zipfile()'s scan of the tail
+            if not cls._is_pkzip_header(cls._read_signature(file_path)):
                 return ValidationResult(
-                    valid=False,
-                    messages=[f"Not a ZIP archive: {file_path}"],
+                    is_valid=False,
+                    message=f"Not a ZIP archive: {file_path}",
                 )
 
             # Basic structure validation by checking for required files
-            with zipfile.ZipFile(file_path, "r") as zf:
-                file_list = zf.namelist()
-
-                # Required files for OOXML/ODF
-                required_files = {
-                    ".docx": [
-                        "[Content_Types].xml",
-                        "word/document.xml",
-                    ],
-                    ".xlsx": [
-                        "[Content_Types].xml",
-                        "xl/workbook.xml",
-                    ],
-                    ".pptx": [
-                        "[Content_Types].xml",
-                        "ppt/presentation.xml",
-                    ],
-                    ".odt": [
-                        "mimetype",
-                        "content.xml",
-                    ],
-                    ".ods": [
-                        "mimetype",
-                        "content.xml",
-                    ],
-                    ".odp": [
-                        "mimetype",
-                        "content.xml",
-                    ],
-                }
-
+            if ext is None:
                 ext = file_path.suffix.lower()
-                if ext in required_files:
-                    for req_file in required_files[ext]:
-                        if req_file not in file_list:
-                            # Check for case-insensitive match (some ODF files might have different case)
-                            if not any(
-                                f.lower() == req_file.lower() for f in file_list
-                            ):
-                                msg = (
-                                    f"Missing required file in {ext} "
-                                    f"archive: {req_file}"
-                                )
-                                return ValidationResult(valid=False, messages=[msg])
-
-            return ValidationResult(valid=True)
+            if required is None:
+                required = _REQUIRED_FILES.get(ext, ())
+            if required:
+                req_file = cls._find_missing_part(file_path, required)
+                if req_file is not None:
+                    msg = f"Missing required file in {ext} archive: {req_file}"
+                    return ValidationResult(is_valid=False, message=msg)
+
+            return ValidationResult(is_valid=True, message="Valid office document")
 
         except Exception as e:
             error_msg = f"Error validating office document {file_path}: {str(e)}"
-            return ValidationResult(valid=False, messages=[error_msg])
+            return ValidationResult(is_valid=False, message=error_msg)
+
+    @staticmethod
+    def _find_missing_part(file_path: Path, required: Sequence[str]) -> Optional[str]:
+        """Return the first required part missing from a ZIP container.
+
+        Names are read straight from the central directory and the scan stops
+        as soon as every required part has been seen. Matching is
+        case-insensitive, since some ODF files use different case.
 
-    def _validate_legacy_office(self, file_path: Path) -> ValidationResult:
+        Args:
+            file_path: Path to the ZIP container
+            required: Names of the parts the document must contain
+
+        Returns:
+            The first missing part in required's order, or None
+        """
+        remaining = {name.lower(): name for name in required}
+
+        def scan(names: Iterable[str]) -> None:
+            for name in names:
+                remaining.pop(name.lower(), None)
+                if not remaining:
+                    return
+
+        central_directory = _read_central_directory(file_path)
+        if central_directory is not None:
+            scan(_iter_central_directory_names(central_directory))
+        else:
+            with zipfile.ZipFile(file_path, "r") as zf:
+                scan(zf.NameToInfo)
+
+        return next((name for name in required if name.lower() in remaining), None)
+
+    @classmethod
+    def _validate_legacy_office(
+        cls, file_path: Path, size: Optional[int] = None
+    ) -> ValidationResult:
         """
         Perform basic validation for legacy MS Office formats.
 
         Args:
             file_path: Path to the file to validate
+            size: The file's size, if the caller has already stat'ed it
 
         Returns:
             ValidationResult indicating whether the file is valid
@@ -163,57 +371,49 @@ class OfficeValidator(BaseValidator):
         # For legacy formats, we can only check if the file is not empty
         # and has the correct extension
         try:
-            if file_path.stat().st_size == 0:
+            if size is None:
+                size = file_path.stat().st_size
+            if size == 0:
                 return ValidationResult(
-                    valid=False, messages=[f"File is empty: {file_path}"]
+                    is_valid=False, message=f"File is empty: {file_path}"
                 )
 
-            # Check if the file starts with the expected signature
-            # This is a very basic check and not foolproof
-            with open(file_path, "rb") as f:
-                header = f.read(8)
-
-                # Check for OLE Compound File format (used by legacy Office formats)
-                if header.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
-                    return ValidationResult(valid=True)
-
-                # Check for OOXML/ODF files with wrong extension
-                if header.startswith(b"PK\x03\x04"):
+            # Check the leading bytes against the known signatures: an OLE
+            # Compound File (legacy Office) or an OOXML/ODF ZIP container
+            # with the wrong extension. This is a very basic check and not
+            # foolproof
+            header = cls._read_signature(file_path)
+            for signature, is_valid, message in _LEGACY_SIGNATURES:
+                if header.startswith(signature):
                     return ValidationResult(
-                        valid=False,
-                        messages=[
-                            f"File appears to be an OOXML/ODF file with wrong extension: {file_path}"
-                        ],
+                        is_valid=is_valid, message=message.format(path=file_path)
                     )
 
-                return ValidationResult(
-                    valid=False, messages=[f"Invalid office document: {file_path}"]
-                )
+            return ValidationResult(
+                is_valid=False, message=f"Invalid office document: {file_path}"
+            )
 
         except Exception as e:
             return ValidationResult(
-                valid=False,
-                messages=[
+                is_valid=False,
+                message=(
                     f"Error validating legacy office document {file_path}: {str(e)}"
-                ],
+                ),
             )
 
-    def _check_legacy_office(self, file_path: Path) -> ValidationResult:
+    @classmethod
+    def _check_legacy_office(cls, file_path: Path) -> ValidationResult:
         """Check if the file is a valid legacy office document."""
         try:
             # Legacy office files have a specific header
-            with open(file_path, "rb") as f:
-                header = f.read(8)
-                if header.startswith(b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"):
-                    return ValidationResult(
-                        is_valid=True,
-                        message=(
-                            f"Valid legacy office document: " f"{file_path.suffix}"
-                        ),
-                    )
+            if cls._read_signature(file_path).startswith(_OLE_MAGIC):
                 return ValidationResult(
-                    is_valid=False, message="Not a valid legacy office document"
+                    is_valid=True,
+                    message=f"Valid legacy office document: {file_path.suffix}",
                 )
+            return ValidationResult(
+                is_valid=False, message="Not a valid legacy office document"
+            )
 
         except Exception as e:
             return ValidationResult(
@@ -227,57 +427,36 @@ class OfficeValidator(BaseValidator):
 class DocxValidator(OfficeValidator):
     """Validator for DOCX files."""
 
-    MIME_TYPES = {
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": [
-            ".docx"
-        ],
-    }
     EXTENSIONS = [".docx"]
 
 
 class XlsxValidator(OfficeValidator):
     """Validator for XLSX files."""
 
-    MIME_TYPES = {
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": [".xlsx"],
-    }
     EXTENSIONS = [".xlsx"]
 
 
 class PptxValidator(OfficeValidator):
     """Validator for PPTX files."""
 
-    MIME_TYPES = {
-        "application/vnd.openxmlformats-officedocument"
-        ".presentationml.presentation": [".pptx"],
-    }
     EXTENSIONS = [".pptx"]
 
 
 class OdtValidator(OfficeValidator):
     """Validator for ODT files."""
 
-    MIME_TYPES = {
-        "application/vnd.oasis.opendocument.text": [".odt"],
-    }
     EXTENSIONS = [".odt"]
 
 
 class OdsValidator(OfficeValidator):
     """Validator for ODS files."""
 
-    MIME_TYPES = {
-        "application/vnd.oasis.opendocument.spreadsheet": [".ods"],
-    }
     EXTENSIONS = [".ods"]
 
 
 class OdpValidator(OfficeValidator):
     """Validator for ODP files."""
 
-    MIME_TYPES = {
-        "application/vnd.oasis.opendocument.presentation": [".odp"],
-    }
     EXTENSIONS = [".odp"]
 
 
@@ -285,25 +464,16 @@ class OdpValidator(OfficeValidator):
 class DocValidator(OfficeValidator):
     """Validator for legacy DOC files."""
 
-    MIME_TYPES = {
-        "application/msword": [".doc"],
-    }
     EXTENSIONS = [".doc"]
 
 
 class XlsValidator(OfficeValidator):
     """Validator for legacy XLS files."""
 
-    MIME_TYPES = {
-        "application/vnd.ms-excel": [".xls"],
-    }
     EXTENSIONS = [".xls"]
 
 
 class PptValidator(OfficeValidator):
     """Validator for legacy PPT files."""
 
-    MIME_TYPES = {
-        "application/vnd.ms-powerpoint": [".ppt"],
-    }
     EXTENSIONS = [".ppt"]
@@ -1,42 +1,222 @@
 """Validator for PDF files."""
 
+import functools
+import mmap
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-from .base import BaseValidator, ValidationResult
-
-# Try to import PyPDF2 for more thorough PDF validation
-HAS_PYPDF2 = False
-try:
-    import PyPDF2
-
-    HAS_PYPDF2 = True
-except ImportError:
-    pass
+from stat import S_ISREG
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from .base import (
+    IO_BOUND_WORKERS,
+    BaseValidator,
+    ValidationResult,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pypdf2() -> Optional[Tuple[Any, Type[Exception]]]:
+    """Lazy import of PyPDF2 for more thorough PDF validation.
+
+    PyPDF2 is optional and only imported once a PDF needs it.
+
+    Returns:
+        Tuple of (PyPDF2 module, its PdfReadError), or None if unavailable
+    """
+    try:
+        import PyPDF2
+    except ImportError:
+        return None
+
+    try:
+        from PyPDF2.errors import PdfReadError
+    except ImportError:  # PyPDF2 < 2.0
+        from PyPDF2.utils import PdfReadError
+
+    return PyPDF2, PdfReadError
+
+
+# The %%EOF marker must start within this many bytes of the end of file
+_EOF_SEARCH_SIZE = 1024
+
+# Tail reads start on a multiple of this, so they cover whole pages
+_READ_ALIGNMENT = 4096
+
+# The final startxref keyword and the offset after it, near the end of file
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+
+# Cross-reference subsection header ("first count") in a classic xref table
+_XREF_SUBSECTION_RE = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*(?:\r\n|\r|\n)")
+
+# Fixed size of each classic xref entry ("oooooooooo ggggg n\r\n")
+_XREF_ENTRY_SIZE = 20
+
+# Object header at an xref offset, and the references and counts needed
+_OBJ_HEADER_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj\b")
+_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+(\d+)\s+R")
+_PAGES_RE = re.compile(rb"/Pages\s+(\d+)\s+(\d+)\s+R")
+# A direct /Count only; the (?!\d) alternative stops the number being cut
+# short to slip past the lookahead for an indirect "/Count 16 0 R"
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)(?!\d|\s+\d+\s+R)")
+_PREV_RE = re.compile(rb"/Prev\s+(\d+)")
+_ENCRYPT_RE = re.compile(rb"/Encrypt(?![A-Za-z])")
+
+# Upper bound on /Prev links followed, against malformed or looping chains
+_MAX_XREF_SECTIONS = 64
+
+
+def _read_trailer(mm: "mmap.mmap") -> Optional[Dict[str, Any]]:
+    """Read the trailer of a PDF from its tail, without building a reader.
+
+    The final startxref offset is followed to either a classic xref table,
+    whose subsections and trailer (and those of earlier revisions, via
+    /Prev) are indexed, or a cross-reference stream, whose dictionary
+    stands in for the trailer.
+
+    Args:
+        mm: The PDF file, mapped read-only
+
+    Returns:
+        Dict with "trailer" (the newest trailer dictionary's bytes) and
+        "sections" (list of (first, count, entries offset), newest first;
+        empty for cross-reference streams), or None if the structure is
+        not understood
+    """
+    size = len(mm)
+    tail_start = max(0, size - 1024)
+    matches = list(_STARTXREF_RE.finditer(mm, tail_start))
+    if not matches:
+        return None
+    offset = int(matches[-1].group(1))
+
+    trailer = None
+    sections: List[Tuple[int, int, int]] = []
+    seen = set()
+    while offset not in seen and len(seen) < _MAX_XREF_SECTIONS:
+        seen.add(offset)
+        if offset >= size:
+            return None
+        if mm[offset : offset + 4] != b"xref":
+            # A cross-reference stream: its dictionary holds the trailer keys
+            if trailer is not None or not _OBJ_HEADER_RE.match(mm, offset):
+                return None
+            end = mm.find(b"stream", offset)
+            if end < 0:
+                return None
+            return {"trailer": mm[offset:end], "sections": []}
+
+        pos = offset + 4
+        while True:
+            match = _XREF_SUBSECTION_RE.match(mm, pos)
+            if match is None:
+                break
+            first, count = int(match.group(1)), int(match.group(2))
+            sections.append((first, count, match.end()))
+            pos = match.end() + count * _XREF_ENTRY_SIZE
+
+        start = mm.find(b"trailer", pos)
+        end = mm.find(b"startxref", start)
+        if start < 0 or end < 0:
+            return None
+        section_trailer = mm[start:end]
+        if trailer is None:
+            trailer = section_trailer
+
+        prev = _PREV_RE.search(section_trailer)
+        if prev is None:
+            break
+        offset = int(prev.group(1))
+
+    return {"trailer": trailer, "sections": sections}
+
+
+def _read_object(
+    mm: "mmap.mmap", sections: List[Tuple[int, int, int]], num: int, gen: int
+) -> Optional[bytes]:
+    """Return the body of an uncompressed object found through the xref.
+
+    Args:
+        mm: The PDF file, mapped read-only
+        sections: Subsections from _read_trailer(), newest first
+        num: Object number
+        gen: Generation number
+
+    Returns:
+        The bytes between "obj" and "endobj", or None if the object is not
+        an in-use entry of a classic xref table
+    """
+    for first, count, entries in sections:
+        if first <= num < first + count:
+            pos = entries + (num - first) * _XREF_ENTRY_SIZE
+            entry = mm[pos : pos + _XREF_ENTRY_SIZE].split()
+            if len(entry) < 3 or entry[2] != b"n" or int(entry[1]) != gen:
+                return None
+            offset = int(entry[0])
+            header = _OBJ_HEADER_RE.match(mm, offset)
+            if header is None or int(header.group(1)) != num:
+                return None
+            end = mm.find(b"endobj", header.end())
+            return mm[header.end() : end] if end >= 0 else None
+    return None
+
+
+def _page_count_from_trailer(mm: "mmap.mmap") -> Optional[int]:
+    """Read /Count from the document's root page tree node via the xref.
+
+    Returns:
+        The page count, or None if it cannot be read without a full parser
+    """
+    trailer = _read_trailer(mm)
+    if trailer is None or not trailer["sections"]:
+        return None
+    root = _ROOT_RE.search(trailer["trailer"])
+    if root is None:
+        return None
+    catalog = _read_object(mm, trailer["sections"], *map(int, root.groups()))
+    pages_ref = _PAGES_RE.search(catalog) if catalog is not None else None
+    if pages_ref is None:
+        return None
+    pages = _read_object(mm, trailer["sections"], *map(int, pages_ref.groups()))
+    count = _COUNT_RE.search(pages) if pages is not None else None
+    return int(count.group(1)) if count is not None else None
 
 
 class PdfValidator(BaseValidator):
     """Validator for PDF files."""
 
+    # Validation is mostly file reads, so batches use more threads than cores
+    MAX_WORKERS = IO_BOUND_WORKERS
+
+    # Whether validate() collects page count, metadata and outline by default;
+    # when False, parsing the document with PyPDF2 is the only extra check
+    DEEP: bool = True
+
     @classmethod
-    def validate(cls, file_path: str) -> ValidationResult:
+    def validate(
+        cls, file_path: str, *, deep: Optional[bool] = None
+    ) -> ValidationResult:
         """Validate a PDF file.
 
         Args:
             file_path: Path to the PDF file to validate
+            deep: Collect document details (True) or only check that the
+                document parses (False); defaults to the class's DEEP setting
 
         Returns:
             ValidationResult indicating whether the PDF is valid
         """
         try:
-            # First check if the file exists and is readable
-            path = Path(file_path)
-            if not path.exists():
+            # First check if the file exists and is readable (one stat call)
+            path = file_path if isinstance(file_path, Path) else Path(file_path)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
                 return ValidationResult(
                     is_valid=False, message=(f"File not found: {file_path}")
                 )
 
-            if not path.is_file():
+            if not S_ISREG(st.st_mode):
                 return ValidationResult(
                     is_valid=False, message=f"Not a file: {file_path}"
                 )
@@ -47,38 +227,51 @@ class PdfValidator(BaseValidator):
                     is_valid=False, message=f"Not a PDF file: {file_path}"
                 )
 
-            # Basic PDF validation - check file header
-            with open(file_path, "rb") as f:
-                header = f.read(1024)
-
-                # Check for PDF header
-                if not header.startswith(b"%PDF-"):
-                    return ValidationResult(
-                        is_valid=False,
-                        message=(
-                            "File does not appear to be a valid PDF "
-                            "(missing PDF header)"
-                        ),
-                    )
+            # Basic PDF validation - check the header and the EOF marker in
+            # the last 1024 bytes. The tail is read from a page boundary, so
+            # files up to 4 KiB (plus the marker window) take a single read
+            size = st.st_size
+            with open(file_path, "rb", buffering=0) as f:
+                eof_start = max(0, size - _EOF_SEARCH_SIZE)
+                tail_start = eof_start - eof_start % _READ_ALIGNMENT
+                f.seek(tail_start)
+                tail = f.read(size - tail_start)
+                if tail_start == 0:
+                    header = tail[:5]
+                else:
+                    f.seek(0)
+                    header = f.read(5)
+            has_header = header == b"%PDF-"
+            has_eof = tail.rfind(b"%%EOF", eof_start - tail_start) != -1
+
+            # Check for PDF header
+            if not has_header:
+                return ValidationResult(
+                    is_valid=False,
+                    message=(
+                        "File does not appear to be a valid PDF "
+                        "(missing PDF header)"
+                    ),
+                )
 
-                # Check for EOF marker
-                f.seek(-1024, 2)  # Go to the end of the file
-                footer = f.read()
-                if b"%%EOF" not in footer:
-                    return ValidationResult(
-                        is_valid=False,
-                        message="PDF is missing EOF marker (may be corrupted)",
-                    )
+            # Check for EOF marker
+            if not has_eof:
+                return ValidationResult(
+                    is_valid=False,
+                    message="PDF is missing EOF marker (may be corrupted)",
+                )
 
             # If PyPDF2 is available, do more thorough validation
-            if PyPDF2:
-                return cls._validate_with_pypdf2(file_path)
+            if _get_pypdf2() is not None:
+                return cls._validate_with_pypdf2(
+                    file_path, deep=cls.DEEP if deep is None else deep
+                )
 
             # Otherwise, just do basic validation
             return ValidationResult(
                 is_valid=True,
                 message="File appears to be a valid PDF (basic validation only)",
-                details={"size": path.stat().st_size, "validated_with": "basic"},
+                details={"size": size, "validated_with": "basic"},
             )
 
         except Exception as e:
@@ -89,19 +282,33 @@ class PdfValidator(BaseValidator):
             )
 
     @classmethod
-    def _validate_with_pypdf2(cls, file_path: str) -> ValidationResult:
+    def _validate_with_pypdf2(
+        cls, file_path: str, deep: bool = True
+    ) -> ValidationResult:
         """Validate a PDF file using PyPDF2.
 
         Args:
             file_path: Path to the PDF file to validate
+            deep: Also read metadata, pages and outline for the details
 
         Returns:
             ValidationResult indicating whether the PDF is valid
         """
+        PyPDF2, PdfReadError = _get_pypdf2()
         try:
             with open(file_path, "rb") as f:
-                # Create a PDF reader object
+                # Create a PDF reader object; this parses the trailer and
+                # cross-reference table, which is all a shallow check needs
                 pdf_reader = PyPDF2.PdfReader(f)
+                if not deep:
+                    return ValidationResult(
+                        is_valid=True,
+                        message="Valid PDF",
+                        details={
+                            "size": os.fstat(f.fileno()).st_size,
+                            "validated_with": "pypdf2",
+                        },
+                    )
 
                 # Get document info
                 info = {}
@@ -129,12 +336,18 @@ class PdfValidator(BaseValidator):
                     outline = cls._extract_outline(pdf_reader.outline)
 
                 dimensions = ""
-                if hasattr(pdf_reader.pages[0], "mediaBox"):
-                    media_box = pdf_reader.pages[0].mediaBox
-                    dimensions = f"{media_box.width:.1f}x{media_box.height:.1f} points"
+                if num_pages:
+                    # PyPDF2 2.0 renamed mediaBox to mediabox
+                    first_page = pdf_reader.pages[0]
+                    media_box = getattr(first_page, "mediabox", None) or getattr(
+                        first_page, "mediaBox", None
+                    )
+                    if media_box is not None:
+                        width, height = media_box.width, media_box.height
+                        dimensions = f"{width:.1f}x{height:.1f} points"
 
                 metadata = {
-                    "size": Path(file_path).stat().st_size,
+                    "size": os.fstat(f.fileno()).st_size,
                     "page_count": num_pages,
                     "is_encrypted": is_encrypted,
                     "info": {k: v for k, v in info.items() if v},
@@ -148,7 +361,7 @@ class PdfValidator(BaseValidator):
                     details=metadata,
                 )
 
-        except PyPDF2.PdfReadError as e:
+        except PdfReadError as e:
             return ValidationResult(
                 is_valid=False,
                 message=f"Invalid PDF file: {str(e)}",
@@ -161,12 +374,22 @@ class PdfValidator(BaseValidator):
         outline_items: List[Any],
         level: int = 0,
     ) -> List[Dict[str, Any]]:
-        """Extract outline items recursively."""
+        """Extract outline items depth-first, in document order.
+
+        A stack of iterators replaces recursion, so deep outlines need no
+        Python frames or intermediate lists per level.
+        """
         result = []
-        for item in outline_items:
-            if isinstance(item, list):
+        done = object()
+        stack = [(iter(outline_items), level)]
+        while stack:
+            items, level = stack[-1]
+            item = next(items, done)
+            if item is done:
+                stack.pop()
+            elif isinstance(item, list):
                 # This is a nested list of outline items
-                result.extend(cls._extract_outline(item, level + 1))
+                stack.append((iter(item), level + 1))
             elif hasattr(item, "title"):
                 # This is an outline item
                 outline_item = {"title": item.title, "level": level}
@@ -179,31 +402,51 @@ class PdfValidator(BaseValidator):
 
                 # Process any children
                 if hasattr(item, "children") and item.children:
-                    result.extend(cls._extract_outline(item.children, level + 1))
+                    stack.append((iter(item.children), level + 1))
 
         return result
 
+    @staticmethod
+    def _map_pdf(file_path: str) -> Optional[mmap.mmap]:
+        """Map a file read-only, or return None if it is empty."""
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
     @classmethod
     def get_page_count(cls, file_path: str) -> Tuple[bool, int, str]:
         """Get the number of pages in a PDF file.
 
+        The count is read from the page tree root found through the trailer
+        and xref table; PyPDF2 is only needed for files using
+        cross-reference streams or compressed objects.
+
         Args:
             file_path: Path to the PDF file
 
         Returns:
             Tuple of (success, page_count, message)
         """
-        if not HAS_PYPDF2:
+        try:
+            mm = cls._map_pdf(file_path)
+            if mm is not None:
+                with mm:
+                    num_pages = _page_count_from_trailer(mm)
+                if num_pages is not None:
+                    return True, num_pages, f"PDF has {num_pages} pages"
+        except (OSError, ValueError):
+            pass
+
+        pypdf2 = _get_pypdf2()
+        if pypdf2 is None:
             return False, 0, "PyPDF2 is required for page count"
 
         try:
             with open(file_path, "rb") as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                return (
-                    True,
-                    len(pdf_reader.pages),
-                    f"PDF has {len(pdf_reader.pages)} pages",
-                )
+                pdf_reader = pypdf2[0].PdfReader(f)
+                num_pages = len(pdf_reader.pages)
+                return True, num_pages, f"PDF has {num_pages} pages"
         except Exception as e:
             return False, 0, f"Error getting page count: {str(e)}"
 
@@ -211,24 +454,39 @@ class PdfValidator(BaseValidator):
     def is_encrypted(cls, file_path: str) -> Tuple[bool, bool, str]:
         """Check if a PDF file is encrypted.
 
+        Encryption is recorded by an /Encrypt entry in the trailer (or the
+        cross-reference stream dictionary), so the tail of the file is
+        usually all that is read; PyPDF2 is the fallback.
+
         Args:
             file_path: Path to the PDF file
 
         Returns:
             Tuple of (success, is_encrypted, message)
         """
-        if not HAS_PYPDF2:
-            return False, False, "PyPDF2 is required for encryption check"
-
+        encrypted = None
         try:
-            with open(file_path, "rb") as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                return (
-                    True,
-                    pdf_reader.is_encrypted,
-                    "PDF is encrypted"
-                    if pdf_reader.is_encrypted
-                    else "PDF is not encrypted",
-                )
-        except Exception as e:
-            return False, False, f"Error checking encryption: {str(e)}"
+            mm = cls._map_pdf(file_path)
+            if mm is not None:
+                with mm:
+                    trailer = _read_trailer(mm)
+                if trailer is not None:
+                    encrypted = bool(_ENCRYPT_RE.search(trailer["trailer"]))
+        except (OSError, ValueError):
+            pass
+
+        if encrypted is None:
+            pypdf2 = _get_pypdf2()
+            if pypdf2 is None:
+                return False, False, "PyPDF2 is required for encryption check"
+            try:
+                with open(file_path, "rb") as f:
+                    encrypted = pypdf2[0].PdfReader(f).is_encrypted
+            except Exception as e:
+                return False, False, f"Error checking encryption: {str(e)}"
+
+        return (
+            True,
+            encrypted,
+            "PDF is encrypted" if encrypted else "PDF is not encrypted",
+        )
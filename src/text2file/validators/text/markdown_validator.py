@@ -1,27 +1,41 @@
 """Validator for Markdown files."""
 
+import codecs
+import io
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from ...utils.file_utils import get_file_extension, is_binary_file
-from ..base import BaseValidator, ValidationResult
+from ...utils.file_utils import get_file_extension
+from ..base import (
+    IO_BOUND_WORKERS,
+    BaseValidator,
+    ValidationResult,
+)
+
+# Buffer size for reading Markdown files line by line
+_READ_BUFFER_SIZE = 1 << 16
+
+# Leading bytes checked for binary content (as is_binary_file() does)
+_BINARY_PROBE_SIZE = 1024
 
 
 class MarkdownValidator(BaseValidator):
     """Validator for Markdown (.md, .markdown) files."""
 
+    # Validation is mostly file reads, so batches use more threads than cores
+    MAX_WORKERS = IO_BOUND_WORKERS
+
     # Common markdown file extensions
-    MARKDOWN_EXTENSIONS = ["md", "markdown", "mdown", "mkd", "mkdn"]
+    MARKDOWN_EXTENSIONS = frozenset(("md", "markdown", "mdown", "mkd", "mkdn"))
 
-    # Common markdown patterns
-    HEADER_PATTERN = r"^#{1,6}\s+.+$"
-    LIST_PATTERN = r"^[\s]*[-*+]\s+.+$"
-    ORDERED_LIST_PATTERN = r"^[\s]*\d+\.\s+.+$"
-    CODE_BLOCK_PATTERN = r"```[\s\S]*?```|~~~[\s\S]*?~~~"
-    LINK_PATTERN = r"\[([^\]]+)\]\(([^)]+)\)"
-    IMAGE_PATTERN = r"!\[([^\]]*)\]\(([^)]+)\)"
+    # Common markdown patterns (compiled once, with their flags)
+    HEADER_PATTERN = re.compile(r"^#{1,6}\s+.+$", re.MULTILINE)
+    LIST_PATTERN = re.compile(r"^[\s]*[-*+]\s+.+$", re.MULTILINE)
+    ORDERED_LIST_PATTERN = re.compile(r"^[\s]*\d+\.\s+.+$", re.MULTILINE)
+    LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+    IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
 
     @classmethod
     def validate(cls, file_path: Union[str, Path]) -> ValidationResult:
@@ -39,7 +53,8 @@ class MarkdownValidator(BaseValidator):
         Returns:
             ValidationResult indicating whether the file is valid
         """
-        file_path = Path(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
         details: Dict[str, Any] = {}
 
         # Check if file exists
@@ -60,49 +75,37 @@ class MarkdownValidator(BaseValidator):
 
         # Check file extension
         ext = get_file_extension(file_path)
-        if ext.lower() not in cls.MARKDOWN_EXTENSIONS:
+        if ext not in cls.MARKDOWN_EXTENSIONS:
             details["extension"] = ext
-            details["expected_extensions"] = cls.MARKDOWN_EXTENSIONS
+            details["expected_extensions"] = sorted(cls.MARKDOWN_EXTENSIONS)
             return ValidationResult(
                 is_valid=False,
                 message=f"Invalid file extension for Markdown: {ext}",
                 details=details,
             )
 
-        # Check if file is binary
-        if is_binary_file(file_path):
-            return ValidationResult(
-                is_valid=False,
-                message=f"File appears to be a binary file, not Markdown: {file_path}",
-                details=details,
-            )
-
-        # Read file content
+        # Read file content line by line instead of loading it whole
         try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-
-            # Check for common markdown patterns
-            has_header = bool(re.search(cls.HEADER_PATTERN, content, re.MULTILINE))
-            has_list = bool(re.search(cls.LIST_PATTERN, content, re.MULTILINE))
-            has_ordered_list = bool(
-                re.search(cls.ORDERED_LIST_PATTERN, content, re.MULTILINE)
-            )
-            has_code_block = bool(
-                re.search(cls.CODE_BLOCK_PATTERN, content, re.MULTILINE)
-            )
-            has_link = bool(re.search(cls.LINK_PATTERN, content))
-            has_image = bool(re.search(cls.IMAGE_PATTERN, content))
-
-            # Check for common markdown elements
-            markdown_elements = {
-                "headers": has_header,
-                "unordered_lists": has_list,
-                "ordered_lists": has_ordered_list,
-                "code_blocks": has_code_block,
-                "links": has_link,
-                "images": has_image,
-            }
+            with open(file_path, "rb", buffering=_READ_BUFFER_SIZE) as raw:
+                # Check if file is binary, using the bytes the first read
+                # buffers anyway instead of opening the file a second time
+                if cls._is_binary_head(raw.peek(_BINARY_PROBE_SIZE)):
+                    return ValidationResult(
+                        is_valid=False,
+                        message=(
+                            "File appears to be a binary file, not Markdown: "
+                            f"{file_path}"
+                        ),
+                        details=details,
+                    )
+
+                f = io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+                (
+                    markdown_elements,
+                    unclosed_fence,
+                    unclosed_links,
+                    unclosed_images,
+                ) = cls._scan_lines(f)
 
             details["markdown_elements"] = markdown_elements
 
@@ -116,18 +119,14 @@ class MarkdownValidator(BaseValidator):
             errors = []
 
             # Check for unclosed code blocks
-            code_block_delimiters = re.findall(r"```|~~~", content)
-            if len(code_block_delimiters) % 2 != 0:
+            if unclosed_fence:
                 errors.append("Unclosed code block detected")
 
             # Check for unclosed links or images
-            unclosed_links = re.findall(r"\[[^\]]*$", content, re.MULTILINE)
-            unclosed_images = re.findall(r"!\[[^\]]*$", content, re.MULTILINE)
-
             if unclosed_links:
-                errors.append(f"Found {len(unclosed_links)} unclosed link(s)")
+                errors.append(f"Found {unclosed_links} unclosed link(s)")
             if unclosed_images:
-                errors.append(f"Found {len(unclosed_images)} unclosed image(s)")
+                errors.append(f"Found {unclosed_images} unclosed image(s)")
 
             if errors:
                 details["errors"] = errors
@@ -150,10 +149,87 @@ class MarkdownValidator(BaseValidator):
                 details=details,
             )
 
+    @staticmethod
+    def _is_binary_head(head: bytes) -> bool:
+        """Check the leading bytes of a file for NUL bytes or invalid UTF-8.
+
+        Args:
+            head: Bytes from the start of the file; more than
+                _BINARY_PROBE_SIZE bytes may be passed
+
+        Returns:
+            True if the file appears to be binary
+        """
+        head = head[:_BINARY_PROBE_SIZE]
+        if b"\x00" in head:
+            return True
+        try:
+            # A character cut at the probe's end only counts at EOF
+            codecs.utf_8_decode(head, "strict", len(head) < _BINARY_PROBE_SIZE)
+        except UnicodeDecodeError:
+            return True
+        return False
+
+    @classmethod
+    def _scan_lines(
+        cls, lines: Iterable[str]
+    ) -> Tuple[Dict[str, bool], bool, int, int]:
+        """Detect Markdown elements and syntax errors in a single pass.
+
+        Every check is line-local, so the file never has to be held in
+        memory; element patterns stop being tried once they have matched.
+
+        Args:
+            lines: The file's lines, e.g. an open text file
+
+        Returns:
+            Tuple of (markdown_elements, unclosed_fence, unclosed_links,
+            unclosed_images)
+        """
+        markdown_elements = dict.fromkeys(
+            (
+                "headers",
+                "unordered_lists",
+                "ordered_lists",
+                "code_blocks",
+                "links",
+                "images",
+            ),
+            False,
+        )
+        pending = [
+            ("headers", cls.HEADER_PATTERN),
+            ("unordered_lists", cls.LIST_PATTERN),
+            ("ordered_lists", cls.ORDERED_LIST_PATTERN),
+            ("links", cls.LINK_PATTERN),
+            ("images", cls.IMAGE_PATTERN),
+        ]
+        backtick_fences = tilde_fences = 0
+        unclosed_links = unclosed_images = 0
+
+        for line in lines:
+            if pending:
+                remaining = []
+                for name, pattern in pending:
+                    if pattern.search(line):
+                        markdown_elements[name] = True
+                    else:
+                        remaining.append((name, pattern))
+                pending = remaining
+
+            # A fence cannot span lines, so per-line counts add up exactly
+            backtick_fences += line.count("```")
+            tilde_fences += line.count("~~~")
+
+            if "[" in line:
+                # Link or image text still open at the end of the line: a
+                # "[" (or "![") after the line's last "]", at most once each
+                close = line.rfind("]")
+                unclosed_links += line.find("[", close + 1) >= 0
+                unclosed_images += line.find("![", close + 1) >= 0
+
+        # A code block is a pair of fences with the same delimiter
+        markdown_elements["code_blocks"] = backtick_fences >= 2 or tilde_fences >= 2
+        unclosed_fence = (backtick_fences + tilde_fences) % 2 != 0
+        return markdown_elements, unclosed_fence, unclosed_links, unclosed_images
 
-# Register the validator
-BaseValidator.register_validator("md", MarkdownValidator)
-BaseValidator.register_validator("markdown", MarkdownValidator)
-BaseValidator.register_validator("mdown", MarkdownValidator)
-BaseValidator.register_validator("mkd", MarkdownValidator)
-BaseValidator.register_validator("mkdn", MarkdownValidator)
@@ -1,20 +1,56 @@
 """Validator for shell script files."""
 
+import codecs
+import functools
+import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from stat import S_ISREG
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from ...utils.file_utils import get_file_extension, is_binary_file
-from ..base import BaseValidator, ValidationResult
+from ...utils.file_utils import get_file_extension
+from ..base import (
+    IO_BOUND_WORKERS,
+    BaseValidator,
+    ValidationResult,
+)
+from ..text_validator import TextFileValidator
+
+# Bytes scanned first; enough for the shebang and most scripts' shell patterns
+_HEAD_SIZE = 4096
+
+# Most bytes scanned for shell patterns when the head has too few of them
+_SCAN_LIMIT = 1 << 16
+
+# Files passed to one shellcheck process by validate_many()
+_SHELLCHECK_BATCH_SIZE = 64
+
+# The file name that starts each line of shellcheck's gcc-style output
+_GCC_LINE_RE = re.compile(r"^(.+?):\d+:\d+: ")
+
+
+@functools.lru_cache(maxsize=1)
+def _shellcheck_path() -> Optional[str]:
+    """Locate the shellcheck executable once instead of searching PATH per call.
+
+    Returns:
+        Absolute path to shellcheck, or None if it is not installed
+    """
+    return shutil.which("shellcheck")
 
 
 class ShellScriptValidator(BaseValidator):
     """Validator for shell script (.sh) files."""
 
-    # Common shell script shebangs
-    SHELL_SHEBANGS = [
+    # Validation mostly waits on file reads and shellcheck processes, so
+    # batches use more threads than cores
+    MAX_WORKERS = IO_BOUND_WORKERS
+
+    # Common shell script shebangs (a tuple, so one startswith() tests all)
+    SHELL_SHEBANGS = (
         "#!/bin/sh",
         "#!/bin/bash",
         "#!/bin/zsh",
@@ -25,11 +61,27 @@ class ShellScriptValidator(BaseValidator):
         "#!/usr/bin/env zsh",
         "#!/usr/bin/env ksh",
         "#!/usr/bin/env dash",
-    ]
+    )
 
     # Common shell script file extensions
     SHELL_EXTENSIONS = ["sh", "bash", "zsh", "ksh", "csh", "fish"]
 
+    # Common shell patterns (compiled once). None is anchored, so no flags;
+    # the greedy ".*" stays, as CPython's engine scans it faster than an
+    # equivalent negated character class
+    SHELL_PATTERNS = (
+        re.compile(r"\$\{[^}]+\}"),  # ${variable}
+        re.compile(r"\$[a-zA-Z_][a-zA-Z0-9_]*"),  # $variable
+        re.compile(r"`.*`"),  # Command substitution
+        re.compile(r"\$\(.*\)"),  # $(command substitution)
+    )
+
+    # Distinct SHELL_PATTERNS below which a script gets a warning in its details
+    MIN_PATTERN_MATCHES = 2
+
+    # Scripts larger than this many bytes are not passed to shellcheck
+    MAX_SHELLCHECK_SIZE = 1 << 20
+
     def _parse_shebang(self, content: str) -> Tuple[Optional[str], Optional[str]]:
         """Parse the shebang line from shell script content.
 
@@ -54,7 +106,8 @@ class ShellScriptValidator(BaseValidator):
 
         return interpreter, path
 
-    def _run_shellcheck(self, filepath: Path) -> Tuple[bool, str]:
+    @staticmethod
+    def _run_shellcheck(filepath: Path) -> Tuple[bool, str]:
         """Run shellcheck on the shell script.
 
         Args:
@@ -63,33 +116,123 @@ class ShellScriptValidator(BaseValidator):
         Returns:
             Tuple of (is_valid, message)
         """
-        if not shutil.which("shellcheck"):
-            return False, "shellcheck is not installed"
+        return ShellScriptValidator._run_shellcheck_many([filepath])[str(filepath)]
+
+    @staticmethod
+    def _run_shellcheck_many(filepaths: Sequence[Path]) -> Dict[str, Tuple[bool, str]]:
+        """Run one shellcheck process over several shell scripts.
+
+        Args:
+            filepaths: Paths to the shell scripts
+
+        Returns:
+            Dict of str(path) -> (is_valid, message) for every path given
+        """
+        names = [str(filepath) for filepath in filepaths]
+        if _shellcheck_path() is None:
+            return dict.fromkeys(names, (False, "shellcheck is not installed"))
 
         try:
-            result = subprocess.run(
-                ["shellcheck", str(filepath)],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            proc = ShellScriptValidator._start_shellcheck(names)
+        except Exception as e:
+            return dict.fromkeys(names, (False, f"Error running shellcheck: {str(e)}"))
+        return ShellScriptValidator._collect_shellcheck(proc, names)
+
+    @staticmethod
+    def _start_shellcheck(names: Sequence[str]) -> "subprocess.Popen[str]":
+        """Start shellcheck on the given files without waiting for it.
+
+        Args:
+            names: Paths to the shell scripts, as strings
 
-            if result.returncode == 0:
-                return True, "Shellcheck validation passed"
-            return False, f"Shellcheck validation failed: {result.stderr}"
+        Returns:
+            The running process, reporting issues in gcc format
+
+        Raises:
+            OSError: If the process cannot be started
+        """
+        return subprocess.Popen(
+            [_shellcheck_path(), "-f", "gcc", "--", *names],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    @staticmethod
+    def _collect_shellcheck(
+        proc: "subprocess.Popen[str]", names: Sequence[str]
+    ) -> Dict[str, Tuple[bool, str]]:
+        """Wait for a shellcheck process and split its report by file.
+
+        Each gcc-format line starts with the file name, so one process can
+        cover many files.
 
+        Args:
+            proc: Process from _start_shellcheck()
+            names: The file names it was started with
+
+        Returns:
+            Dict of name -> (is_valid, message) for every name given
+        """
+        try:
+            stdout, stderr = proc.communicate()
         except Exception as e:
-            return False, f"Error running shellcheck: {str(e)}"
+            proc.kill()
+            proc.communicate()
+            return dict.fromkeys(names, (False, f"Error running shellcheck: {str(e)}"))
+
+        issues: Dict[str, List[str]] = {name: [] for name in names}
+        for line in stdout.splitlines():
+            match = _GCC_LINE_RE.match(line)
+            if match is not None and match.group(1) in issues:
+                issues[match.group(1)].append(line)
+
+        outcomes = {}
+        for name, lines in issues.items():
+            if lines:
+                output = "\n".join(lines)
+                outcomes[name] = (False, f"Shellcheck validation failed: {output}")
+            elif proc.returncode > 1:
+                # shellcheck itself failed (bad option, unreadable file, ...)
+                message = f"Shellcheck validation failed: {stderr}"
+                outcomes[name] = (False, message)
+            else:
+                outcomes[name] = (True, "Shellcheck validation passed")
+        return outcomes
+
+    @classmethod
+    def _count_patterns(cls, content: str) -> int:
+        """Count the distinct SHELL_PATTERNS found, up to the threshold.
+
+        Each pattern starts with "$" or "`", so content with neither
+        character needs no regex pass at all. Only whether the threshold is
+        reached matters, so the search stops once it is.
+
+        Args:
+            content: Text to search
+
+        Returns:
+            Number of patterns found, at most MIN_PATTERN_MATCHES
+        """
+        pattern_matches = 0
+        if "$" in content or "`" in content:
+            for pattern in cls.SHELL_PATTERNS:
+                if pattern.search(content):
+                    pattern_matches += 1
+                    if pattern_matches >= cls.MIN_PATTERN_MATCHES:
+                        break
+        return pattern_matches
 
     @classmethod
     def validate(cls, file_path: Union[str, Path]) -> ValidationResult:
         """Validate that the file is a valid shell script.
 
-        This checks:
-        1. File exists and is readable
-        2. File has a valid shell script extension
-        3. File starts with a valid shebang (optional but recommended)
-        4. File can be parsed by shellcheck (if available)
+        Any readable UTF-8 text file without control characters is valid.
+        The details report:
+        1. Whether the file is executable
+        2. A recognised shebang (optional but recommended)
+        3. A warning if the file has too few common shell patterns
+        4. Extension mismatches, and shellcheck findings (if available)
 
         Args:
             file_path: Path to the file to validate
@@ -99,84 +242,190 @@ class ShellScriptValidator(BaseValidator):
         """
         file_path = Path(file_path)
         details: Dict[str, Any] = {}
+        st = cls._stat(file_path)
+        skip_reason = cls._shellcheck_skip_reason(st)
+
+        # Start shellcheck before the Python-side checks so its startup
+        # overlaps them; its report is discarded if those checks fail
+        proc = None
+        if skip_reason is None and st is not None and S_ISREG(st.st_mode):
+            try:
+                proc = cls._start_shellcheck([str(file_path)])
+            except OSError:
+                pass
+
+        failure = cls._check_content(file_path, details)
+        if failure is not None:
+            if proc is not None:
+                proc.kill()
+                proc.communicate()
+            return failure
+
+        outcome = None
+        if proc is not None:
+            outcome = cls._collect_shellcheck(proc, [str(file_path)])[str(file_path)]
+        elif skip_reason is None:
+            outcome = cls._run_shellcheck(file_path)
+        return cls._shellcheck_result(details, outcome, skip_reason)
 
-        # Check if file exists
-        if not file_path.exists():
-            return ValidationResult(
-                is_valid=False,
-                message=f"File not found: {file_path}",
-                details=details,
-            )
+    @classmethod
+    def validate_many(
+        cls, file_paths: Iterable[Union[str, Path]], max_workers: Optional[int] = None
+    ) -> List[ValidationResult]:
+        """Validate many shell scripts with one shellcheck run per batch.
 
-        # Check file extension
-        ext = get_file_extension(file_path)
-        if ext.lower() not in cls.SHELL_EXTENSIONS:
-            details["info"] = f"Extension {ext} not in {cls.SHELL_EXTENSIONS}"
+        The Python-side checks run per file; the scripts that pass them are
+        handed to shellcheck together, up to _SHELLCHECK_BATCH_SIZE files
+        per process, instead of spawning one process per file. Both stages
+        run on a thread pool, so batches are checked concurrently.
+
+        Args:
+            file_paths: Paths of the files to validate
+            max_workers: Maximum number of worker threads (default: the
+                class's MAX_WORKERS)
 
-        # Check if file is binary
-        if is_binary_file(file_path):
-            return ValidationResult(
-                is_valid=False,
-                message=f"File appears to be binary: {file_path}",
-                details=details,
+        Returns:
+            One ValidationResult per path, in the same order as file_paths
+        """
+        paths = [Path(file_path) for file_path in file_paths]
+        stats = [cls._stat(path) for path in paths]
+        skip_reasons = [cls._shellcheck_skip_reason(st) for st in stats]
+        all_details: List[Dict[str, Any]] = [{} for _ in paths]
+
+        if max_workers is None:
+            max_workers = cls.MAX_WORKERS
+        outcomes: Dict[str, Tuple[bool, str]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            failures = list(executor.map(cls._check_content, paths, all_details))
+            pending = [
+                path
+                for i, path in enumerate(paths)
+                if failures[i] is None and skip_reasons[i] is None
+            ]
+            batches = [
+                pending[start : start + _SHELLCHECK_BATCH_SIZE]
+                for start in range(0, len(pending), _SHELLCHECK_BATCH_SIZE)
+            ]
+            for batch_outcomes in executor.map(cls._run_shellcheck_many, batches):
+                outcomes.update(batch_outcomes)
+
+        return [
+            cls._shellcheck_result(
+                all_details[i], outcomes.get(str(path)), skip_reasons[i]
             )
+            if failures[i] is None
+            else failures[i]
+            for i, path in enumerate(paths)
+        ]
+
+    @staticmethod
+    def _stat(file_path: Path) -> Optional[os.stat_result]:
+        """Stat a file once for the shellcheck size and type checks.
+
+        Args:
+            file_path: Path to the file
 
-        # Read file content
+        Returns:
+            The file's stat result, or None if it cannot be stat'ed
+        """
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return ValidationResult(
-                is_valid=False,
-                message="File is not a valid UTF-8 text file",
-                details=details,
-            )
+            return os.stat(file_path)
+        except (OSError, ValueError):
+            return None
 
-        # Check for common shell patterns
-        shell_patterns = [
-            r"\$\{[^}]+\}",  # ${variable}
-            r"\$[a-zA-Z_][a-zA-Z0-9_]*",  # $variable
-            r"`.*`",  # Command substitution
-            r"\$\(.*\)",  # $(command substitution)
-        ]
+    @classmethod
+    def _shellcheck_skip_reason(cls, st: Optional[os.stat_result]) -> Optional[str]:
+        """Tell why shellcheck should not be run on a file, if it should not.
 
-        pattern_matches = 0
-        for pattern in shell_patterns:
-            if re.search(pattern, content, re.MULTILINE):
-                pattern_matches += 1
-
-        if pattern_matches < 2:
-            return ValidationResult(
-                is_valid=False,
-                message=(
-                    f"File does not appear to be a valid shell script "
-                    f"(found only {pattern_matches} shell patterns)"
-                ),
-                details=details,
-            )
+        Args:
+            st: The file's stat result from _stat()
 
-        # Run shellcheck if available
-        is_valid, message = cls._run_shellcheck(file_path)
-        if not is_valid:
-            details["shellcheck_output"] = message
-            return ValidationResult(
-                is_valid=False,
-                message=f"Shell script validation failed ({message})",
-                details=details,
-            )
+        Returns:
+            The reason to report in the details, or None to run shellcheck
+        """
+        if _shellcheck_path() is None:
+            return "shellcheck is not installed"
+        if st is not None and st.st_size > cls.MAX_SHELLCHECK_SIZE:
+            return "file too large for shellcheck"
+        return None
+
+    @staticmethod
+    def _shellcheck_result(
+        details: Dict[str, Any],
+        outcome: Optional[Tuple[bool, str]],
+        skip_reason: Optional[str] = None,
+    ) -> ValidationResult:
+        """Build the final result for a script that passed the other checks.
+
+        Args:
+            details: Details collected so far (updated in place)
+            outcome: (is_valid, message) from shellcheck, or None if
+                shellcheck was skipped
+            skip_reason: Why shellcheck was skipped, if it was
 
-        details["info"] = "shellcheck is not installed, " "skipping advanced validation"
+        Returns:
+            ValidationResult object with the validation results
+        """
+        if outcome is None:
+            details["info"] = f"{skip_reason}, skipping advanced validation"
+        elif not outcome[0]:
+            # shellcheck findings are reported, not treated as invalid
+            details["shellcheck_output"] = outcome[1]
 
+        executable = "executable" if details["executable"] else "not executable"
         return ValidationResult(
             is_valid=True,
-            message="Shell script validation passed",
+            message=f"Valid shell script ({executable})",
             details=details,
         )
 
+    @classmethod
+    def _check_content(
+        cls, file_path: Path, details: Dict[str, Any]
+    ) -> Optional[ValidationResult]:
+        """Run every check except shellcheck.
+
+        Only the plain text checks can fail; the shebang, the shell patterns
+        found and whether the file is executable are added to the details.
+
+        Args:
+            file_path: Path to the file to validate
+            details: Dict the details found are added to
+
+        Returns:
+            The failing ValidationResult, or None if the checks passed
+        """
+        # First validate as a text file, keeping the bytes read for the scan
+        data, text_result = TextFileValidator._read_text(str(file_path))
+        if not text_result.is_valid:
+            return text_result
+
+        # Check file extension
+        ext = get_file_extension(file_path)
+        if ext.lower() not in cls.SHELL_EXTENSIONS:
+            details["info"] = f"Extension {ext} not in {cls.SHELL_EXTENSIONS}"
+
+        # The data is valid UTF-8, so decoding a slice only drops a character
+        # cut at its end
+        content = codecs.utf_8_decode(data[:_HEAD_SIZE], "strict", False)[0]
+
+        # A shebang is optional; a recognised one is reported
+        first_line = content.partition("\n")[0].strip()
+        if first_line.startswith(cls.SHELL_SHEBANGS):
+            details["shebang"] = first_line
+
+        # Scan the head first and more of the file only if it has too few
+        # shell patterns; too few is reported, not treated as invalid
+        pattern_matches = cls._count_patterns(content)
+        if pattern_matches < cls.MIN_PATTERN_MATCHES and len(data) > _HEAD_SIZE:
+            content = codecs.utf_8_decode(data[:_SCAN_LIMIT], "strict", False)[0]
+            pattern_matches = cls._count_patterns(content)
+        if pattern_matches < cls.MIN_PATTERN_MATCHES:
+            details["warning"] = (
+                f"File does not appear to be a shell script "
+                f"(found only {pattern_matches} shell patterns)"
+            )
 
-# Register the validator
-BaseValidator.register_validator("sh", ShellScriptValidator)
-BaseValidator.register_validator("bash", ShellScriptValidator)
-BaseValidator.register_validator("zsh", ShellScriptValidator)
-BaseValidator.register_validator("ksh", ShellScriptValidator)
-BaseValidator.register_validator("csh", ShellScriptValidator)
-BaseValidator.register_validator("fish", ShellScriptValidator)
+        # Check if file is executable (if on Unix-like system)
+        details["executable"] = hasattr(os, "access") and os.access(file_path, os.X_OK)
+        return None
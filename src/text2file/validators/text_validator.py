@@ -1,16 +1,102 @@
 """Validators for text-based file formats."""
 
+import codecs
 import csv
+import functools
+import io
 import json
+import mmap
 import os
+import re
 import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
 from .base import BaseValidator, ValidationResult
 
+# Control characters other than tab, LF and CR. Every UTF-8 byte of a
+# multi-byte character is >= 0x80, so this is searched on the raw bytes
+_CONTROL_CHAR_RE = re.compile(rb"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Bytes decoded at a time when checking that a mapped file is UTF-8
+_DECODE_CHUNK_SIZE = 1 << 20
+
+# Characters of HTML fed to the parser at a time while looking for a tag
+_HTML_CHUNK_SIZE = 1 << 16
+
+
+def _map_file(f: Any) -> Union[mmap.mmap, bytes]:
+    """Map an open binary file read-only instead of copying it into memory.
+
+    Args:
+        f: File opened in binary mode
+
+    Returns:
+        A read-only mmap of the file, or its bytes if it cannot be mapped
+        (empty files, pipes and other special files)
+    """
+    if os.fstat(f.fileno()).st_size:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            pass
+    return f.read()
+
+
+def _check_utf8(data: Union[mmap.mmap, bytes]) -> None:
+    """Check that data is UTF-8, decoding a chunk at a time.
+
+    Args:
+        data: Bytes or mapping to check
+
+    Raises:
+        UnicodeDecodeError: If data is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with memoryview(data) as view:
+        for start in range(0, len(view), _DECODE_CHUNK_SIZE):
+            with view[start : start + _DECODE_CHUNK_SIZE] as chunk:
+                decoder.decode(chunk)
+    decoder.decode(b"", final=True)
+
+
+def _open_text(
+    data: bytes, name: str, newline: Optional[str] = None
+) -> io.TextIOWrapper:
+    """Open bytes already read from a file as open(..., "r") would the file.
+
+    Args:
+        data: The file's bytes
+        name: The file's path, reported as the stream's name (parsers such
+            as PyYAML quote it in their errors)
+        newline: Newline mode, as for open()
+
+    Returns:
+        A UTF-8 text stream over data
+    """
+    buffer = io.BytesIO(data)
+    buffer.name = os.fspath(name)
+    return io.TextIOWrapper(buffer, encoding="utf-8", newline=newline)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_orjson() -> Optional[Any]:
+    """Lazy import of orjson for faster JSON validation.
+
+    orjson is optional and only imported once a JSON file needs it.
+
+    Returns:
+        The orjson module, or None if unavailable
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
 
 class TextFileValidator(BaseValidator):
     """Validator for plain text files."""
@@ -19,31 +105,80 @@ class TextFileValidator(BaseValidator):
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate a plain text file."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with open(file_path, "rb") as f:
+                data = _map_file(f)
+            try:
+                return cls._check_text(data)
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
 
-            # Check for non-printable characters (excluding standard whitespace)
-            for i, char in enumerate(content):
-                if ord(char) < 32 and char not in "\n\r\t":
-                    return ValidationResult(
-                        is_valid=False,
-                        message=f"File contains non-printable character at position {i}",
-                        details={"position": i, "character": repr(char)},
-                    )
+        except Exception as e:
+            return ValidationResult(
+                is_valid=False,
+                message=f"Error validating text file: {str(e)}",
+                details={"error": str(e)},
+            )
+
+    @classmethod
+    def _read_text(cls, file_path: str) -> Tuple[bytes, ValidationResult]:
+        """Read a file once and run the plain text checks on its bytes.
+
+        Format validators parse the returned bytes instead of reading the
+        file a second time.
+
+        Args:
+            file_path: Path to the file to validate
+
+        Returns:
+            Tuple of (the file's bytes, the plain text ValidationResult); the
+            bytes are empty if the file could not be read
+        """
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except Exception as e:
+            return b"", ValidationResult(
+                is_valid=False,
+                message=f"Error validating text file: {str(e)}",
+                details={"error": str(e)},
+            )
+        return data, cls._check_text(data)
 
-            return ValidationResult(is_valid=True, message="File is a valid text file")
+    @staticmethod
+    def _check_text(data: Union[mmap.mmap, bytes]) -> ValidationResult:
+        """Check that a file's contents are printable UTF-8 text.
 
+        Args:
+            data: The file's bytes or a mapping of them
+
+        Returns:
+            ValidationResult for the plain text checks
+        """
+        # Check that the file is UTF-8
+        try:
+            _check_utf8(data)
         except UnicodeDecodeError:
             return ValidationResult(
                 is_valid=False, message="File is not valid UTF-8 text"
             )
-        except Exception as e:
+
+        # Check for non-printable characters (excluding standard whitespace)
+        match = _CONTROL_CHAR_RE.search(data)
+        if match is not None:
+            # Report the character offset in the text as read with universal
+            # newlines, where "\r\n" counts as one character
+            prefix = data[: match.start()].decode("utf-8")
+            i = len(prefix) - prefix.count("\r\n")
+            char = chr(data[match.start()])
             return ValidationResult(
                 is_valid=False,
-                message=f"Error validating text file: {str(e)}",
-                details={"error": str(e)},
+                message=f"File contains non-printable character at position {i}",
+                details={"position": i, "character": repr(char)},
             )
 
+        return ValidationResult(is_valid=True, message="File is a valid text file")
+
 
 class JsonFileValidator(TextFileValidator):
     """Validator for JSON files."""
@@ -51,15 +186,26 @@ class JsonFileValidator(TextFileValidator):
     @classmethod
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate a JSON file."""
-        # First validate as text
-        text_result = super().validate(file_path)
+        # First validate as text, keeping the bytes read for the parser
+        data, text_result = cls._read_text(file_path)
         if not text_result.is_valid:
             return text_result
 
         # Then validate JSON syntax
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                json.load(f)
+            # orjson accepts a subset of what json does (no NaN, no integers
+            # over 64 bits), so only its rejections are re-checked with json
+            orjson = _get_orjson()
+            if orjson is not None:
+                try:
+                    orjson.loads(data)
+                    return ValidationResult(is_valid=True, message="File is valid JSON")
+                except orjson.JSONDecodeError:
+                    pass
+
+            # Decoded as open() would, so CR and CRLF files report the same
+            # line and column positions as json.load(f)
+            json.loads(_open_text(data, file_path).read())
             return ValidationResult(is_valid=True, message="File is valid JSON")
         except json.JSONDecodeError as e:
             return ValidationResult(
@@ -75,40 +221,56 @@ class CsvFileValidator(TextFileValidator):
     @classmethod
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate a CSV file."""
-        # First validate as text
-        text_result = super().validate(file_path)
+        # First validate as text, keeping the bytes read for the parser
+        data, text_result = cls._read_text(file_path)
         if not text_result.is_valid:
             return text_result
 
         # Then validate CSV format
         try:
-            with open(file_path, "r", newline="", encoding="utf-8") as f:
-                # Try to read the CSV to check for syntax errors
+            with _open_text(data, file_path, newline="") as f:
+                # Try to read the CSV to check for syntax errors, one row at a
+                # time instead of holding every row in memory
                 reader = csv.reader(f)
-                rows = list(reader)
+                header = next(reader, None)
 
-                if not rows:
+                if header is None:
                     return ValidationResult(
                         is_valid=True, message="File is a valid (empty) CSV"
                     )
 
-                # Check that all rows have the same number of columns as the header
-                num_columns = len(rows[0])
-                for i, row in enumerate(rows[1:], 2):  # Start from row 2 (1-based)
-                    if len(row) != num_columns:
-                        return ValidationResult(
-                            is_valid=False,
-                            message=f"Row {i} has {len(row)} columns, expected {num_columns}",
-                            details={
-                                "row": i,
-                                "found_columns": len(row),
-                                "expected_columns": num_columns,
-                            },
-                        )
+                # Check that all rows have the same number of columns as the header.
+                # The whole file is still read, so a syntax error further on is
+                # reported ahead of a row with the wrong number of columns
+                num_columns = len(header)
+                num_rows = 1
+                mismatch = None
+                for i, row in enumerate(reader, 2):  # Start from row 2 (1-based)
+                    num_rows += 1
+                    if mismatch is None and len(row) != num_columns:
+                        mismatch = (i, len(row))
+
+            if mismatch is not None:
+                i, found_columns = mismatch
+                return ValidationResult(
+                    is_valid=False,
+                    message=(
+                        f"Row {i} has {found_columns} columns, "
+                        f"expected {num_columns}"
+                    ),
+                    details={
+                        "row": i,
+                        "found_columns": found_columns,
+                        "expected_columns": num_columns,
+                    },
+                )
 
             return ValidationResult(
                 is_valid=True,
-                message=f"File is a valid CSV with {len(rows)} rows and {num_columns} columns",
+                message=(
+                    f"File is a valid CSV with {num_rows} rows "
+                    f"and {num_columns} columns"
+                ),
             )
 
         except csv.Error as e:
@@ -125,14 +287,14 @@ class XmlFileValidator(TextFileValidator):
     @classmethod
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate an XML file."""
-        # First validate as text
-        text_result = super().validate(file_path)
+        # First validate as text, keeping the bytes read for the parser
+        data, text_result = cls._read_text(file_path)
         if not text_result.is_valid:
             return text_result
 
         # Then validate XML syntax
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with _open_text(data, file_path) as f:
                 ET.parse(f)
             return ValidationResult(is_valid=True, message="File is valid XML")
         except ET.ParseError as e:
@@ -152,14 +314,14 @@ class YamlFileValidator(TextFileValidator):
     @classmethod
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate a YAML file."""
-        # First validate as text
-        text_result = super().validate(file_path)
+        # First validate as text, keeping the bytes read for the parser
+        data, text_result = cls._read_text(file_path)
         if not text_result.is_valid:
             return text_result
 
         # Then validate YAML syntax
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with _open_text(data, file_path) as f:
                 yaml.safe_load(f)
             return ValidationResult(is_valid=True, message="File is valid YAML")
         except yaml.YAMLError as e:
@@ -170,6 +332,21 @@ class YamlFileValidator(TextFileValidator):
             )
 
 
+class _StartTagFound(Exception):
+    """Raised by _StartTagFinder to stop parsing at the first start tag."""
+
+
+class _StartTagFinder(HTMLParser):
+    """HTML parser that stops at the first start (or self-closing) tag.
+
+    This is the html.parser event BeautifulSoup turns into its first
+    element, so finding one is equivalent to soup.find() not being None.
+    """
+
+    def handle_starttag(self, tag: str, attrs: Any) -> None:
+        raise _StartTagFound
+
+
 class HtmlFileValidator(TextFileValidator):
     """Validator for HTML files."""
 
@@ -177,28 +354,27 @@ class HtmlFileValidator(TextFileValidator):
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate an HTML file."""
         try:
-            from bs4 import BeautifulSoup
+            # The element check below has always required BeautifulSoup
+            import bs4  # noqa: F401
         except ImportError:
             # If BeautifulSoup is not available, fall back to basic text validation
             return super().validate(file_path)
 
-        # First validate as text
-        text_result = super().validate(file_path)
+        # First validate as text, keeping the bytes read for the parser
+        data, text_result = cls._read_text(file_path)
         if not text_result.is_valid:
             return text_result
 
-        # Then validate HTML syntax with BeautifulSoup
+        # Then check for at least one element, as BeautifulSoup's
+        # "html.parser" builder would find, without building the whole tree
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                soup = BeautifulSoup(f, "html.parser")
-
-                # Check for parse errors
-                if soup.find() is None:
-                    return ValidationResult(
-                        is_valid=False, message="No valid HTML content found"
-                    )
-
-                return ValidationResult(is_valid=True, message="File is valid HTML")
+            parser = _StartTagFinder()
+            with _open_text(data, file_path) as f:
+                for chunk in iter(lambda: f.read(_HTML_CHUNK_SIZE), ""):
+                    parser.feed(chunk)
+            parser.close()
+        except _StartTagFound:
+            return ValidationResult(is_valid=True, message="File is valid HTML")
 
         except Exception as e:
             return ValidationResult(
@@ -207,6 +383,8 @@ class HtmlFileValidator(TextFileValidator):
                 details={"error": str(e)},
             )
 
+        return ValidationResult(is_valid=False, message="No valid HTML content found")
+
 
 class CssFileValidator(TextFileValidator):
     """Validator for CSS files."""
@@ -237,13 +415,14 @@ class PythonFileValidator(BaseValidator):
     def validate(cls, file_path: str) -> ValidationResult:
         """Validate a Python file."""
         try:
-            # First validate as a text file
-            text_result = TextFileValidator.validate(file_path)
+            # First validate as a text file, keeping the bytes read for the
+            # parser
+            data, text_result = TextFileValidator._read_text(file_path)
             if not text_result.is_valid:
                 return text_result
 
             # Try to parse the Python file
-            with open(file_path, "r", encoding="utf-8") as f:
+            with _open_text(data, file_path) as f:
                 try:
                     # Use compile to check syntax without executing
                     compile(f.read(), file_path, "exec")
@@ -258,10 +437,14 @@ class PythonFileValidator(BaseValidator):
                         },
                     )
 
+            # Count lines as iterating over the file in binary mode would
+            lines = data.count(b"\n")
+            if data and not data.endswith(b"\n"):
+                lines += 1
             return ValidationResult(
                 is_valid=True,
                 message="Valid Python file",
-                details={"lines": sum(1 for _ in open(file_path, "rb"))},
+                details={"lines": lines},
             )
 
         except Exception as e:
@@ -270,37 +453,3 @@ class PythonFileValidator(BaseValidator):
                 message=f"Error validating Python file: {str(e)}",
                 details={"error": str(e)},
             )
-
-
-class ShellScriptValidator(BaseValidator):
-    """Validator for shell script files."""
-
-    @classmethod
-    def validate(cls, file_path: str) -> ValidationResult:
-        """Validate a shell script file."""
-        try:
-            # First validate as a text file
-            text_result = TextFileValidator.validate(file_path)
-            if not text_result.is_valid:
-                return text_result
-
-            # Check if file is executable (if on Unix-like system)
-            if hasattr(os, "access") and os.access(file_path, os.X_OK):
-                return ValidationResult(
-                    is_valid=True,
-                    message="Valid shell script (executable)",
-                    details={"executable": True},
-                )
-            else:
-                return ValidationResult(
-                    is_valid=True,
-                    message="Valid shell script (not executable)",
-                    details={"executable": False},
-                )
-
-        except Exception as e:
-            return ValidationResult(
-                is_valid=False,
-                message=f"Error validating shell script: {str(e)}",
-                details={"error": str(e)},
-            )
@@ -0,0 +1,191 @@
+"""Tests for the archive validators."""
+
+import bz2
+import gzip
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+from text2file.validators import archive_validator
+from text2file.validators.archive_validator import (
+    Bzip2Validator,
+    GzipValidator,
+    TarBz2Validator,
+    TarGzValidator,
+    TarValidator,
+    ZipValidator,
+)
+
+
+def _make_tar(path, mode):
+    """Write a small tar archive with a directory and two files."""
+    with tarfile.open(path, mode) as tar:
+        directory = tarfile.TarInfo("docs")
+        directory.type = tarfile.DIRTYPE
+        tar.addfile(directory)
+        for name, data in (("docs/a.txt", b"hello"), ("b.txt", b"world!")):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def test_zip_validator(temp_dir):
+    """Test validating a ZIP archive and listing its contents."""
+    path = temp_dir / "sample.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("a.txt", "hello")
+        zf.writestr("dir/b.txt", "world!")
+
+    result = ZipValidator.validate(str(path))
+
+    assert result.is_valid, result.message
+    assert result.details["file_count"] == 2
+    assert result.details["total_size"] == 11
+    assert [f["filename"] for f in result.details["files"]] == ["a.txt", "dir/b.txt"]
+    assert ZipValidator._get_archive_contents(str(path)) == result.details["files"]
+
+
+def test_zip_validator_rejects_garbage(temp_dir):
+    """Test that a non-ZIP file with a .zip extension is invalid."""
+    path = temp_dir / "broken.zip"
+    path.write_bytes(b"not a zip archive")
+
+    assert not ZipValidator.validate(str(path)).is_valid
+
+
+def test_tar_validators(temp_dir):
+    """Test plain and compressed tar archives in a single pass."""
+    for validator, name, mode in (
+        (TarValidator, "sample.tar", "w"),
+        (TarGzValidator, "sample.tar.gz", "w:gz"),
+        (TarBz2Validator, "sample.tar.bz2", "w:bz2"),
+    ):
+        path = temp_dir / name
+        _make_tar(path, mode)
+
+        result = validator.validate(str(path))
+
+        assert result.is_valid, result.message
+        assert result.details["file_count"] == 3
+        assert result.details["total_size"] == 11
+        files = result.details["files"]
+        assert [f["is_dir"] for f in files] == [True, False, False]
+        assert validator._get_archive_contents(str(path)) == files
+
+
+def test_tar_validator_rejects_truncated_archive(temp_dir):
+    """Test that a truncated compressed tar archive is invalid."""
+    path = temp_dir / "sample.tar.gz"
+    _make_tar(path, "w:gz")
+    path.write_bytes(path.read_bytes()[:40])
+
+    assert not TarGzValidator.validate(str(path)).is_valid
+
+
+def test_matches_format():
+    """Test file name matching for single and double extensions."""
+    assert ZipValidator._matches_format(Path("a.ZIP"), "zip")
+    assert not ZipValidator._matches_format(Path("a.zip.bak"), "zip")
+    assert TarGzValidator._matches_format(Path("release-1.2.tar.gz"), "tar.gz")
+    assert TarGzValidator._matches_format(Path("backup.TGZ"), "tar.gz")
+    assert not TarGzValidator._matches_format(Path("backup.gz"), "tar.gz")
+    assert TarBz2Validator._matches_format(Path("x.tbz2"), "tar.bz2")
+    assert TarValidator._matches_format(Path("x.tar.gz"), "tar.gz")
+
+
+def test_compressed_tar_validators_check_compression(temp_dir):
+    """Test that tarballs with the wrong or corrupt compression are invalid."""
+    plain = temp_dir / "plain.tar.gz"
+    _make_tar(plain, "w")
+    garbage = temp_dir / "garbage.tar.bz2"
+    garbage.write_bytes(b"BZh9" + b"\x00" * 64)
+
+    result = TarGzValidator.validate(str(plain))
+    assert not result.is_valid
+    assert result.message.startswith("Invalid TAR.GZ file")
+    assert not TarBz2Validator.validate(str(garbage)).is_valid
+
+
+def test_gzip_validator_reports_original_filename(temp_dir):
+    """Test reading the file name stored in the gzip header."""
+    path = temp_dir / "data.gz"
+    with open(path, "wb") as raw:
+        with gzip.GzipFile("report.csv", "wb", fileobj=raw) as gz:
+            gz.write(b"a,b\n1,2\n")
+    anonymous = temp_dir / "anon.gz"
+    anonymous.write_bytes(gzip.compress(b"payload"))
+    broken = temp_dir / "broken.gz"
+    broken.write_bytes(b"\x1f\x8b\x08\x08" + b"\x00" * 4)
+
+    result = GzipValidator.validate(str(path))
+    assert result.is_valid, result.message
+    assert result.details["original_filename"] == "report.csv"
+    assert GzipValidator.validate(str(anonymous)).details["original_filename"] is None
+    assert not GzipValidator.validate(str(broken)).is_valid
+
+
+def test_archive_validators_report_missing_and_non_regular_files(temp_dir):
+    """Test the not-found and not-a-file results from the single stat call."""
+    directory = temp_dir / "dir.zip"
+    directory.mkdir()
+    data = temp_dir / "data.bz2"
+    data.write_bytes(bz2.compress(b"payload"))
+
+    assert ZipValidator.validate(str(temp_dir / "missing.zip")).message.startswith(
+        "File not found"
+    )
+    assert ZipValidator.validate(str(directory)).message.startswith("Not a file")
+    result = Bzip2Validator.validate(str(data))
+    assert result.is_valid and result.details["size"] == data.stat().st_size
+
+
+def test_zip_validator_finds_corrupt_member(temp_dir, monkeypatch):
+    """Test CRC checking of members, serially and with the thread pool."""
+    path = temp_dir / "corrupt.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("good.txt", "fine")
+        zf.writestr("bad.txt", "original payload")
+        zf.writestr("later.txt", "also fine")
+    data = path.read_bytes()
+    path.write_bytes(data.replace(b"original payload", b"tampered payload"))
+
+    for parallel_min in (1 << 30, 0):
+        monkeypatch.setattr(archive_validator, "_ZIP_PARALLEL_MIN", parallel_min)
+        result = ZipValidator.validate(str(path))
+        assert not result.is_valid
+        assert result.details == {"corrupt_file": "bad.txt"}
+
+
+def test_header_only_validation(temp_dir, monkeypatch):
+    """Test that deep=False checks magic bytes without reading members."""
+    zip_path = temp_dir / "sample.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("a.txt", "hello")
+        zf.comment = b"x" * 100
+    tar_path = temp_dir / "sample.tar.gz"
+    _make_tar(tar_path, "w:gz")
+    plain_tar = temp_dir / "sample.tar"
+    _make_tar(plain_tar, "w")
+    fake_zip = temp_dir / "fake.zip"
+    fake_zip.write_bytes(b"PK\x03\x04" + b"\x00" * 40)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("deep validation should be skipped")
+
+    monkeypatch.setattr(ZipValidator, "_validate_archive", fail)
+    monkeypatch.setattr(TarValidator, "_validate_archive", fail)
+
+    result = ZipValidator.validate(str(zip_path), deep=False)
+    assert result.is_valid, result.message
+    assert result.details == {"size": zip_path.stat().st_size}
+    assert not ZipValidator.validate(str(fake_zip), deep=False).is_valid
+    assert TarGzValidator.validate(str(tar_path), deep=False).is_valid
+    assert TarValidator.validate(str(plain_tar), deep=False).is_valid
+    assert not TarBz2Validator.validate(str(tar_path), deep=False).is_valid
+
+    monkeypatch.setattr(GzipValidator, "DEEP", False)
+    broken = temp_dir / "broken.gz"
+    broken.write_bytes(b"\x1f\x8b\x08\x08" + b"\x00" * 4)
+    assert GzipValidator.validate(str(broken)).is_valid
+    assert not GzipValidator.validate(str(broken), deep=True).is_valid
@@ -0,0 +1,156 @@
+"""Tests for the file utility helpers."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from text2file.utils import file_utils
+from text2file.utils.file_utils import (
+    _format_size,
+    copy_file,
+    find_files,
+    get_file_extension,
+    get_file_hash,
+    is_binary_file,
+    safe_remove,
+)
+
+
+def test_get_file_hash_small_file(temp_dir):
+    """Test hashing a file below the memory-mapping threshold."""
+    path = temp_dir / "small.bin"
+    path.write_bytes(b"text2file")
+
+    assert get_file_hash(path) == hashlib.sha256(b"text2file").hexdigest()
+
+
+def test_get_file_hash_large_file(temp_dir):
+    """Test hashing a file large enough to be memory-mapped."""
+    data = os.urandom(3 << 20)
+    path = temp_dir / "large.bin"
+    path.write_bytes(data)
+
+    assert get_file_hash(path) == hashlib.sha256(data).hexdigest()
+    assert get_file_hash(path, algorithm="md5") == hashlib.md5(data).hexdigest()
+
+
+def test_is_binary_file_probes_content(temp_dir):
+    """Test binary detection on files without a known binary extension."""
+    text = temp_dir / "notes.txt"
+    text.write_text("plain text\n" * 500, encoding="utf-8")
+    nul = temp_dir / "blob.raw"
+    nul.write_bytes(b"abc\x00def")
+    latin = temp_dir / "latin.raw"
+    latin.write_bytes(b"caf\xe9")
+
+    assert is_binary_file(text) is False
+    assert is_binary_file(nul) is True
+    assert is_binary_file(latin) is True
+    assert is_binary_file(temp_dir / "image.png") is True
+    assert is_binary_file(temp_dir / "missing.raw") is False
+
+
+def test_format_size():
+    """Test human-readable size formatting across unit boundaries."""
+    assert _format_size(0) == "0.00 B"
+    assert _format_size(1023) == "1023.00 B"
+    assert _format_size(1024) == "1.00 KB"
+    assert _format_size(1536, decimals=1) == "1.5 KB"
+    assert _format_size(5 * 1024**3) == "5.00 GB"
+    assert _format_size(3 * 1024**5) == "3.00 PB"
+    assert _format_size(2048 * 1024**5) == "2048.00 PB"
+
+
+def test_get_file_extension():
+    """Test extension extraction for strings and paths."""
+    assert get_file_extension("report.PDF") == "pdf"
+    assert get_file_extension(Path("archive.tar.gz")) == "gz"
+    assert get_file_extension("dir.d/README") == ""
+    assert get_file_extension(".bashrc") == ""
+    assert get_file_extension("trailing.") == ""
+
+
+def test_safe_remove(temp_dir):
+    """Test removing files, symlinks, directories and missing paths."""
+    file_path = temp_dir / "file.txt"
+    file_path.write_text("data")
+    sub_dir = temp_dir / "sub"
+    (sub_dir / "nested").mkdir(parents=True)
+    (sub_dir / "nested" / "inner.txt").write_text("data")
+    link = temp_dir / "link"
+    link.symlink_to(sub_dir)
+
+    assert safe_remove(file_path) is True
+    assert not file_path.exists()
+    assert safe_remove(link) is True
+    assert not link.is_symlink() and sub_dir.is_dir()
+    assert safe_remove(sub_dir) is True
+    assert not sub_dir.exists()
+    assert safe_remove(temp_dir / "missing") is False
+
+
+def test_copy_file_without_metadata(temp_dir):
+    """Test copying contents only, skipping timestamp preservation."""
+    src = temp_dir / "src.txt"
+    src.write_text("payload")
+    os.utime(src, (1_000_000, 1_000_000))
+    dst = temp_dir / "dst.txt"
+
+    assert copy_file(src, dst, preserve_metadata=False) is True
+    assert dst.read_text() == "payload"
+    assert dst.stat().st_mtime != 1_000_000
+    assert copy_file(src, dst, preserve_metadata=False) is False
+
+    assert copy_file(src, dst, overwrite=True) is True
+    assert dst.stat().st_mtime == 1_000_000
+
+
+def test_get_file_info_check_binary(temp_dir, monkeypatch):
+    """Test that get_file_info only probes file content when asked to."""
+    path = temp_dir / "data.txt"
+    path.write_text("hello")
+    calls = []
+    monkeypatch.setattr(
+        file_utils, "is_binary_file", lambda p: calls.append(p) or False
+    )
+
+    info = file_utils.get_file_info(path, check_binary=False)
+    assert info["size"] == 5
+    assert info["is_file"] is True
+    assert "is_binary" not in info
+    assert calls == []
+
+    info = file_utils.get_file_info(path)
+    assert type(info) is dict
+    assert info["is_binary"] is False
+    assert len(calls) == 1
+    assert json.loads(json.dumps(info)) == info
+    info["note"] = "editable"
+
+    assert file_utils.get_file_info(temp_dir / "missing") == {
+        "exists": False,
+        "path": str(temp_dir / "missing"),
+    }
+
+
+def test_find_files_case_insensitive(temp_dir):
+    """Test suffix patterns, fnmatch patterns and non-recursive searches."""
+    (temp_dir / "sub").mkdir()
+    (temp_dir / "A.TXT").write_text("a")
+    (temp_dir / "b.md").write_text("b")
+    (temp_dir / "sub" / "C.Txt").write_text("c")
+    (temp_dir / "sub" / "data_1.CSV").write_text("d")
+    (temp_dir / "dir.txt").mkdir()
+
+    def names(paths):
+        return sorted(p.name for p in paths)
+
+    assert names(find_files(temp_dir, "*.txt")) == ["A.TXT", "C.Txt"]
+    assert names(find_files(temp_dir, "*.txt", recursive=False)) == ["A.TXT"]
+    assert names(find_files(temp_dir, "DATA_?.csv")) == ["data_1.CSV"]
+    assert names(find_files(temp_dir, "[ab].*", recursive=False)) == [
+        "A.TXT",
+        "b.md",
+    ]
+    assert names(find_files(temp_dir, "*.Txt", case_sensitive=True)) == ["C.Txt"]
@@ -0,0 +1,163 @@
+"""Tests for the image utility helpers."""
+
+import pytest
+from PIL import Image, ImageFont
+
+from text2file.utils import image_utils
+from text2file.utils.image_utils import (
+    apply_filter,
+    base64_to_image,
+    create_blank_image,
+    draw_text_on_image,
+    get_multiline_text_size,
+    get_text_size,
+    image_to_base64,
+    load_font,
+    resize_image,
+    save_image,
+)
+
+SAMPLE_TEXT = (
+    "The quick brown fox jumps over the lazy dog while the cat watches "
+    "from the window.\n\nA second paragraph follows the blank line."
+)
+
+
+def test_get_text_size_single_line():
+    """Test measuring a single line of text."""
+    font = load_font(font_size=16)
+    width, height = get_text_size("Hello", font)
+
+    assert width > 0 and height > 0
+    assert get_text_size("", font) == (0, 0)
+
+
+def test_wrapped_text_respects_max_width():
+    """Test that word wrapping keeps every line within max_width."""
+    font = load_font(font_size=16)
+    unwrapped_width, unwrapped_height = get_multiline_text_size(SAMPLE_TEXT, font)
+    width, height = get_multiline_text_size(SAMPLE_TEXT, font, max_width=200)
+
+    assert width <= 200 < unwrapped_width
+    assert height > unwrapped_height
+
+
+def test_draw_text_on_image_alignments():
+    """Test drawing wrapped text with every alignment and border enabled."""
+    for align in ("left", "center", "right"):
+        image = create_blank_image(400, 300)
+        result = draw_text_on_image(
+            image,
+            SAMPLE_TEXT,
+            position=(200, 150),
+            font_size=16,
+            align=align,
+            valign="middle",
+            max_width=300,
+            border=True,
+            shadow=True,
+        )
+
+        assert result.size == (400, 300)
+        assert len(result.getcolors(1 << 16)) > 1
+
+
+def test_draw_text_border_with_bitmap_font():
+    """Test that bitmap fonts, which ignore stroke_width, still get a border."""
+    font = getattr(ImageFont, "load_default_imagefont", ImageFont.load_default)()
+    image = create_blank_image(100, 40)
+    result = draw_text_on_image(
+        image,
+        "Border",
+        position=(10, 10),
+        font=font,
+        color="#000000",
+        border=True,
+        border_color="#FF0000",
+    )
+
+    colors = {color for _, color in result.getcolors(1 << 16)}
+    assert (255, 0, 0) in colors
+
+
+def test_apply_filter_sepia(monkeypatch):
+    """Test the sepia filter with and without NumPy."""
+    image = create_blank_image(8, 4, color=(255, 255, 255, 255))
+    image.putpixel((0, 0), (10, 20, 30, 255))
+
+    for has_numpy in (True, False):
+        monkeypatch.setattr(image_utils, "HAS_NUMPY", has_numpy)
+        result = apply_filter(image, "sepia")
+
+        assert result.mode == "RGB" and result.size == (8, 4)
+        assert result.getpixel((1, 1)) == (255, 255, 239)
+        assert result.getpixel((0, 0)) == (25, 22, 17)
+
+
+def test_base64_round_trip():
+    """Test encoding an image to base64 and decoding it back."""
+    image = create_blank_image(16, 8, color="#336699")
+    encoded = image_to_base64(image)
+
+    decoded = base64_to_image(f"data:image/png;base64,{encoded}")
+    assert decoded.size == (16, 8)
+    assert decoded.convert("RGB").getpixel((3, 3)) == (0x33, 0x66, 0x99)
+
+
+def test_save_image_jpeg_flattens_alpha(temp_dir):
+    """Test that transparent pixels are composited over white for JPEG."""
+    image = create_blank_image(8, 8, color="#00000000", mode="RGBA")
+    output = temp_dir / "flat.jpg"
+
+    assert save_image(image, output) is True
+    with Image.open(output) as saved:
+        assert saved.mode == "RGB"
+        assert all(channel > 250 for channel in saved.getpixel((4, 4)))
+
+
+def test_resize_image_letterbox_modes():
+    """Test that letterboxing only adds alpha for alpha sources or backgrounds."""
+    rgb = create_blank_image(200, 100, color="#FF0000")
+    result = resize_image(rgb, (100, 100), bg_color="#0000FF")
+
+    assert result.mode == "RGB" and result.size == (100, 100)
+    assert result.getpixel((50, 50)) == (255, 0, 0)
+    assert result.getpixel((50, 5)) == (0, 0, 255)
+
+    rgba = create_blank_image(100, 300, color="#00FF0080", mode="RGBA")
+    assert resize_image(rgba, (90, 90)).mode == "RGBA"
+    assert resize_image(rgb, (50, 25)).size == (50, 25)
+
+    # A transparent background also needs an alpha channel
+    result = resize_image(rgb, (100, 100), bg_color="#00000000")
+    assert result.mode == "RGBA"
+    assert result.getpixel((50, 5)) == (0, 0, 0, 0)
+    assert result.getpixel((50, 50)) == (255, 0, 0, 255)
+
+
+def test_apply_filter_dispatch():
+    """Test named filters, blur radii and unknown filter names."""
+    image = create_blank_image(16, 16, color="#808080")
+
+    for name in ("sharpen", "EMBOSS", "contour", "blur", "grayscale"):
+        assert apply_filter(image, name, radius=3).size == (16, 16)
+    assert apply_filter(image, "blur", radius=[2, 1]).size == (16, 16)
+
+    with pytest.raises(ValueError, match="posterize"):
+        apply_filter(image, "posterize")
+
+
+def test_load_font_is_cached():
+    """Test that loading the same font twice returns the cached object."""
+    assert load_font(font_size=18) is load_font(font_size=18)
+    assert load_font(font_size=18) is not load_font(font_size=20)
+    assert load_font("missing-font.ttf", 18) is load_font("other-missing.ttf", 9)
+
+
+def test_create_blank_image_modes():
+    """Test background colors across image modes, including invalid colors."""
+    assert create_blank_image(2, 2, "#102030").getpixel((0, 0)) == (16, 32, 48)
+    rgba = create_blank_image(2, 2, "#102030", mode="RGBA")
+    assert rgba.getpixel((0, 0)) == (16, 32, 48, 255)
+    assert create_blank_image(2, 2, "#808080", mode="L").getpixel((0, 0)) == 128
+    assert create_blank_image(2, 2, "not-a-color", mode="L").getpixel((0, 0)) == 255
@@ -0,0 +1,131 @@
+"""Tests for the image validators."""
+
+from PIL import Image
+
+from text2file.validators.image_validator import (
+    GifValidator,
+    JpegValidator,
+    PngValidator,
+    SvgValidator,
+    WebPValidator,
+    _detect_image_format,
+)
+
+
+def test_detect_image_format():
+    """Test magic-number detection of common image formats."""
+    assert _detect_image_format(b"\xff\xd8\xff\xe0\x00\x10JFIF") == "jpeg"
+    assert _detect_image_format(b"\x89PNG\r\n\x1a\n\x00\x00") == "png"
+    assert _detect_image_format(b"GIF89a\x01\x00") == "gif"
+    assert _detect_image_format(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "webp"
+    assert _detect_image_format(b"RIFF\x00\x00\x00\x00WAVEfmt ") is None
+    assert _detect_image_format(b"") is None
+
+
+def test_raster_validators(temp_dir):
+    """Test validating real images and rejecting mismatched content."""
+    image = Image.new("RGB", (12, 8), "red")
+    for validator, name, fmt in (
+        (JpegValidator, "a.jpeg", "JPEG"),
+        (PngValidator, "a.png", "PNG"),
+        (GifValidator, "a.gif", "GIF"),
+        (WebPValidator, "a.webp", "WEBP"),
+    ):
+        path = temp_dir / name
+        image.save(path, format=fmt)
+        result = validator.validate(str(path))
+        assert result.is_valid, result.message
+
+    fake = temp_dir / "fake.png"
+    image.save(fake, format="GIF")
+    result = PngValidator.validate(str(fake))
+    assert not result.is_valid
+    assert "detected as GIF" in result.message
+
+    truncated = temp_dir / "truncated.png"
+    truncated.write_bytes((temp_dir / "a.png").read_bytes()[:20])
+    assert not PngValidator.validate(str(truncated)).is_valid
+
+
+def test_svg_validator(temp_dir):
+    """Test SVG detection, including files that are not valid UTF-8."""
+    svg = temp_dir / "a.svg"
+    svg.write_bytes(b'<?xml version="1.0"?>\n<SVG xmlns="http://www.w3.org/2000/svg"/>')
+    latin = temp_dir / "latin.svg"
+    latin.write_bytes(b"<!-- caf\xe9 -->\n<svg/>")
+    other = temp_dir / "other.svg"
+    other.write_text("<html></html>")
+
+    assert SvgValidator.validate(str(svg)).is_valid
+    assert SvgValidator.validate(str(latin)).is_valid
+    assert not SvgValidator.validate(str(other)).is_valid
+
+
+def test_validators_report_missing_and_non_regular_files(temp_dir):
+    """Test the not-found and not-a-file results from the single stat call."""
+    directory = temp_dir / "dir.png"
+    directory.mkdir()
+
+    assert PngValidator.validate(str(temp_dir / "missing.png")).message.startswith(
+        "File not found"
+    )
+    assert PngValidator.validate(str(directory)).message.startswith("Not a file")
+    assert not SvgValidator.validate(str(temp_dir / "missing.svg")).is_valid
+
+
+def test_deep_verify_checks_image_data(temp_dir, monkeypatch):
+    """Test that corrupt pixel data is only caught with DEEP_VERIFY."""
+    path = temp_dir / "corrupt.png"
+    Image.new("RGB", (64, 64), "blue").save(path, format="PNG")
+    data = bytearray(path.read_bytes())
+    idat = data.index(b"IDAT")
+    data[idat + 8 : idat + 16] = b"\x00" * 8
+    path.write_bytes(bytes(data))
+
+    assert PngValidator.validate(str(path)).is_valid
+    monkeypatch.setattr(PngValidator, "DEEP_VERIFY", True)
+    assert not PngValidator.validate(str(path)).is_valid
+
+
+def test_svg_validator_matches_root_element_only(temp_dir):
+    """Test that the SVG check needs a real root element or doctype."""
+    doctype = temp_dir / "doctype.svg"
+    doctype.write_bytes(b'<!DOCTYPE  svg PUBLIC "-//W3C//DTD SVG 1.1//EN">')
+    lookalike = temp_dir / "lookalike.svg"
+    lookalike.write_bytes(b"<svgish/>")
+
+    assert SvgValidator.validate(str(doctype)).is_valid
+    assert not SvgValidator.validate(str(lookalike)).is_valid
+
+
+def test_format_extensions_are_precomputed(temp_dir):
+    """Test per-class extension state, including the .jpg alias for JPEG."""
+    assert JpegValidator._FORMAT_LOWER == "jpeg"
+    assert JpegValidator._EXTENSIONS == (".jpeg", ".jpg", ".jpe")
+    assert PngValidator._EXTENSIONS == (".png",)
+
+    path = temp_dir / "photo.JPG"
+    Image.new("RGB", (4, 4), "green").save(path, format="JPEG")
+    assert JpegValidator.validate(str(path)).is_valid
+    assert not PngValidator.validate(str(path)).is_valid
+
+
+def test_validators_accept_path_objects(temp_dir):
+    """Test that the os.path based checks also take pathlib paths."""
+    path = temp_dir / "a.png"
+    Image.new("RGB", (4, 4), "white").save(path, format="PNG")
+    svg = temp_dir / "a.svg"
+    svg.write_text("<svg/>")
+
+    assert PngValidator.validate(path).is_valid
+    assert SvgValidator.validate(svg).is_valid
+    assert "got .svg" in PngValidator.validate(svg).message
+
+
+def test_detect_image_format_shared_first_byte():
+    """Test formats whose magic numbers share a first byte with another."""
+    assert _detect_image_format(b"GIF87a\x01\x00") == "gif"
+    assert _detect_image_format(b"II*\x00\x08\x00") == "tiff"
+    assert _detect_image_format(b"MM\x00*\x00\x00") == "tiff"
+    assert _detect_image_format(b"BM\x00\x00") == "bmp"
+    assert _detect_image_format(b"MZ\x90\x00") is None
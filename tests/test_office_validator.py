@@ -0,0 +1,110 @@
+"""Tests for the office document validators."""
+
+import zipfile
+
+from text2file.validators import office_validator
+from text2file.validators.office_validator import (
+    DocValidator,
+    DocxValidator,
+    OdtValidator,
+    XlsxValidator,
+)
+
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+
+def _make_docx(path, names=("[Content_Types].xml", "word/document.xml")):
+    """Write a minimal ZIP container holding the given part names."""
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            zf.writestr(name, "<xml/>")
+
+
+def test_docx_validator(temp_dir):
+    """Test OOXML validation of required parts and the ZIP signature."""
+    good = temp_dir / "good.docx"
+    _make_docx(good)
+    missing = temp_dir / "missing.docx"
+    _make_docx(missing, names=("[Content_Types].xml",))
+    not_zip = temp_dir / "fake.docx"
+    not_zip.write_bytes(b"%PDF-1.4 PK\x05\x06")
+
+    assert DocxValidator.validate(good).is_valid
+    assert "word/document.xml" in DocxValidator.validate(missing).message
+    assert DocxValidator.validate(not_zip).message.startswith("Not a ZIP archive")
+    assert not DocxValidator.validate(temp_dir / "absent.docx").is_valid
+
+
+def test_odt_validator_case_insensitive_parts(temp_dir):
+    """Test that ODF part names are matched case-insensitively."""
+    path = temp_dir / "doc.odt"
+    _make_docx(path, names=("MIMETYPE", "Content.xml"))
+
+    assert OdtValidator.validate(str(path)).is_valid
+
+
+def test_legacy_office_signatures(temp_dir):
+    """Test OLE detection and OOXML content behind a legacy extension."""
+    ole = temp_dir / "old.doc"
+    ole.write_bytes(OLE_MAGIC + b"\x00" * 56)
+    renamed = temp_dir / "renamed.doc"
+    _make_docx(renamed)
+    empty = temp_dir / "empty.doc"
+    empty.write_bytes(b"")
+
+    assert DocValidator.validate(ole).is_valid
+    assert "wrong extension" in DocValidator.validate(renamed).message
+    assert DocValidator.validate(empty).message.startswith("File is empty")
+    assert not DocxValidator.validate(ole).is_valid
+
+
+def test_central_directory_names_match_zipfile(temp_dir):
+    """Test the tail-based name reader against zipfile, comment included."""
+    path = temp_dir / "names.zip"
+    names = ["[Content_Types].xml", "dir/", "dir/grüße.xml", "a.txt"]
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            zf.writestr(name, "x")
+        zf.comment = b"PK\x05\x06 in the comment, padded to look like a record"
+    central_directory = office_validator._read_central_directory(path)
+    found = office_validator._iter_central_directory_names(central_directory)
+
+    assert list(found) == names
+
+
+def test_find_missing_part_with_prefix_and_fallback(temp_dir, monkeypatch):
+    """Test prepended data and the zipfile fallback used for ZIP64."""
+    path = temp_dir / "book.xlsx"
+    _make_docx(path, names=("[Content_Types].xml", "xl/workbook.xml"))
+    path.write_bytes(b"PK\x03\x04" + b"\x00" * 60 + path.read_bytes())
+    required = ["[Content_Types].xml", "xl/workbook.xml", "xl/styles.xml"]
+
+    assert XlsxValidator.validate(path).is_valid
+    assert XlsxValidator._find_missing_part(path, required) == "xl/styles.xml"
+    monkeypatch.setattr(office_validator, "_read_central_directory", lambda p: None)
+    assert XlsxValidator._find_missing_part(path, required) == "xl/styles.xml"
+    assert XlsxValidator._find_missing_part(path, required[:2]) is None
+
+
+def test_extension_table_per_subclass(temp_dir):
+    """Test that each subclass only dispatches its own extensions."""
+    path = temp_dir / "book.xlsx"
+    _make_docx(path, names=("[Content_Types].xml", "xl/workbook.xml"))
+
+    assert set(DocxValidator._EXT_TABLE) == {".docx"}
+    assert list(DocxValidator.MIME_TYPES.values()) == [[".docx"]]
+    assert len(office_validator.OfficeValidator._EXT_TABLE) == 9
+    assert office_validator.OfficeValidator.validate(path).is_valid
+    assert DocxValidator.validate(path).message.startswith("Unsupported")
+
+
+def test_validate_many_uses_io_bound_workers(temp_dir):
+    """Test batch validation of office files with the I/O-bound pool size."""
+    good = temp_dir / "good.docx"
+    _make_docx(good)
+    bad = temp_dir / "bad.docx"
+    bad.write_bytes(b"nope")
+
+    assert DocxValidator.MAX_WORKERS == office_validator.IO_BOUND_WORKERS
+    results = DocxValidator.validate_many([good, bad, good])
+    assert [r.is_valid for r in results] == [True, False, True]
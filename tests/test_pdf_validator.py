@@ -0,0 +1,138 @@
+"""Tests for the PDF validator."""
+
+import pytest
+
+from text2file.validators import pdf_validator
+from text2file.validators.pdf_validator import PdfValidator
+
+
+def test_pdf_header_and_eof_marker(temp_dir, monkeypatch):
+    """Test the basic header and EOF checks, including tiny and empty files."""
+    monkeypatch.setattr(pdf_validator, "_get_pypdf2", lambda: None)
+    small = temp_dir / "small.pdf"
+    small.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    large = temp_dir / "large.pdf"
+    large.write_bytes(b"%PDF-1.7\n%%EOF\n" + b"0" * 4096 + b"\n%%EOF\n")
+    stale_eof = temp_dir / "stale.pdf"
+    stale_eof.write_bytes(b"%PDF-1.7\n%%EOF\n" + b"0" * 4096)
+    empty = temp_dir / "empty.pdf"
+    empty.write_bytes(b"")
+    # Marker windows that start past the first 4 KiB page, inside and out
+    huge = temp_dir / "huge.pdf"
+    huge.write_bytes(b"%PDF-1.7\n" + b"0" * 10000 + b"%%EOF" + b"0" * 1019)
+    huge_stale = temp_dir / "huge_stale.pdf"
+    huge_stale.write_bytes(b"%PDF-1.7\n" + b"0" * 10000 + b"%%EOF" + b"0" * 1020)
+
+    result = PdfValidator.validate(str(small))
+    assert result.is_valid, result.message
+    assert result.details == {"size": 15, "validated_with": "basic"}
+    assert PdfValidator.validate(str(large)).is_valid
+    assert "EOF marker" in PdfValidator.validate(str(stale_eof)).message
+    assert "missing PDF header" in PdfValidator.validate(str(empty)).message
+    assert PdfValidator.validate(str(huge)).is_valid
+    assert "EOF marker" in PdfValidator.validate(str(huge_stale)).message
+
+
+def test_pdf_validator_shallow_mode(temp_dir, monkeypatch):
+    """Test that deep=False only parses the document with PyPDF2."""
+    PyPDF2 = pytest.importorskip("PyPDF2")
+    writer = PyPDF2.PdfWriter()
+    writer.add_blank_page(200, 100)
+    path = temp_dir / "blank.pdf"
+    with open(path, "wb") as f:
+        writer.write(f)
+    broken = temp_dir / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.4\ngarbage\n%%EOF\n")
+
+    deep = PdfValidator.validate(str(path))
+    assert deep.details["page_count"] == 1
+    assert "200.0x100.0" in deep.message
+    shallow = PdfValidator.validate(str(path), deep=False)
+    assert shallow.details == {"size": path.stat().st_size, "validated_with": "pypdf2"}
+    assert not PdfValidator.validate(str(broken), deep=False).is_valid
+
+    monkeypatch.setattr(PdfValidator, "DEEP", False)
+    assert PdfValidator.validate(str(path), deep=None).details == shallow.details
+
+
+def test_extract_outline_order_and_levels():
+    """Test that nested outlines are flattened depth-first with levels."""
+
+    class Item:
+        def __init__(self, title, children=()):
+            self.title = title
+            self.children = list(children)
+
+    outline = [Item("a", [Item("a1")]), [Item("b1"), [Item("b2")]], None, Item("c")]
+
+    found = PdfValidator._extract_outline(outline)
+    assert [(item["title"], item["level"]) for item in found] == [
+        ("a", 0),
+        ("a1", 1),
+        ("b1", 1),
+        ("b2", 2),
+        ("c", 0),
+    ]
+
+
+def _write_pdf(path, objects, trailer_extra=b""):
+    """Write a PDF with a classic xref table for the given object bodies."""
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f\r\n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n\r\n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R%s >>\n" % (
+        len(objects) + 1,
+        trailer_extra,
+    )
+    out += b"startxref\n%d\n%%%%EOF\n" % xref
+    path.write_bytes(bytes(out))
+
+
+def test_page_count_and_encryption_from_trailer(temp_dir, monkeypatch):
+    """Test reading /Count and /Encrypt through the xref without PyPDF2."""
+    monkeypatch.setattr(pdf_validator, "_get_pypdf2", lambda: None)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>",
+        b"<< /Type /Page /Parent 2 0 R >>",
+        b"<< /Type /Page /Parent 2 0 R >>",
+    ]
+    plain = temp_dir / "plain.pdf"
+    _write_pdf(plain, objects)
+    locked = temp_dir / "locked.pdf"
+    _write_pdf(locked, objects, trailer_extra=b" /Encrypt 5 0 R")
+    no_xref = temp_dir / "no_xref.pdf"
+    no_xref.write_bytes(b"%PDF-1.4\n%%EOF\n")
+
+    assert PdfValidator.get_page_count(str(plain)) == (True, 2, "PDF has 2 pages")
+    assert PdfValidator.is_encrypted(str(plain))[:2] == (True, False)
+    assert PdfValidator.is_encrypted(str(locked))[:2] == (True, True)
+    assert PdfValidator.get_page_count(str(no_xref))[0] is False
+    assert PdfValidator.is_encrypted(str(no_xref))[0] is False
+
+
+def test_indirect_page_count_falls_back_to_pypdf2(temp_dir, monkeypatch):
+    """Test that an indirect /Count is not read from the trailer path."""
+
+    class FakeReader:
+        def __init__(self, f):
+            self.pages = [None] * 12
+
+    fake_pypdf2 = type("FakePyPDF2", (), {"PdfReader": FakeReader})
+    monkeypatch.setattr(pdf_validator, "_get_pypdf2", lambda: (fake_pypdf2, Exception))
+    path = temp_dir / "indirect.pdf"
+    _write_pdf(
+        path,
+        [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [] /Count 16 0 R >>",
+        ],
+    )
+
+    assert PdfValidator.get_page_count(str(path)) == (True, 12, "PDF has 12 pages")
@@ -0,0 +1,149 @@
+"""Tests for the shell script validator."""
+
+from text2file.validators.text import shell_validator
+from text2file.validators.text.shell_validator import ShellScriptValidator
+
+
+def test_shell_validator_without_shellcheck(temp_dir, monkeypatch):
+    """Test the pattern and shebang checks when shellcheck is missing."""
+    monkeypatch.setattr(shell_validator, "_shellcheck_path", lambda: None)
+    script = temp_dir / "run.sh"
+    script.write_text("#!/bin/bash\necho ${HOME} $USER\n")
+    late = temp_dir / "late.sh"
+    late.write_text("# comment\n" * 1000 + "echo $(date) $USER\n")
+    plain = temp_dir / "plain.sh"
+    plain.write_text("just words\n")
+    too_late = temp_dir / "too_late.sh"
+    too_late.write_text("# comment\n" * 7000 + "echo $(date) $USER\n")
+    binary = temp_dir / "blob.sh"
+    binary.write_bytes(b"echo ${HOME} $USER\n\x00\x01")
+
+    result = ShellScriptValidator.validate(script)
+    assert result.is_valid, result.message
+    assert result.message == "Valid shell script (not executable)"
+    assert result.details["shebang"] == "#!/bin/bash"
+    assert result.details["executable"] is False
+    assert "not installed" in result.details["info"]
+    assert "warning" not in result.details
+    assert "warning" not in ShellScriptValidator.validate(late).details
+
+    # Too few shell patterns is a warning, not a failure
+    for path in (too_late, plain):
+        result = ShellScriptValidator.validate(path)
+        assert result.is_valid
+        assert "found only 0" in result.details["warning"]
+
+    assert "non-printable" in ShellScriptValidator.validate(binary).message
+    assert not ShellScriptValidator.validate(temp_dir / "missing.sh").is_valid
+    empty = temp_dir / "empty.sh"
+    empty.write_bytes(b"")
+    assert ShellScriptValidator.validate(empty).is_valid
+    script.chmod(0o755)
+    result = ShellScriptValidator.validate(script)
+    assert result.message == "Valid shell script (executable)"
+    assert result.details["executable"] is True
+
+
+def test_generated_script_is_valid(temp_dir):
+    """Test that the sh generator's own output passes its validation."""
+    from text2file.generators.text.sh_generator import ShGenerator
+
+    path = ShGenerator.generate("echo hello world", temp_dir / "hello.sh")
+    result = ShGenerator.validate(path)
+
+    assert result.is_valid, result.message
+    assert result.details["executable"] is True
+
+
+def test_validate_many_runs_one_shellcheck(temp_dir, monkeypatch):
+    """Test that a batch shares one shellcheck run and splits its output."""
+    good = temp_dir / "good.sh"
+    good.write_text("echo ${HOME} $USER\n")
+    bad = temp_dir / "bad.sh"
+    bad.write_text("echo ${HOME} $USER\n")
+    plain = temp_dir / "plain.sh"
+    plain.write_text("just words\n")
+    calls = []
+    monkeypatch.setattr(shell_validator, "_shellcheck_path", lambda: "shellcheck")
+    monkeypatch.setattr(
+        shell_validator.subprocess, "Popen", _fake_popen(calls, f"{bad}:1:6: ")
+    )
+    results = ShellScriptValidator.validate_many([good, bad, plain])
+
+    assert [r.is_valid for r in results] == [True, True, True]
+    assert "shellcheck_output" not in results[0].details
+    assert "SC2086" in results[1].details["shellcheck_output"]
+    assert calls == [["shellcheck", "-f", "gcc", "--", str(good), str(bad), str(plain)]]
+
+    # Smaller batches each get their own shellcheck run, in any order
+    monkeypatch.setattr(shell_validator, "_SHELLCHECK_BATCH_SIZE", 1)
+    results = ShellScriptValidator.validate_many([good, bad, plain], max_workers=2)
+    assert "SC2086" in results[1].details["shellcheck_output"]
+    assert sorted(args[-1] for args in calls[1:]) == sorted(
+        [str(good), str(bad), str(plain)]
+    )
+    del calls[1:]
+
+    # Scripts over the size limit pass on the Python-side checks alone
+    monkeypatch.setattr(ShellScriptValidator, "MAX_SHELLCHECK_SIZE", 8)
+    result = ShellScriptValidator.validate_many([bad])[0]
+    assert result.is_valid
+    assert "too large" in result.details["info"]
+    assert len(calls) == 1
+
+
+def test_validate_overlaps_and_reaps_shellcheck(temp_dir, monkeypatch):
+    """Test that validate() starts shellcheck early and kills it on failure."""
+    bad = temp_dir / "bad.sh"
+    bad.write_text("echo ${HOME} $USER\n")
+    binary = temp_dir / "blob.sh"
+    binary.write_bytes(b"echo ${HOME}\x00\n")
+    calls = []
+    monkeypatch.setattr(shell_validator, "_shellcheck_path", lambda: "shellcheck")
+    monkeypatch.setattr(
+        shell_validator.subprocess, "Popen", _fake_popen(calls, f"{bad}:1:6: ")
+    )
+
+    assert "SC2086" in ShellScriptValidator.validate(bad).details["shellcheck_output"]
+    assert not ShellScriptValidator.validate(binary).is_valid
+    assert [args[-1] for args in calls] == [str(bad), str(binary)]
+    assert _FakePopen.killed == [str(binary)]
+
+
+class _FakePopen:
+    """Stand-in for subprocess.Popen that reports one shellcheck warning."""
+
+    killed = []
+
+    def __init__(self, args, prefix):
+        self.args = args
+        self.prefix = prefix
+        self.returncode = None
+
+    def communicate(self):
+        self.returncode = 1
+        return f"{self.prefix}warning: Quote this [SC2086]\n", ""
+
+    def kill(self):
+        _FakePopen.killed.append(self.args[-1])
+
+
+def _fake_popen(calls, prefix):
+    """Return a Popen replacement recording its argument lists in calls."""
+    _FakePopen.killed = []
+
+    def popen(args, **kwargs):
+        calls.append(args)
+        return _FakePopen(args, prefix)
+
+    return popen
+
+
+def test_shell_extensions_resolve_to_canonical_validator():
+    """Test that the public export and the lookup table share one class."""
+    import text2file.validators as validators
+    from text2file.validators.base import get_validator
+
+    assert validators.ShellScriptValidator is ShellScriptValidator
+    for name in ("run.sh", "run.bash", "run.zsh"):
+        assert get_validator(name) is ShellScriptValidator
@@ -0,0 +1,92 @@
+"""Tests for the text utility helpers."""
+
+from text2file.utils.text_utils import (
+    count_characters,
+    count_paragraphs,
+    count_sentences,
+    count_words,
+    extract_emails,
+    extract_hashtags,
+    extract_mentions,
+    extract_urls,
+    generate_lorem_ipsum,
+    generate_random_string,
+    remove_extra_whitespace,
+    remove_html_tags,
+    slugify,
+    truncate_text,
+)
+
+
+def test_counts():
+    """Test word, character, sentence and paragraph counts."""
+    text = "  First sentence. Second one!\n\n  Third?  \n\n\n"
+
+    assert count_words(text) == 5
+    assert count_words(" \n\t") == 0
+    assert count_characters("a b\tc", include_whitespace=False) == 3
+    assert count_sentences(text) == 3
+    assert count_sentences("") == 0
+    assert count_paragraphs(text) == 2
+    assert count_paragraphs("one\n \ntwo\n\n\nthree") == 3
+
+
+def test_cleanup_and_extraction():
+    """Test whitespace/HTML cleanup and pattern extraction."""
+    text = "Mail <b>bob@example.com</b> or see https://example.com/x #news @alice"
+
+    assert remove_extra_whitespace("  a \n\t b  ") == "a b"
+    assert remove_html_tags("<p>Hi <i>there</i></p>") == "Hi there"
+    assert extract_emails(text) == ["bob@example.com"]
+    assert extract_urls(text) == ["https://example.com/x"]
+    assert extract_hashtags(text) == ["news"]
+    assert extract_mentions(text) == ["example", "alice"]
+
+
+def test_slugify():
+    """Test slug generation with the default and custom options."""
+    assert slugify("Hello, World!") == "hello-world"
+    assert slugify("  Crème   brûlée_recipe  ") == "creme-brulee-recipe"
+    assert slugify("Hello World", separator="_", lowercase=False) == "Hello_World"
+    assert slugify("Grüße aus Köln", allow_unicode=True) == "grüße-aus-köln"
+    assert slugify("--a -- b--") == "a-b"
+
+
+def test_generate_random_string():
+    """Test random string length and alphabet, with and without secrets."""
+    for secure in (False, True):
+        value = generate_random_string(32, chars="abc", secure=secure)
+        assert len(value) == 32
+        assert set(value) <= set("abc")
+
+    assert generate_random_string(0) == ""
+
+
+def test_generate_lorem_ipsum():
+    """Test paragraph and sentence structure of generated lorem ipsum."""
+    text = generate_lorem_ipsum(
+        paragraphs=4, sentences_per_paragraph=5, words_per_sentence=(3, 6)
+    )
+    paragraphs = text.split("\n\n")
+
+    assert len(paragraphs) == 4
+    assert paragraphs[0].startswith("Lorem ipsum dolor sit amet")
+    for paragraph in paragraphs[1:]:
+        sentences = paragraph[:-1].split(". ")
+        assert len(sentences) == 5
+        for sentence in sentences:
+            assert 3 <= len(sentence.split()) <= 6
+            assert sentence[0].isupper()
+
+    assert generate_lorem_ipsum(paragraphs=0) == ""
+    assert generate_lorem_ipsum(1, 2, (0, 0), start_with_lorem=False) == ". ."
+
+
+def test_truncate_text():
+    """Test truncation by characters and at word boundaries."""
+    text = "The quick brown fox"
+
+    assert truncate_text(text, 100) == text
+    assert truncate_text(text, 10) == "The quick ..."
+    assert truncate_text(text, 12, words=True) == "The quick..."
+    assert truncate_text(" leading", 5, ellipsis="", words=True) == " lead"
@@ -0,0 +1,178 @@
+"""Tests for the text-based file validators."""
+
+import os
+
+import pytest
+
+from text2file.validators import text_validator
+from text2file.validators.text_validator import (
+    CssFileValidator,
+    CsvFileValidator,
+    HtmlFileValidator,
+    JavaScriptFileValidator,
+    JsonFileValidator,
+    PythonFileValidator,
+    TextFileValidator,
+    XmlFileValidator,
+    YamlFileValidator,
+)
+
+
+def test_text_file_validator_control_characters(temp_dir):
+    """Test control character detection and its character position."""
+    good = temp_dir / "good.txt"
+    good.write_bytes("tab\there\r\nünïcode\n".encode("utf-8"))
+    bad = temp_dir / "bad.txt"
+    bad.write_bytes("a\r\nü\x07b".encode("utf-8"))
+    latin1 = temp_dir / "latin1.txt"
+    latin1.write_bytes("caf\xe9".encode("latin-1"))
+
+    assert TextFileValidator.validate(str(good)).is_valid
+    result = TextFileValidator.validate(str(bad))
+    assert not result.is_valid
+    assert result.details == {"position": 3, "character": repr("\x07")}
+    assert TextFileValidator.validate(str(latin1)).message == (
+        "File is not valid UTF-8 text"
+    )
+
+
+def test_json_file_validator_with_and_without_orjson(temp_dir, monkeypatch):
+    """Test that results match json's whether or not orjson is used."""
+    good = temp_dir / "good.json"
+    good.write_text('{"a": [1, 2.5, "ü"]}')
+    # Valid for json, rejected by orjson
+    big = temp_dir / "big.json"
+    big.write_text('{"n": 123456789012345678901234567890, "x": NaN}')
+    bad = temp_dir / "bad.json"
+    bad.write_text('{"a": 1,\n "b": }')
+
+    for get_orjson in (text_validator._get_orjson, lambda: None):
+        monkeypatch.setattr(text_validator, "_get_orjson", get_orjson)
+        assert JsonFileValidator.validate(str(good)).is_valid
+        assert JsonFileValidator.validate(str(big)).is_valid
+        result = JsonFileValidator.validate(str(bad))
+        assert not result.is_valid
+        assert (result.details["line"], result.details["column"]) == (2, 7)
+
+    cr = temp_dir / "cr.json"
+    cr.write_bytes(b'{"a": 1,\r "b": }')
+    crlf = temp_dir / "crlf.json"
+    crlf.write_bytes(b'{"a": 1,\r\n "b": }')
+    for path in (cr, crlf):
+        details = JsonFileValidator.validate(str(path)).details
+        assert (details["line"], details["column"]) == (2, 7)
+
+
+def test_format_validators_read_the_file_once(temp_dir, monkeypatch):
+    """Test that the text checks and the parser share one read of the file."""
+    csv_path = temp_dir / "data.csv"
+    csv_path.write_bytes(b"a,b\r\n1,2\r\n")
+    yaml_path = temp_dir / "bad.yaml"
+    yaml_path.write_text("a: [1\n")
+    opened = []
+    real_open = open
+
+    def counting_open(file, *args, **kwargs):
+        opened.append(file)
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    assert CsvFileValidator.validate(str(csv_path)).message == (
+        "File is a valid CSV with 2 rows and 2 columns"
+    )
+    result = YamlFileValidator.validate(str(yaml_path))
+    assert not result.is_valid
+    # The parser still sees the file's name, as when it opened the file itself
+    assert str(yaml_path) in result.details["error"]
+    assert opened == [str(csv_path), str(yaml_path)]
+
+    # Every other text validator chain also opens the file exactly once
+    for validator, name, content in (
+        (JsonFileValidator, "data.json", '{"a": 1}'),
+        (XmlFileValidator, "data.xml", "<a/>"),
+        (PythonFileValidator, "script.py", "x = 1\n"),
+        (CssFileValidator, "style.css", "a { color: red; }"),
+        (JavaScriptFileValidator, "app.js", "let x = 1;"),
+    ):
+        path = temp_dir / name
+        path.write_text(content)
+        del opened[:]
+        assert validator.validate(str(path)).is_valid
+        assert opened == [str(path)]
+
+
+def test_csv_file_validator_rows_and_columns(temp_dir):
+    """Test row counting and the first row with the wrong column count."""
+    good = temp_dir / "good.csv"
+    good.write_text('a,b\n1,"x\ny"\n3,4\n')
+    ragged = temp_dir / "ragged.csv"
+    ragged.write_text("a,b\n1,2\n3\n4,5,6\n")
+    empty = temp_dir / "empty.csv"
+    empty.write_text("")
+
+    assert CsvFileValidator.validate(str(good)).message == (
+        "File is a valid CSV with 3 rows and 2 columns"
+    )
+    result = CsvFileValidator.validate(str(ragged))
+    assert result.details == {"row": 3, "found_columns": 1, "expected_columns": 2}
+    assert CsvFileValidator.validate(str(empty)).message.endswith("(empty) CSV")
+
+
+def test_xml_file_validator(temp_dir):
+    """Test well-formedness errors and their (line, column) positions."""
+    good = temp_dir / "good.xml"
+    good.write_text("<?xml version='1.0'?>\n<a x='1'>ü &amp; <b/></a>\n")
+    bad = temp_dir / "bad.xml"
+    bad.write_text("<a>\r\n<b>\r\n</a>")
+
+    assert XmlFileValidator.validate(str(good)).is_valid
+    result = XmlFileValidator.validate(str(bad))
+    assert result.message == "Invalid XML: mismatched tag: line 3, column 2"
+    assert result.details["position"] == (3, 2)
+
+    # Character columns and messages as reported by ElementTree
+    for content, message in (
+        ("#é:a", "not well-formed (invalid token): line 1, column 2"),
+        ("#:", "not well-formed (invalid token): line 1, column 1"),
+    ):
+        bad.write_text(content)
+        assert XmlFileValidator.validate(str(bad)).message == f"Invalid XML: {message}"
+
+
+def test_yaml_file_validator_rejects_trailing_tabs(temp_dir):
+    """Test that tabs SafeLoader rejects (libyaml accepts them) stay invalid."""
+    good = temp_dir / "good.yaml"
+    good.write_text("a:\n  - 1\n  - {b: c}\n")
+
+    assert YamlFileValidator.validate(str(good)).is_valid
+    for name, text in (("a", "key: value\t\n"), ("b", "x: 1\t# c\n"), ("c", "- a\t\n")):
+        path = temp_dir / f"{name}.yaml"
+        path.write_text(text)
+        result = YamlFileValidator.validate(str(path))
+        assert not result.is_valid
+        assert "cannot start any token" in result.message
+
+
+def test_html_file_validator_needs_an_element(temp_dir):
+    """Test that HTML is valid once a start tag is found, as with BeautifulSoup."""
+    pytest.importorskip("bs4")
+    page = temp_dir / "page.html"
+    page.write_text("<!DOCTYPE html>\n" + "x" * 70000 + "<br/>")
+    comment = temp_dir / "comment.html"
+    comment.write_text("<!-- <p>not a tag</p> --> a < b")
+
+    assert HtmlFileValidator.validate(str(page)).is_valid
+    result = HtmlFileValidator.validate(str(comment))
+    assert result.message == "No valid HTML content found"
+
+
+def test_text_validators_see_same_size_rewrites(temp_dir):
+    """Test that validate() is not memoized across edits of the same size."""
+    path = temp_dir / "data.json"
+    path.write_text('{"a": 1}')
+    st = path.stat()
+
+    assert JsonFileValidator.validate(str(path)).is_valid
+    path.write_text('{"a": }')
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert not JsonFileValidator.validate(str(path)).is_valid
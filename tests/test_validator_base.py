@@ -0,0 +1,105 @@
+"""Tests for the shared validator machinery."""
+
+import sys
+import zipfile
+
+from text2file.validators import base
+from text2file.validators.archive_validator import (
+    GzipValidator,
+    TarBz2Validator,
+    TarGzValidator,
+    ZipValidator,
+)
+from text2file.validators.base import BaseValidator, ValidationResult, get_validator
+from text2file.validators.text_validator import TextFileValidator
+
+
+def test_validate_many_dispatches_per_file(temp_dir):
+    """Test batch validation keeps order and picks a validator per file."""
+    archive = temp_dir / "a.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", "hello")
+    broken = temp_dir / "b.zip"
+    broken.write_bytes(b"nope")
+    unknown = temp_dir / "c.unknown"
+    unknown.write_text("?")
+
+    paths = [str(archive), str(broken), str(unknown)]
+    results = BaseValidator.validate_many(paths, max_workers=2)
+
+    assert [r.is_valid for r in results] == [True, False, False]
+    assert results[2].message.startswith("No validator for file")
+    assert [r.is_valid for r in ZipValidator.validate_many(paths[:2])] == [
+        True,
+        False,
+    ]
+
+
+def test_get_validator_extensions():
+    """Test extension lookup, including double and upper-case extensions."""
+    assert get_validator("notes.TXT") is TextFileValidator
+    assert get_validator("dist/pkg-1.0.tar.gz") is TarGzValidator
+    assert get_validator("BACKUP.TAR.BZ2") is TarBz2Validator
+    assert get_validator("data.json.gz") is GzipValidator
+    assert get_validator("dir.d/README") is BaseValidator
+    assert get_validator(".bashrc") is BaseValidator
+
+
+def test_get_validator_does_not_depend_on_import_order(monkeypatch):
+    """Test that Markdown and shell files resolve without prior imports."""
+    from text2file.validators.text.markdown_validator import MarkdownValidator
+    from text2file.validators.text.shell_validator import ShellScriptValidator
+
+    monkeypatch.setattr(base, "_registered_validators", {})
+
+    assert get_validator("README.md") is MarkdownValidator
+    assert get_validator("notes.markdown") is MarkdownValidator
+    assert get_validator("build.sh") is ShellScriptValidator
+
+
+def test_validation_result():
+    """Test ValidationResult truthiness, defaults and field updates."""
+    result = ValidationResult(is_valid=True, message="ok")
+
+    assert result and result.details is None
+    assert not ValidationResult(False, "bad")
+    result.details = {"size": 1}
+    assert result == ValidationResult(True, "ok", {"size": 1})
+    if sys.version_info >= (3, 10):
+        assert not hasattr(result, "__dict__")
+
+
+def test_validate_cached_reuses_result_until_file_changes(temp_dir, monkeypatch):
+    """Test that cached validation is keyed by the file's stat state."""
+    path = temp_dir / "cached.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("a.txt", "hello")
+    calls = []
+    original = ZipValidator.validate.__func__
+    monkeypatch.setattr(
+        ZipValidator,
+        "validate",
+        classmethod(lambda cls, p: calls.append(p) or original(cls, p)),
+    )
+
+    first = ZipValidator.validate_cached(str(path))
+    assert ZipValidator.validate_cached(str(path)) is first
+    assert first.is_valid and len(calls) == 1
+
+    path.write_bytes(b"no longer a zip")
+    assert not ZipValidator.validate_cached(str(path)).is_valid
+    assert len(calls) == 2
+    assert not ZipValidator.validate_cached(str(temp_dir / "missing.zip")).is_valid
+
+
+def test_register_validators_overrides_table(monkeypatch):
+    """Test batch registration by extension and its precedence in lookups."""
+    monkeypatch.setattr(base, "_registered_validators", {})
+
+    BaseValidator.register_validators((".MD", "mkd"), ZipValidator)
+    BaseValidator.register_validator("txt", GzipValidator)
+
+    assert get_validator("README.md") is ZipValidator
+    assert get_validator("notes.mkd") is ZipValidator
+    assert get_validator("notes.txt") is GzipValidator
+    assert get_validator("dist/pkg-1.0.tar.gz") is TarGzValidator